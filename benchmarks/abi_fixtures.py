@@ -0,0 +1,73 @@
+"""
+Synthetic contract metadata used by the benchmarks.
+"""
+ADDRESS = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+
+CODE = '0x6060604052'
+
+
+def make_function(name, input_types, output_types, constant=False):
+    return {
+        'type': 'function',
+        'name': name,
+        'constant': constant,
+        'inputs': [
+            {'type': _type, 'name': 'arg{0}'.format(idx)}
+            for idx, _type in enumerate(input_types)
+        ],
+        'outputs': [
+            {'type': _type, 'name': 'out{0}'.format(idx)}
+            for idx, _type in enumerate(output_types)
+        ],
+    }
+
+
+def make_event(name, inputs):
+    return {
+        'type': 'event',
+        'name': name,
+        'anonymous': False,
+        'inputs': [
+            {'type': _type, 'name': 'arg{0}'.format(idx), 'indexed': indexed}
+            for idx, (_type, indexed) in enumerate(inputs)
+        ],
+    }
+
+
+ERC20_ABI = [
+    make_function('totalSupply', [], ['uint256'], constant=True),
+    make_function('balanceOf', ['address'], ['uint256'], constant=True),
+    make_function('allowance', ['address', 'address'], ['uint256'], constant=True),
+    make_function('transfer', ['address', 'uint256'], ['bool']),
+    make_function('approve', ['address', 'uint256'], ['bool']),
+    make_function('transferFrom', ['address', 'address', 'uint256'], ['bool']),
+    make_event('Transfer', [('address', True), ('address', True), ('uint256', False)]),
+    make_event('Approval', [('address', True), ('address', True), ('uint256', False)]),
+]
+
+
+def make_large_abi(num_functions, num_events=0):
+    abi = [
+        make_function(
+            'function{0}'.format(idx),
+            ['address', 'uint256', 'bytes32'][:idx % 4],
+            ['uint256'],
+            constant=bool(idx % 2),
+        )
+        for idx in range(num_functions)
+    ]
+    abi.extend(
+        make_event('Event{0}'.format(idx), [('address', True), ('uint256', False)])
+        for idx in range(num_events)
+    )
+    return abi
+
+
+def make_contract_meta(abi):
+    return {
+        'code': CODE,
+        'info': {
+            'abiDefinition': abi,
+            'source': '',
+        },
+    }
@@ -0,0 +1,84 @@
+"""
+Measure the memory held by many contract classes loaded from JSON, as when
+loading the ABIs of verified contracts which share ERC20 and ERC721
+functions and events.
+
+    python benchmarks/abi_memory.py [num_contracts]
+
+Each mode is measured in a fresh interpreter: `full` keeps the source, raw
+ABI and docstring of each contract class and `compact` drops them.  Run it
+on two commits to compare the memory used before and after a change.
+"""
+import json
+import resource
+import subprocess
+import sys
+
+from eth_contract import Contract
+
+from abi_fixtures import (
+    ERC20_ABI,
+    make_event,
+    make_function,
+)
+
+
+ERC721_ABI = [
+    make_function('ownerOf', ['uint256'], ['address'], constant=True),
+    make_function('safeTransferFrom', ['address', 'address', 'uint256'], []),
+    make_function('setApprovalForAll', ['address', 'bool'], []),
+    make_function('getApproved', ['uint256'], ['address'], constant=True),
+    make_function('isApprovedForAll', ['address', 'address'], ['bool'], constant=True),
+    make_event('ApprovalForAll', [('address', True), ('address', True), ('bool', False)]),
+]
+
+SOURCE_SIZE = 8000
+
+
+def make_contract_json(idx):
+    abi = ERC20_ABI + (ERC721_ABI if idx % 2 else []) + [
+        make_function('custom{0}'.format(idx), ['uint256', 'address'], ['uint256']),
+        make_function('setOwner', ['address'], []),
+    ]
+    return json.dumps({
+        'code': '0x6060604052' + '{0:08x}'.format(idx),
+        'info': {
+            'abiDefinition': abi,
+            'source': 'contract Token{0} {{ }}'.format(idx).ljust(SOURCE_SIZE),
+        },
+    })
+
+
+def max_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(mode, num_contracts):
+    contract_jsons = [make_contract_json(idx) for idx in range(num_contracts)]
+    kwargs = {'compact': True} if mode == 'compact' else {}
+
+    rss_before = max_rss_kb()
+    classes = [
+        Contract(json.loads(contract_json), 'Token{0}'.format(idx), **kwargs)
+        for idx, contract_json in enumerate(contract_jsons)
+    ]
+    rss_after = max_rss_kb()
+    print("{0:<8} {1:,} classes: RSS grew {2:,} KB ({3:,.0f} bytes/class)".format(
+        mode,
+        len(classes),
+        rss_after - rss_before,
+        (rss_after - rss_before) * 1024.0 / len(classes),
+    ))
+
+
+def main(num_contracts=2000):
+    for mode in ('full', 'compact'):
+        sys.stdout.flush()
+        subprocess.call([sys.executable, __file__, '--mode', mode, str(num_contracts)])
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--mode']:
+        measure(sys.argv[2], int(sys.argv[3]))
+    else:
+        main(*(int(arg) for arg in sys.argv[1:]))
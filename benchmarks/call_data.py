@@ -0,0 +1,54 @@
+"""
+Measure `Function.get_call_data` throughput for common ERC20 signatures,
+comparing the static encoder fast path with the generic encoder.
+
+    python benchmarks/call_data.py [number]
+"""
+import sys
+import timeit
+
+from rlp.utils import encode_hex
+from eth_abi import abi
+
+from eth_contract import (
+    Contract,
+    utils,
+)
+
+from abi_fixtures import (
+    ADDRESS,
+    ERC20_ABI,
+    make_contract_meta,
+)
+
+
+CALLS = (
+    ('balanceOf', (ADDRESS,)),
+    ('allowance', (ADDRESS, ADDRESS)),
+    ('transfer', (ADDRESS, 10 ** 18)),
+    ('approve', (ADDRESS, 2 ** 256 - 1)),
+    ('transferFrom', (ADDRESS, ADDRESS, 12345)),
+)
+
+
+def generic_call_data(function, args):
+    scrubbed_args = tuple(utils.clean_args(*zip(function.input_types, args)))
+    return encode_hex(
+        function.encoded_abi_signature + abi.encode_abi(function.input_types, scrubbed_args)
+    )
+
+
+def main(number=100000):
+    Token = Contract(make_contract_meta(ERC20_ABI), 'Token')
+
+    for name, args in CALLS:
+        function = getattr(Token, name)
+        fast = timeit.timeit(lambda: function.get_call_data(args), number=number)
+        generic = timeit.timeit(lambda: generic_call_data(function, args), number=number)
+        print("{0:<14} fast: {1:>10,.0f}/sec  generic: {2:>10,.0f}/sec  ({3:.1f}x)".format(
+            name, number / fast, number / generic, generic / fast,
+        ))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,63 @@
+"""
+Measure building call data for many calls to one function, comparing a loop
+over `get_call_data` with `get_call_data_many`, in this process and in a
+process pool.
+
+    python benchmarks/call_data_many.py [num_calls] [processes]
+"""
+import multiprocessing
+import sys
+import time
+
+from eth_contract import Contract
+
+from abi_fixtures import (
+    ADDRESS,
+    ERC20_ABI,
+    make_contract_meta,
+)
+
+
+def make_holders(num_calls):
+    return [('0x' + '{0:040x}'.format(idx),) for idx in range(num_calls)]
+
+
+def measure(label, num_calls, func):
+    start = time.time()
+    call_data = func()
+    elapsed = time.time() - start
+    print("{0:<38} {1:>12,.0f} calls/sec".format(label, num_calls / elapsed))
+    return call_data
+
+
+def main(num_calls=200000, processes=4):
+    Token = Contract(make_contract_meta(ERC20_ABI), 'Token')
+    transfer_args = [(ADDRESS, idx) for idx in range(num_calls)]
+    holders = make_holders(num_calls)
+
+    for name, args_list in (('balanceOf', holders), ('transfer', transfer_args)):
+        function = getattr(Token, name)
+        expected = measure(
+            '{0} get_call_data'.format(name), num_calls,
+            lambda: [function.get_call_data(args) for args in args_list],
+        )
+        call_data = measure(
+            '{0} get_call_data_many'.format(name), num_calls,
+            lambda: function.get_call_data_many(args_list),
+        )
+        assert call_data == expected
+
+        pool = multiprocessing.Pool(processes)
+        try:
+            call_data = measure(
+                '{0} get_call_data_many, {1} procs'.format(name, processes), num_calls,
+                lambda: function.get_call_data_many(args_list, pool=pool, chunk_size=20000),
+            )
+        finally:
+            pool.close()
+            pool.join()
+        assert call_data == expected
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
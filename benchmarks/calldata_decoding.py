@@ -0,0 +1,62 @@
+"""
+Measure decoding transaction inputs with a `CallDecoder` holding the
+functions of thousands of contracts, for known and unknown selectors.
+
+    python benchmarks/calldata_decoding.py [num_contracts] [num_calls]
+"""
+import sys
+import time
+
+from eth_contract import Contract
+from eth_contract.calldata import CallDecoder
+
+from abi_fixtures import (
+    ADDRESS,
+    ERC20_ABI,
+    make_contract_meta,
+    make_function,
+)
+
+
+def make_contract(idx):
+    return Contract(make_contract_meta(ERC20_ABI + [
+        make_function('custom{0}'.format(idx), ['uint256', 'address'], ['uint256']),
+    ]), 'Contract{0}'.format(idx))
+
+
+def measure(label, num_calls, func):
+    start = time.time()
+    func()
+    elapsed = time.time() - start
+    print("{0:<30} {1:>12,.0f} calls/sec".format(label, num_calls / elapsed))
+
+
+def main(num_contracts=2000, num_calls=200000):
+    start = time.time()
+    contracts = [make_contract(idx) for idx in range(num_contracts)]
+    call_decoder = CallDecoder(contracts)
+    print("registered {0:,} contracts in {1:.2f}s".format(num_contracts, time.time() - start))
+
+    transfer = contracts[0].transfer
+    known = [
+        b'0x' + transfer.get_call_data((ADDRESS, idx)) for idx in range(num_calls // 2)
+    ] + [
+        b'0x' + getattr(
+            contracts[idx % num_contracts], 'custom{0}'.format(idx % num_contracts),
+        ).get_call_data((idx, ADDRESS))
+        for idx in range(num_calls // 2)
+    ]
+    unknown = [
+        '0x{0:08x}'.format(idx).encode('ascii') + b'00' * 64 for idx in range(len(known))
+    ]
+
+    measure('known selectors', len(known), lambda: call_decoder.decode_calldata_many(known))
+    measure('unknown selectors', len(unknown), lambda: call_decoder.decode_calldata_many(unknown))
+    transactions = [{'to': ADDRESS, 'input': data} for data in known]
+    measure('decode_transactions', len(transactions), lambda: list(
+        call_decoder.decode_transactions(transactions)
+    ))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,160 @@
+"""
+Measure contract calls/sec from 1 to 32 threads against a local stub
+JSON-RPC server, comparing a single client shared behind a lock with a
+`ClientPool` of keep-alive clients.
+
+    python benchmarks/client_threads.py [calls_per_thread] [latency_ms]
+
+The stub server answers every `eth_call` after `latency_ms` to stand in for
+the node's processing time.
+"""
+import itertools
+import json
+import socket
+import sys
+import threading
+import time
+
+try:
+    from http.client import HTTPConnection
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from httplib import HTTPConnection
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+from eth_contract import Contract
+from eth_contract.client import ClientPool
+
+from abi_fixtures import (
+    ADDRESS,
+    ERC20_ABI,
+    make_contract_meta,
+)
+
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+
+
+class StubRPCHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    latency = 0
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8'))
+        time.sleep(self.latency)
+        body = json.dumps({
+            'jsonrpc': '2.0',
+            'id': request['id'],
+            'result': '0x' + '{0:064x}'.format(1000),
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubRPCServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 64
+
+
+class KeepAliveClient(object):
+    """
+    Minimal JSON-RPC client which keeps its HTTP connection open.  Not
+    thread safe.
+    """
+    def __init__(self, host, port):
+        self.connection = HTTPConnection(host, port)
+        self.connection.connect()
+        # Headers and body are written separately, don't wait to coalesce them.
+        self.connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.ids = itertools.count()
+
+    def make_request(self, method, params):
+        body = json.dumps({
+            'jsonrpc': '2.0',
+            'id': next(self.ids),
+            'method': method,
+            'params': params,
+        })
+        self.connection.request('POST', '/', body, {'Content-Type': 'application/json'})
+        return json.loads(self.connection.getresponse().read().decode('utf-8'))['result']
+
+    def call(self, to, data, block='latest', **kwargs):
+        return self.make_request('eth_call', [{'to': to, 'data': data}, block])
+
+    def close(self):
+        self.connection.close()
+
+
+class LockedClient(object):
+    """
+    A single client shared by every thread behind a lock.
+    """
+    def __init__(self, client):
+        self.client = client
+        self.lock = threading.Lock()
+
+    def call(self, *args, **kwargs):
+        with self.lock:
+            return self.client.call(*args, **kwargs)
+
+
+def measure(Token, blockchain_client, num_threads, calls_per_thread):
+    token = Token(ADDRESS, blockchain_client)
+
+    def make_calls():
+        for _ in range(calls_per_thread):
+            token.balanceOf(ADDRESS)
+
+    threads = [threading.Thread(target=make_calls) for _ in range(num_threads)]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return num_threads * calls_per_thread / (time.time() - start)
+
+
+def main(calls_per_thread=200, latency_ms=2):
+    StubRPCHandler.latency = latency_ms / 1000.0
+    server = StubRPCServer(('127.0.0.1', 0), StubRPCHandler)
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+    host, port = server.server_address
+
+    clients = []
+
+    def make_client():
+        client = KeepAliveClient(host, port)
+        clients.append(client)
+        return client
+
+    Token = Contract(make_contract_meta(ERC20_ABI), 'Token')
+    client_pool = ClientPool(make_client, max_clients=max(THREAD_COUNTS))
+    locked_client = LockedClient(make_client())
+
+    print("{0:>8} {1:>20} {2:>20}".format('threads', 'shared+lock calls/s', 'ClientPool calls/s'))
+    for num_threads in THREAD_COUNTS:
+        print("{0:>8} {1:>20,.0f} {2:>20,.0f}".format(
+            num_threads,
+            measure(Token, locked_client, num_threads, calls_per_thread),
+            measure(Token, client_pool, num_threads, calls_per_thread),
+        ))
+
+    for client in clients:
+        client.close()
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
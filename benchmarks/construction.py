@@ -0,0 +1,41 @@
+"""
+Measure building contract classes with `Contract()` for ABIs of increasing
+size, and the cost of generating the class docstring.
+
+    python benchmarks/construction.py [num_classes]
+
+Run it on two commits to compare classes/sec before and after a change.
+"""
+import sys
+import timeit
+
+from eth_contract import Contract
+
+from abi_fixtures import (
+    make_contract_meta,
+    make_large_abi,
+)
+
+
+def classes_per_sec(func, number, repeat=5):
+    return number / min(timeit.repeat(func, number=number, repeat=repeat))
+
+
+def main(num_classes=200):
+    for num_functions in (20, 200, 1000):
+        contract_meta = make_contract_meta(make_large_abi(num_functions, num_functions // 8))
+        number = max(1, num_classes * 20 // num_functions)
+        # The first class interns the ABI definitions shared by later classes,
+        # which are kept as long as a class uses them.
+        first_class = Contract(contract_meta, 'Large')
+
+        print("{0:>5} functions: {1:>10,.1f} classes/sec, {2:>10,.1f} reading __doc__".format(
+            num_functions,
+            classes_per_sec(lambda: Contract(contract_meta, 'Large'), number),
+            classes_per_sec(lambda: Contract(contract_meta, 'Large').__doc__, number),
+        ))
+        del first_class
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
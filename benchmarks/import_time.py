@@ -0,0 +1,58 @@
+"""
+Measure the time taken by `import eth_contract` in a fresh interpreter.
+
+    python benchmarks/import_time.py [num_runs]
+
+On python 3.7+ the slowest imports reported by `python -X importtime` are
+also listed, which shows what `import eth_contract` still pulls in.
+"""
+import os
+import subprocess
+import sys
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TIMED_IMPORT = (
+    "import time\n"
+    "start = time.time()\n"
+    "import eth_contract\n"
+    "print(time.time() - start)"
+)
+
+
+def run_python(*args):
+    output = subprocess.check_output(
+        (sys.executable,) + args,
+        cwd=ROOT_DIR,
+        stderr=subprocess.STDOUT,
+    )
+    return output.decode('utf-8')
+
+
+def print_importtime_profile(num_modules=10):
+    lines = [
+        line[len('import time:'):].split('|')
+        for line in run_python('-X', 'importtime', '-c', 'import eth_contract').splitlines()
+        if line.startswith('import time:') and 'cumulative' not in line
+    ]
+    profile = sorted(
+        ((int(cumulative), name.rstrip()) for _, cumulative, name in lines),
+        reverse=True,
+    )
+    print("slowest imports (cumulative us):")
+    for cumulative, name in profile[:num_modules]:
+        print("{0:>10} {1}".format(cumulative, name))
+
+
+def main(num_runs=10):
+    timings = sorted(float(run_python('-c', TIMED_IMPORT)) for _ in range(num_runs))
+    print("import eth_contract: {0:.1f} ms (best of {1}), {2:.1f} ms (median)".format(
+        timings[0] * 1000, num_runs, timings[len(timings) // 2] * 1000,
+    ))
+    if sys.version_info >= (3, 7):
+        print_importtime_profile()
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,84 @@
+"""
+Measure contract instantiation throughput and memory.
+
+    python benchmarks/instantiation.py [num_functions] [num_instances]
+
+The memory held by the instances is measured in a fresh interpreter, with
+`tracemalloc` where it is available (python 3.4+) and from the growth of the
+process's RSS otherwise.  Run it on two commits to compare instances/sec and
+bytes/instance before and after a change.
+"""
+import gc
+import resource
+import subprocess
+import sys
+import timeit
+
+from eth_contract import Contract
+
+from abi_fixtures import (
+    ADDRESS,
+    make_contract_meta,
+    make_large_abi,
+)
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+def max_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def make_contract_class(num_functions):
+    return Contract(
+        make_contract_meta(make_large_abi(num_functions, num_functions // 8)),
+        'Benchmark',
+    )
+
+
+def measure_memory(num_functions, num_instances):
+    ContractClass = make_contract_class(num_functions)
+    # Create any state shared by all instances before measuring.
+    ContractClass(ADDRESS, None)
+    gc.collect()
+
+    if tracemalloc is not None:
+        method = 'tracemalloc'
+        tracemalloc.start()
+        instances = [ContractClass(ADDRESS, None) for _ in range(num_instances)]
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    else:
+        method = 'RSS'
+        rss_before = max_rss_kb()
+        instances = [ContractClass(ADDRESS, None) for _ in range(num_instances)]
+        allocated = (max_rss_kb() - rss_before) * 1024
+    # The list holding the instances is not part of their size.
+    allocated -= sys.getsizeof(instances)
+
+    print("{0:,} instances: {1:,} bytes ({2:,.0f} bytes/instance, {3})".format(
+        len(instances), allocated, allocated / float(len(instances)), method,
+    ))
+
+
+def main(num_functions=80, num_instances=100000):
+    ContractClass = make_contract_class(num_functions)
+    elapsed = timeit.timeit(lambda: ContractClass(ADDRESS, None), number=num_instances)
+    print("{0} functions: {1:,.0f} instances/sec".format(
+        num_functions, num_instances / elapsed,
+    ))
+
+    sys.stdout.flush()
+    subprocess.call([
+        sys.executable, __file__, '--memory', str(num_functions), str(num_instances),
+    ])
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--memory']:
+        measure_memory(int(sys.argv[2]), int(sys.argv[3]))
+    else:
+        main(*(int(arg) for arg in sys.argv[1:]))
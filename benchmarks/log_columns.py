@@ -0,0 +1,64 @@
+"""
+Measure decoding many Transfer logs into columns, compared with decoding one
+dictionary per log with `get_log_data`.
+
+    python benchmarks/log_columns.py [num_logs]
+
+Columns are numpy arrays when numpy is installed and lists otherwise.
+"""
+import sys
+import timeit
+
+from eth_contract.columns import has_numpy
+from eth_contract.events import Event
+
+
+Transfer = Event('Transfer', [
+    {'indexed': True, 'type': 'address', 'name': 'from'},
+    {'indexed': True, 'type': 'address', 'name': 'to'},
+    {'indexed': False, 'type': 'uint256', 'name': 'value'},
+], False)
+
+
+def make_logs(num_logs):
+    return [
+        {
+            'topics': [
+                '0x' + Transfer.event_topic[2:].decode('ascii'),
+                '0x' + '{0:040x}'.format(idx).rjust(64, '0'),
+                '0x' + '{0:040x}'.format(idx + 1).rjust(64, '0'),
+            ],
+            'data': '0x' + '{0:064x}'.format(idx * 10 ** 18),
+        }
+        for idx in range(num_logs)
+    ]
+
+
+def main(num_logs=100000):
+    log_entries = make_logs(num_logs)
+
+    timings = [
+        ('get_log_data', lambda: [
+            Transfer.get_log_data(log_entry, indexed=True) for log_entry in log_entries
+        ]),
+        ('get_log_columns (lists)', lambda: Transfer.get_log_columns(
+            log_entries, indexed=True, as_arrays=False,
+        )),
+    ]
+    if has_numpy():
+        timings.extend([
+            ('get_log_columns (arrays)', lambda: Transfer.get_log_columns(
+                log_entries, indexed=True, as_arrays=True,
+            )),
+            ('get_log_columns (arrays, V32)', lambda: Transfer.get_log_columns(
+                log_entries, indexed=True, as_arrays=True, wide_ints_as_bytes=True,
+            )),
+        ])
+
+    for name, decode in timings:
+        elapsed = min(timeit.repeat(decode, number=1, repeat=3))
+        print("{0:<30} {1:>12,.0f} logs/sec".format(name, num_logs / elapsed))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,71 @@
+"""
+Measure the cost of making thousands of contracts available, comparing
+building every contract class up front with a `ContractRegistry` which only
+builds the classes which are looked up.
+
+    python benchmarks/registry.py [num_contracts] [working_set] [num_lookups]
+"""
+import random
+import sys
+import time
+
+from eth_contract import Contract
+from eth_contract.registry import ContractRegistry
+
+from abi_fixtures import (
+    ERC20_ABI,
+    make_contract_meta,
+    make_function,
+)
+
+
+def make_address(idx):
+    return '0x{0:040x}'.format(idx)
+
+
+def make_contract_metas(num_contracts):
+    contract_metas = []
+    for idx in range(num_contracts):
+        contract_meta = make_contract_meta(ERC20_ABI + [
+            make_function('custom{0}'.format(idx), ['uint256', 'address'], ['uint256']),
+        ])
+        contract_meta['code'] += '{0:08x}'.format(idx)
+        contract_metas.append(contract_meta)
+    return contract_metas
+
+
+def main(num_contracts=5000, working_set=50, num_lookups=100000):
+    contract_metas = make_contract_metas(num_contracts)
+
+    start = time.time()
+    classes = {
+        make_address(idx): Contract(contract_meta, 'Contract{0}'.format(idx))
+        for idx, contract_meta in enumerate(contract_metas)
+    }
+    print("Contract() for all {0:,} contracts: {1:.3f}s".format(
+        len(classes), time.time() - start,
+    ))
+
+    start = time.time()
+    registry = ContractRegistry(max_classes=working_set * 2)
+    for idx, contract_meta in enumerate(contract_metas):
+        registry.add(contract_meta, 'Contract{0}'.format(idx), addresses=[make_address(idx)])
+    print("ContractRegistry.add for all {0:,} contracts: {1:.3f}s".format(
+        len(registry), time.time() - start,
+    ))
+
+    addresses = [
+        make_address(idx)
+        for idx in random.Random(0).sample(range(num_contracts), working_set)
+    ]
+    lookups = [addresses[idx % working_set] for idx in range(num_lookups)]
+    start = time.time()
+    for address in lookups:
+        registry.get_by_address(address)
+    print("{0:,} lookups over {1} contracts: {2:.3f}s, {3} classes built".format(
+        num_lookups, working_set, time.time() - start, registry.misses,
+    ))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,36 @@
+"""
+Measure decode operations/sec per return type, comparing the static decoder
+fast path with the generic decoder.
+
+    python benchmarks/return_data.py [number]
+"""
+import sys
+import timeit
+
+from eth_abi import decode_abi
+
+from eth_contract.decoding import compile_decoder
+
+
+OUTPUTS = (
+    (('uint256',), '0x' + '0' * 48 + 'de0b6b3a7640000'.rjust(16, '0')),
+    (('int256',), '0x' + 'f' * 64),
+    (('address',), '0x' + '0' * 24 + 'd3cda913deb6f67967b99d67acdfa1712c293601'),
+    (('bool',), '0x' + '0' * 63 + '1'),
+    (('bytes32',), '0x' + '746573742d6b6579'.ljust(64, '0')),
+    (('uint256', 'uint256', 'address'), '0x' + '0' * 63 + '1' + '0' * 63 + '2' + '0' * 64),
+)
+
+
+def main(number=100000):
+    for output_types, output in OUTPUTS:
+        decoder = compile_decoder(output_types)
+        fast = timeit.timeit(lambda: decoder(output), number=number)
+        generic = timeit.timeit(lambda: decode_abi(output_types, output), number=number)
+        print("{0:<28} fast: {1:>10,.0f}/sec  generic: {2:>10,.0f}/sec  ({3:.1f}x)".format(
+            ','.join(output_types), number / fast, number / generic, generic / fast,
+        ))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
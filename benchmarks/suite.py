@@ -0,0 +1,283 @@
+"""
+Benchmark suite for the hot paths of eth_contract: class construction,
+instantiation, dispatch, encoding and decoding of calls and logs.  Calls go
+to a stub blockchain client so no node is needed.
+
+    python benchmarks/suite.py [--save NAME] [--compare NAME] [--filter TEXT]
+
+Results are saved to `benchmarks/.results/NAME.json`, where `NAME` defaults
+to the current git commit.  Run the suite on two commits and pass the name
+of the earlier run with `--compare` to see the change of each benchmark.
+The exit status is 1 if any benchmark is slower than the compared run by
+more than `--threshold` (10% by default).
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+
+from eth_contract import Contract
+from eth_contract.events import Event
+from eth_contract.instrument import TimingAggregator
+
+from abi_fixtures import (
+    ADDRESS,
+    ERC20_ABI,
+    make_contract_meta,
+    make_function,
+    make_large_abi,
+)
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.results')
+
+# Each benchmark is run until it takes at least this long, in seconds, to
+# choose the number of loops, then timed this many times.
+MIN_TIME = 0.1
+REPEAT = 5
+
+LARGE_ABI = make_large_abi(200, 25)
+
+# An ERC223 style token, whose `transfer` is overloaded.
+OVERLOADED_ABI = ERC20_ABI + [
+    make_function('transfer', ['address', 'uint256', 'bytes'], ['bool']),
+]
+
+UINT256_OUTPUT = '0x' + '{0:064x}'.format(10 ** 18)
+
+ALLOWANCE_OUTPUT = '0x' + ''.join('{0:064x}'.format(value) for value in (1, 2, 3))
+
+TRANSFER_LOG = {
+    'topics': [
+        '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef',
+        '0x' + ADDRESS[2:].rjust(64, '0'),
+        '0x' + ADDRESS[2:].rjust(64, '0'),
+    ],
+    'data': UINT256_OUTPUT,
+}
+
+Transfer = Event('Transfer', [
+    {'indexed': True, 'type': 'address', 'name': 'from'},
+    {'indexed': True, 'type': 'address', 'name': 'to'},
+    {'indexed': False, 'type': 'uint256', 'name': 'value'},
+], False)
+
+
+class StubClient(object):
+    """
+    Blockchain client which answers every call with the same output.
+    """
+    def __init__(self, output=UINT256_OUTPUT):
+        self.output = output
+
+    def call(self, to, data, **kwargs):
+        return self.output
+
+    def send_transaction(self, **kwargs):
+        return '0x' + '00' * 32
+
+    def get_max_gas(self):
+        return 4000000
+
+
+BENCHMARKS = []
+
+
+def benchmark(setup):
+    """
+    Register a benchmark.  `setup()` returns the function to time.
+    """
+    BENCHMARKS.append((setup.__name__, setup))
+    return setup
+
+
+@benchmark
+def contract_class_erc20():
+    contract_meta = make_contract_meta(ERC20_ABI)
+    return lambda: Contract(contract_meta, 'Token')
+
+
+@benchmark
+def contract_class_large_abi():
+    contract_meta = make_contract_meta(LARGE_ABI)
+    return lambda: Contract(contract_meta, 'Large')
+
+
+@benchmark
+def contract_init_erc20():
+    Token = Contract(make_contract_meta(ERC20_ABI), 'Token')
+    client = StubClient()
+    return lambda: Token(ADDRESS, client)
+
+
+@benchmark
+def contract_init_large_abi():
+    Large = Contract(make_contract_meta(LARGE_ABI), 'Large')
+    client = StubClient()
+    return lambda: Large(ADDRESS, client)
+
+
+@benchmark
+def get_call_data_transfer():
+    Token = Contract(make_contract_meta(ERC20_ABI), 'Token')
+    args = (ADDRESS, 10 ** 18)
+    return lambda: Token.transfer.get_call_data(args)
+
+
+@benchmark
+def get_call_data_dynamic():
+    Token = Contract(make_contract_meta(OVERLOADED_ABI), 'Token')
+    function = Token.transfer.functions[1]
+    args = (ADDRESS, 10 ** 18, b'\x01' * 100)
+    return lambda: function.get_call_data(args)
+
+
+@benchmark
+def cast_return_data_uint256():
+    Token = Contract(make_contract_meta(ERC20_ABI), 'Token')
+    return lambda: Token.balanceOf.cast_return_data(UINT256_OUTPUT)
+
+
+@benchmark
+def cast_return_data_multiple():
+    function = Contract(make_contract_meta([
+        make_function('allowances', [], ['uint256', 'uint256', 'uint256'], constant=True),
+    ]), 'Token').allowances
+    return lambda: function.cast_return_data(ALLOWANCE_OUTPUT)
+
+
+@benchmark
+def get_function_for_call_signature():
+    Token = Contract(make_contract_meta(OVERLOADED_ABI), 'Token')
+    args = (ADDRESS, 10 ** 18)
+    return lambda: Token.transfer.get_function_for_call_signature(args)
+
+
+@benchmark
+def bound_function_call():
+    Token = Contract(make_contract_meta(ERC20_ABI), 'Token')
+    token = Token(ADDRESS, StubClient())
+    return lambda: token.balanceOf(ADDRESS)
+
+
+@benchmark
+def bound_function_call_instrumented():
+    Token = Contract(make_contract_meta(ERC20_ABI), 'Token')
+    token = Token(ADDRESS, StubClient(), instrument=TimingAggregator())
+    return lambda: token.balanceOf(ADDRESS)
+
+
+@benchmark
+def get_log_data():
+    return lambda: Transfer.get_log_data(TRANSFER_LOG)
+
+
+@benchmark
+def get_log_data_indexed():
+    return lambda: Transfer.get_log_data(TRANSFER_LOG, indexed=True)
+
+
+def time_benchmark(func):
+    """
+    Return the fastest and the median time of a single call of `func`.
+    """
+    number = 1
+    while timeit.timeit(func, number=number) < MIN_TIME:
+        number *= 2
+    timings = sorted(
+        timeit.timeit(func, number=number) / number for _ in range(REPEAT)
+    )
+    return timings[0], timings[len(timings) // 2]
+
+
+def get_commit():
+    try:
+        output = subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('utf-8').strip()
+
+
+def get_results_path(name):
+    return os.path.join(RESULTS_DIR, '{0}.json'.format(name))
+
+
+def load_results(name):
+    with open(get_results_path(name)) as results_file:
+        return json.load(results_file)
+
+
+def save_results(name, results):
+    if not os.path.exists(RESULTS_DIR):
+        os.makedirs(RESULTS_DIR)
+    with open(get_results_path(name), 'w') as results_file:
+        json.dump(results, results_file, indent=2, sort_keys=True)
+
+
+def format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e3), ('us', 1e6)):
+        if seconds * scale >= 1:
+            return '{0:.2f} {1}'.format(seconds * scale, unit)
+    return '{0:.0f} ns'.format(seconds * 1e9)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the eth_contract benchmarks.")
+    parser.add_argument('--save', help="name to save the results under (default: git commit)")
+    parser.add_argument('--compare', help="name of saved results to compare with")
+    parser.add_argument('--filter', help="only run benchmarks whose name contains this")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="slowdown which fails the comparison (default: 0.1)")
+    args = parser.parse_args(argv)
+
+    previous = load_results(args.compare) if args.compare else None
+    if previous is not None and previous['python'] != platform.python_version():
+        print("Comparing with results from python {0}".format(previous['python']))
+
+    results = {
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'benchmarks': {},
+    }
+    regressions = []
+
+    print("{0:<34} {1:>10} {2:>10}".format('benchmark', 'min', 'median'))
+    for name, setup in BENCHMARKS:
+        if args.filter and args.filter not in name:
+            continue
+        fastest, median = time_benchmark(setup())
+        results['benchmarks'][name] = {'min': fastest, 'median': median}
+
+        line = "{0:<34} {1:>10} {2:>10}".format(name, format_time(fastest), format_time(median))
+        if previous is not None and name in previous['benchmarks']:
+            change = fastest / previous['benchmarks'][name]['min'] - 1
+            line += "  {0:+6.1%}".format(change)
+            if change > args.threshold:
+                regressions.append(name)
+                line += "  slower"
+        print(line)
+
+    name = args.save or results['commit'] or 'latest'
+    if args.filter and os.path.exists(get_results_path(name)):
+        # Keep the results of the benchmarks which were not run.
+        saved = load_results(name)
+        saved['benchmarks'].update(results['benchmarks'])
+        results['benchmarks'] = saved['benchmarks']
+    save_results(name, results)
+
+    if regressions:
+        print("{0} benchmarks are more than {1:.0%} slower than {2}".format(
+            len(regressions), args.threshold, args.compare,
+        ))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
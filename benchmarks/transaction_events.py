@@ -0,0 +1,100 @@
+"""
+Measure decoding the logs of several events from transaction receipts,
+comparing `get_transaction_logs` on each event with a single
+`get_transaction_events` on the contract.
+
+    python benchmarks/transaction_events.py [num_receipts] [logs_per_event]
+"""
+import sys
+import time
+
+from eth_contract import Contract
+
+from abi_fixtures import (
+    ADDRESS,
+    make_contract_meta,
+    make_event,
+)
+
+
+NUM_EVENTS = 5
+
+
+class StubClient(object):
+    """
+    Returns canned receipts and counts the requests it receives.
+    """
+    def __init__(self, receipts):
+        self.receipts = receipts
+        self.num_requests = 0
+
+    def get_transaction_receipt(self, txn_hash):
+        self.num_requests += 1
+        return self.receipts[txn_hash]
+
+
+class StubBatchClient(StubClient):
+    def batch_get_transaction_receipt(self, txn_hashes):
+        self.num_requests += 1
+        return [self.receipts[txn_hash] for txn_hash in txn_hashes]
+
+
+def make_receipt(Events, logs_per_event):
+    logs = []
+    for idx in range(logs_per_event):
+        for event_idx in range(NUM_EVENTS):
+            event = getattr(Events, 'Event{0}'.format(event_idx))
+            logs.append({
+                'address': ADDRESS,
+                'topics': [event.event_topic, '0x' + '{0:064x}'.format(idx)],
+                'data': '0x' + '{0:064x}'.format(idx * 1000 + event_idx),
+            })
+    return {'logs': logs}
+
+
+def measure(label, client, func):
+    client.num_requests = 0
+    start = time.time()
+    num_logs = func()
+    print("{0:<40} {1:>8.3f}s {2:>8,} requests {3:>10,} logs".format(
+        label, time.time() - start, client.num_requests, num_logs,
+    ))
+
+
+def main(num_receipts=2000, logs_per_event=4):
+    Events = Contract(make_contract_meta([
+        make_event('Event{0}'.format(idx), [('uint256', True), ('uint256', False)])
+        for idx in range(NUM_EVENTS)
+    ]), 'Events')
+    receipt = make_receipt(Events, logs_per_event)
+    txn_hashes = ['0x{0:064x}'.format(idx) for idx in range(num_receipts)]
+    receipts = {txn_hash: receipt for txn_hash in txn_hashes}
+
+    client = StubClient(receipts)
+    events = Events(ADDRESS, client)
+
+    def per_event():
+        num_logs = 0
+        for txn_hash in txn_hashes:
+            for idx in range(NUM_EVENTS):
+                event = getattr(events, 'Event{0}'.format(idx))
+                for log_entry in event.get_transaction_logs(txn_hash):
+                    event.get_log_data(log_entry, indexed=True)
+                    num_logs += 1
+        return num_logs
+
+    def per_contract():
+        return sum(len(events.get_transaction_events(txn_hash)) for txn_hash in txn_hashes)
+
+    measure('get_transaction_logs for each event', client, per_event)
+    measure('get_transaction_events', client, per_contract)
+
+    batch_client = StubBatchClient(receipts)
+    batch_events = Events(ADDRESS, batch_client)
+    measure('get_transaction_events_many (batched)', batch_client, lambda: sum(
+        len(decoded) for decoded in batch_events.get_transaction_events_many(txn_hashes)
+    ))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
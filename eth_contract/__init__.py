@@ -1,5 +1,3 @@
-import pkg_resources
-
 from eth_contract.functions import (  # NOQA
     Function,
     FunctionGroup,
@@ -10,4 +8,4 @@ from eth_contract.core import (  # NOQA
 )
 
 
-__version__ = pkg_resources.get_distribution('ethereum-contract').version
+__version__ = '0.1.0'
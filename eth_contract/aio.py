@@ -0,0 +1,433 @@
+"""
+Asyncio variants of the contract objects.
+
+These work with a blockchain client which exposes the same methods as the
+synchronous clients (`call`, `send_transaction`, `get_max_gas`,
+`get_balance`, `get_transaction_receipt` and `wait_for_transaction`) as
+coroutine functions, and optionally `batch_call`,
+`batch_get_transaction_receipt`, `get_transaction_count` (for contracts
+with a `nonce_manager`), and `get_logs` and `get_block_number` (for
+`AsyncEvent.scan`).
+
+Requires python 3.5.2 or newer.
+"""
+import asyncio
+import collections
+import inspect
+import time
+
+from eth_contract.batch import (
+    DEFAULT_BATCH_SIZE,
+    Batch,
+    chunks,
+    decode_multicall_result,
+    encode_multicall_data,
+)
+from eth_contract.core import (
+    Contract,
+    ContractBase,
+    get_receipt_events,
+)
+from eth_contract.events import Event
+from eth_contract.gas import (
+    DEFAULT_ESTIMATE_MULTIPLIER,
+    DEFAULT_MAX_ESTIMATES,
+    EstimateGasStrategy,
+    MaxGasStrategy,
+)
+from eth_contract.functions import (
+    Function,
+    FunctionGroup,
+)
+from eth_contract.instrument import (
+    DECODE,
+    ENCODE,
+    RPC,
+    WAIT,
+)
+from eth_contract.logs import (
+    DEFAULT_SCAN_CHUNK_SIZE,
+    MAX_SCAN_CHUNK_SIZE,
+    SCAN_TARGET_RESULTS,
+    LogScan,
+    scan_needs_head,
+)
+
+
+async def resolve(value):
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class AsyncMaxGasStrategy(MaxGasStrategy):
+    """
+    A `MaxGasStrategy` which awaits the client's `get_max_gas()`.
+    """
+    async def get_max_gas(self, blockchain_client):
+        if not self.max_age:
+            return await blockchain_client.get_max_gas()
+
+        if self._cached is not None:
+            client, max_gas, expires_at = self._cached
+            if client is blockchain_client and time.time() < expires_at:
+                return max_gas
+
+        max_gas = await blockchain_client.get_max_gas()
+        self._cached = (blockchain_client, max_gas, time.time() + self.max_age)
+        return max_gas
+
+    async def get_gas(self, function, data, txn_kwargs):
+        max_gas = await self.get_max_gas(function.contract._meta.blockchain_client)
+        return int(self.fraction * max_gas)
+
+
+class AsyncEstimateGasStrategy(EstimateGasStrategy):
+    """
+    An `EstimateGasStrategy` which awaits the client's `estimate_gas()`,
+    capped by an `AsyncMaxGasStrategy` by default.
+    """
+    def __init__(self, multiplier=DEFAULT_ESTIMATE_MULTIPLIER, max_gas_strategy=None,
+                 max_size=DEFAULT_MAX_ESTIMATES):
+        if max_gas_strategy is None:
+            max_gas_strategy = AsyncMaxGasStrategy()
+        super().__init__(multiplier, max_gas_strategy, max_size)
+
+    async def get_estimate(self, function, data, txn_kwargs):
+        key = self.get_key(function, data, txn_kwargs)
+        try:
+            return self.load_estimate(key)
+        except KeyError:
+            pass
+
+        blockchain_client = function.contract._meta.blockchain_client
+        estimate = await blockchain_client.estimate_gas(
+            to=function.contract._meta.address,
+            data=data,
+            **txn_kwargs
+        )
+        self.store_estimate(key, estimate)
+        return estimate
+
+    async def get_gas(self, function, data, txn_kwargs):
+        estimate = await self.get_estimate(function, data, txn_kwargs)
+        max_gas = await resolve(self.max_gas_strategy.get_gas(function, data, txn_kwargs))
+        return min(int(self.multiplier * estimate), max_gas)
+
+
+# Preserves the behaviour of requesting the max gas for every transaction.
+DEFAULT_ASYNC_GAS_STRATEGY = AsyncMaxGasStrategy(max_age=0)
+
+
+async def send_with_nonce_manager(nonce_manager, blockchain_client, **txn_kwargs):
+    """
+    The asyncio version of `NonceManager.send_transaction`.  Concurrent
+    first transactions from an account may each read its transaction count,
+    only the first count is used.
+    """
+    if 'nonce' in txn_kwargs:
+        return await blockchain_client.send_transaction(**txn_kwargs)
+
+    account = nonce_manager.get_account(txn_kwargs)
+    if '_from' not in txn_kwargs:
+        txn_kwargs['_from'] = nonce_manager.default_account
+
+    nonce = nonce_manager.reserve_known(account)
+    while nonce is None:
+        # The account may be reset by a failed send while the count is read.
+        transaction_count = await blockchain_client.get_transaction_count(
+            account,
+            block="pending",
+        )
+        nonce_manager.sync(account, transaction_count)
+        nonce = nonce_manager.reserve_known(account)
+    try:
+        return await blockchain_client.send_transaction(nonce=nonce, **txn_kwargs)
+    except Exception as error:
+        nonce_manager.send_failed(account, nonce, error)
+        raise
+
+
+class AsyncFunction(Function):
+    async def s(self, *args, **kwargs):
+        if self.constant:
+            return await self(*args, **kwargs)
+        max_wait = kwargs.pop('max_wait', 60)
+        txn_hash = await self(*args, **kwargs)
+        instrument = self.contract._meta.instrument
+        if instrument is not None:
+            start = instrument.timer()
+        txn_receipt = await self.contract._meta.blockchain_client.wait_for_transaction(
+            txn_hash,
+            max_wait=max_wait
+        )
+        if instrument is not None:
+            instrument.mark(self, WAIT, start)
+        return txn_hash, txn_receipt
+
+    async def s_many(self, args_list, **kwargs):
+        return await asyncio.gather(*(self.s(*args, **kwargs) for args in args_list))
+
+    async def sendTransaction(self, *args, **kwargs):
+        instrument = self.contract._meta.instrument
+        if instrument is not None:
+            start = instrument.timer()
+        data = self.get_call_data(args)
+        if instrument is not None:
+            start = instrument.mark(self, ENCODE, start, data)
+        blockchain_client = self.contract._meta.blockchain_client
+
+        if 'gas' not in kwargs:
+            gas_strategy = self.contract._meta.gas_strategy or DEFAULT_ASYNC_GAS_STRATEGY
+            kwargs['gas'] = await resolve(gas_strategy.get_gas(self, data, kwargs))
+
+        nonce_manager = self.contract._meta.nonce_manager
+        if nonce_manager is not None:
+            txn_hash = await send_with_nonce_manager(
+                nonce_manager,
+                blockchain_client,
+                to=self.contract._meta.address,
+                data=data,
+                **kwargs
+            )
+        else:
+            txn_hash = await blockchain_client.send_transaction(
+                to=self.contract._meta.address,
+                data=data,
+                **kwargs
+            )
+        if instrument is not None:
+            instrument.mark(self, RPC, start, txn_hash)
+        return txn_hash
+
+    async def call(self, *args, **kwargs):
+        raw = kwargs.pop('raw', False)
+        instrument = self.contract._meta.instrument
+        if instrument is not None:
+            start = instrument.timer()
+        data = self.get_call_data(args)
+        if instrument is not None:
+            start = instrument.mark(self, ENCODE, start, data)
+
+        output = await self.contract._meta.blockchain_client.call(
+            to=self.contract._meta.address,
+            data=data,
+            **kwargs
+        )
+        if instrument is not None:
+            start = instrument.mark(self, RPC, start, output)
+        if raw:
+            return output
+        result = self.cast_return_data(output)
+        if instrument is not None:
+            instrument.mark(self, DECODE, start, output)
+        return result
+
+
+class AsyncFunctionGroup(FunctionGroup):
+    """
+    Dispatches to `AsyncFunction` members so every call returns a coroutine.
+    """
+    async def s_many(self, args_list, **kwargs):
+        return await asyncio.gather(*(self.s(*args, **kwargs) for args in args_list))
+
+
+class AsyncEvent(Event):
+    async def get_transaction_logs(self, txn_hash):
+        instrument = self.contract._meta.instrument
+        if instrument is not None:
+            start = instrument.timer()
+        blockchain_client = self.contract._meta.blockchain_client
+        txn_receipt = await blockchain_client.get_transaction_receipt(txn_hash)
+        if txn_receipt is None:
+            logs = None
+        else:
+            logs = [
+                log for log in txn_receipt['logs'] if self.event_topic in log['topics']
+            ]
+        if instrument is not None:
+            instrument.mark(self, RPC, start, logs)
+        return logs
+
+    def scan(self, from_block, to_block, **kwargs):
+        """
+        Return an asynchronous iterator, for use with `async for`, over the
+        decoded logs `Event.scan` would yield.
+        """
+        decoder, filter_params = self._get_scan_filter()
+        kwargs.update(filter_params)
+        return AsyncLogScanner(
+            self.contract._meta.blockchain_client,
+            decoder,
+            from_block,
+            to_block,
+            **kwargs
+        )
+
+
+class AsyncLogScanner(object):
+    """
+    Fetches the logs of an `AsyncEvent.scan` one block range at a time as
+    they are iterated over.
+    """
+    def __init__(self, blockchain_client, decoder, from_block, to_block,
+                 chunk_size=DEFAULT_SCAN_CHUNK_SIZE,
+                 max_chunk_size=MAX_SCAN_CHUNK_SIZE,
+                 target_results=SCAN_TARGET_RESULTS,
+                 **filter_params):
+        self.blockchain_client = blockchain_client
+        self.decoder = decoder
+        self.from_block = from_block
+        self.to_block = to_block
+        self.scan_params = (chunk_size, max_chunk_size, target_results)
+        self.filter_params = filter_params
+        self._scan = None
+        self._log_entries = collections.deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._scan is None:
+            head = None
+            if scan_needs_head(self.from_block, self.to_block):
+                head = await self.blockchain_client.get_block_number()
+            self._scan = LogScan(self.from_block, self.to_block, head, *self.scan_params)
+
+        while not self._log_entries:
+            block_range = self._scan.next_range()
+            if block_range is None:
+                raise StopAsyncIteration
+            try:
+                log_entries = await self.blockchain_client.get_logs(
+                    from_block=block_range[0],
+                    to_block=block_range[1],
+                    **self.filter_params
+                )
+            except Exception as error:
+                if self._scan.shrink(error):
+                    continue
+                raise
+            self._scan.advance(len(log_entries))
+            self._log_entries.extend(log_entries)
+
+        return self.decoder.decode(self._log_entries.popleft())
+
+
+class AsyncBatch(Batch):
+    """
+    A `Batch` which is used with `async with` and whose chunks are sent
+    concurrently.
+    """
+    def __enter__(self):
+        raise TypeError("Asynchronous batches must be used with `async with`")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            await self.execute()
+
+    async def execute(self):
+        pending = [call for call in self.calls if not call.executed]
+        if self.multicall_address is not None:
+            execute_chunk = self._execute_multicall
+        else:
+            execute_chunk = self._execute_rpc
+        batch_chunks = list(chunks(pending, self.batch_size))
+
+        chunk_outputs = await asyncio.gather(*(
+            execute_chunk(chunk) for chunk in batch_chunks
+        ))
+        for chunk, outputs in zip(batch_chunks, chunk_outputs):
+            for call, output in zip(chunk, outputs):
+                call.set_output(output)
+        return self.results
+
+    async def _execute_rpc(self, chunk):
+        requests = [self._get_call_kwargs(call) for call in chunk]
+        if hasattr(self.blockchain_client, 'batch_call'):
+            return await self.blockchain_client.batch_call(requests)
+        return await asyncio.gather(*(
+            self.blockchain_client.call(**request) for request in requests
+        ))
+
+    async def _execute_multicall(self, chunk):
+        data = encode_multicall_data((call.to, call.data) for call in chunk)
+        output = await self.blockchain_client.call(
+            to=self.multicall_address,
+            data=data,
+            **self.call_kwargs
+        )
+        _, return_data = decode_multicall_result(output)
+        return return_data
+
+
+class AsyncContractBase(ContractBase):
+    function_class = AsyncFunction
+    function_group_class = AsyncFunctionGroup
+    event_class = AsyncEvent
+    batch_class = AsyncBatch
+
+    def __init__(self, address, blockchain_client, call_cache=None, gas_strategy=None,
+                 nonce_manager=None, receipt_watcher=None, instrument=None):
+        if call_cache is not None:
+            raise TypeError("Asyncio contracts do not support a call_cache")
+        if receipt_watcher is not None:
+            # The watcher polls the client from its own thread.
+            raise TypeError("Asyncio contracts do not support a receipt_watcher")
+        synchronous_strategies = (MaxGasStrategy, EstimateGasStrategy)
+        asynchronous_strategies = (AsyncMaxGasStrategy, AsyncEstimateGasStrategy)
+        if (isinstance(gas_strategy, synchronous_strategies) and
+                not isinstance(gas_strategy, asynchronous_strategies)):
+            raise TypeError(
+                "Asyncio contracts need an AsyncMaxGasStrategy or AsyncEstimateGasStrategy"
+            )
+        super().__init__(
+            address,
+            blockchain_client,
+            call_cache=call_cache,
+            gas_strategy=gas_strategy,
+            nonce_manager=nonce_manager,
+            receipt_watcher=receipt_watcher,
+            instrument=instrument,
+        )
+
+    async def get_balance(self, block="latest"):
+        return await self._meta.blockchain_client.get_balance(self._meta.address, block=block)
+
+    async def get_transaction_events(self, txn_hash):
+        txn_receipt = await self._meta.blockchain_client.get_transaction_receipt(txn_hash)
+        return get_receipt_events(self, txn_receipt)
+
+    async def get_transaction_events_many(self, txn_hashes, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Fetch the receipts concurrently, in chunks of `batch_size` if the
+        client implements `batch_get_transaction_receipt`.
+        """
+        blockchain_client = self._meta.blockchain_client
+        txn_hashes = list(txn_hashes)
+        if hasattr(blockchain_client, 'batch_get_transaction_receipt'):
+            chunk_receipts = await asyncio.gather(*(
+                blockchain_client.batch_get_transaction_receipt(chunk)
+                for chunk in chunks(txn_hashes, batch_size)
+            ))
+            txn_receipts = [
+                txn_receipt for receipts in chunk_receipts for txn_receipt in receipts
+            ]
+        else:
+            txn_receipts = await asyncio.gather(*(
+                blockchain_client.get_transaction_receipt(txn_hash) for txn_hash in txn_hashes
+            ))
+        return [get_receipt_events(self, txn_receipt) for txn_receipt in txn_receipts]
+
+
+def AsyncContract(contract_meta, contract_name=None, abi_cache=None, compact=False):
+    return Contract(
+        contract_meta,
+        contract_name,
+        base=AsyncContractBase,
+        abi_cache=abi_cache,
+        compact=compact,
+    )
@@ -0,0 +1,210 @@
+import itertools
+
+from eth_contract import utils
+from eth_contract.utils import (
+    abi_utils,
+    rlp_utils,
+)
+
+
+DEFAULT_BATCH_SIZE = 500
+
+MULTICALL_AGGREGATE_SIGNATURE = b'aggregate((address,bytes)[])'
+
+
+class BatchCall(object):
+    """
+    A single constant function call which has been queued on a `Batch`.  The
+    return value is available from `result` once the batch has executed.
+    """
+    _result = None
+    executed = False
+
+    def __init__(self, function, args, raw=False, **kwargs):
+        self.function = function
+        self.args = args
+        self.raw = raw
+        self.kwargs = kwargs
+        self.data = function.get_call_data(args)
+
+    @property
+    def to(self):
+        return self.function.contract._meta.address
+
+    @property
+    def result(self):
+        if not self.executed:
+            raise AttributeError("The batch containing this call has not been executed")
+        return self._result
+
+    def set_output(self, output):
+        if self.raw:
+            self._result = output
+        else:
+            self._result = self.function.cast_return_data(output)
+        self.executed = True
+
+
+class Batch(object):
+    """
+    Collects constant function calls and sends them to the blockchain client
+    in as few round trips as possible.
+
+    If the client implements `batch_call(calls)`, each chunk of up to
+    `batch_size` calls is passed to it as a list of `call` keyword argument
+    dictionaries and it must return the list of outputs in the same order.
+    This is where a client sends a single JSON-RPC batch request.  Clients
+    without `batch_call` fall back to one `call` per queued call.
+
+    If `multicall_address` is given, each chunk is instead sent as a single
+    `eth_call` to a deployed Multicall aggregator contract.
+
+    Contract functions are queued by calling them on the batch, e.g.
+    `batch.balanceOf(address)`.  Functions whose names clash with attributes
+    of the batch itself, or which belong to another contract, can be queued
+    with `add_call`.
+    """
+    def __init__(self, contract, multicall_address=None,
+                 batch_size=DEFAULT_BATCH_SIZE, **call_kwargs):
+        self.contract = contract
+        self.multicall_address = multicall_address
+        self.batch_size = batch_size
+        self.call_kwargs = call_kwargs
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
+
+    def __getattr__(self, name):
+        function = getattr(self.contract, name)
+
+        def queue_call(*args, **kwargs):
+            return self.add_call(function, *args, **kwargs)
+        return queue_call
+
+    @property
+    def blockchain_client(self):
+        return self.contract._meta.blockchain_client
+
+    @property
+    def results(self):
+        return [call.result for call in self.calls]
+
+    def add_call(self, function, *args, **kwargs):
+        """
+        Queue a call to `function`, which may be bound to any contract using
+        the same blockchain client.
+        """
+        if hasattr(function, 'get_function_for_call_signature'):
+            function = function.get_function_for_call_signature(args)
+        if self.multicall_address is not None and set(kwargs).difference(['raw']):
+            raise ValueError("Calls in a multicall batch cannot set keyword arguments")
+        call = BatchCall(function, args, **kwargs)
+        self.calls.append(call)
+        return call
+
+    def execute(self):
+        pending = [call for call in self.calls if not call.executed]
+        for chunk in chunks(pending, self.batch_size):
+            if self.multicall_address is not None:
+                outputs = self._execute_multicall(chunk)
+            else:
+                outputs = self._execute_rpc(chunk)
+            for call, output in zip(chunk, outputs):
+                call.set_output(output)
+        return self.results
+
+    def _execute_rpc(self, chunk):
+        requests = [self._get_call_kwargs(call) for call in chunk]
+        if hasattr(self.blockchain_client, 'batch_call'):
+            return self.blockchain_client.batch_call(requests)
+        return [self.blockchain_client.call(**request) for request in requests]
+
+    def _execute_multicall(self, chunk):
+        data = encode_multicall_data((call.to, call.data) for call in chunk)
+        output = self.blockchain_client.call(
+            to=self.multicall_address,
+            data=data,
+            **self.call_kwargs
+        )
+        _, return_data = decode_multicall_result(output)
+        return return_data
+
+    def _get_call_kwargs(self, call):
+        request = dict(self.call_kwargs)
+        request.update(call.kwargs)
+        request['to'] = call.to
+        request['data'] = call.data
+        return request
+
+
+def chunks(items, size):
+    for idx in range(0, len(items), size):
+        yield items[idx:idx + size]
+
+
+#
+# Multicall encoding
+#
+def _encode_uint(value):
+    return abi_utils.zpad(rlp_utils.int_to_big_endian(value), 32)
+
+
+def _encode_bytes(value):
+    padding = b'\x00' * (abi_utils.ceil32(len(value)) - len(value))
+    return _encode_uint(len(value)) + value + padding
+
+
+def _decode_hex(value):
+    return rlp_utils.decode_hex(utils.strip_0x_prefix(utils.str_to_bytes(value)))
+
+
+def encode_multicall_data(calls):
+    """
+    ABI encode a call to `aggregate((address,bytes)[])` for the given
+    iterable of hex encoded `(address, call_data)` pairs.
+    """
+    encoded_calls = [
+        (
+            abi_utils.zpad(_decode_hex(address), 32) +
+            _encode_uint(64) +
+            _encode_bytes(_decode_hex(data))
+        )
+        for address, data in calls
+    ]
+    offsets = []
+    position = 32 * len(encoded_calls)
+    for encoded_call in encoded_calls:
+        offsets.append(_encode_uint(position))
+        position += len(encoded_call)
+
+    selector = utils.sha3(MULTICALL_AGGREGATE_SIGNATURE)[:4]
+    return rlp_utils.encode_hex(b''.join(itertools.chain(
+        [selector, _encode_uint(32), _encode_uint(len(encoded_calls))],
+        offsets,
+        encoded_calls,
+    )))
+
+
+def decode_multicall_result(output):
+    """
+    Decode the `(uint256 blockNumber, bytes[] returnData)` return value of
+    `aggregate`.  Each item of `returnData` is returned hex encoded so that it
+    can be passed to `cast_return_data` like the output of a regular call.
+    """
+    data = _decode_hex(output)
+    block_number = rlp_utils.big_endian_to_int(data[:32])
+    items_start = rlp_utils.big_endian_to_int(data[32:64]) + 32
+    num_items = rlp_utils.big_endian_to_int(data[items_start - 32:items_start])
+
+    return_data = []
+    for idx in range(num_items):
+        head = items_start + 32 * idx
+        offset = items_start + rlp_utils.big_endian_to_int(data[head:head + 32])
+        size = rlp_utils.big_endian_to_int(data[offset:offset + 32])
+        return_data.append(b'0x' + rlp_utils.encode_hex(data[offset + 32:offset + 32 + size]))
+    return block_number, return_data
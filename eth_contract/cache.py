@@ -0,0 +1,70 @@
+import errno
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+from eth_contract.common import register_compiled_abi
+from eth_contract import utils
+
+
+# Bump whenever the pickled format of the compiled ABI data changes so that
+# stale cache files are ignored.
+CACHE_FORMAT_VERSION = 1
+
+
+class ABICache(object):
+    """
+    Stores the compiled ABI data (selectors, topics, parsed types, encoders
+    and decoders) of contracts on disk, keyed by a hash of the ABI.
+
+    Passing an `ABICache` to `Contract()` loads the compiled data for that
+    ABI if it has been stored before and stores it otherwise, so a process
+    only needs to unpickle one file per ABI instead of compiling every
+    function and event.  A changed ABI hashes to a new key, which invalidates
+    the previous entry.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+
+    def get_key(self, abi):
+        abi_json = json.dumps(abi, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(utils.str_to_bytes(abi_json)).hexdigest()
+
+    def get_path(self, abi):
+        return os.path.join(
+            self.directory,
+            "{0}.v{1}.pickle".format(self.get_key(abi), CACHE_FORMAT_VERSION),
+        )
+
+    def load(self, abi):
+        """
+        Register the stored compiled ABI data for `abi`.  Returns `None` if
+        nothing usable has been stored.
+        """
+        try:
+            with open(self.get_path(abi), 'rb') as cache_file:
+                compiled_abis = pickle.load(cache_file)
+        except Exception:
+            # Missing, unreadable or corrupt cache files are all cache misses.
+            return None
+        return [register_compiled_abi(compiled_abi) for compiled_abi in compiled_abis]
+
+    def store(self, abi, compiled_abis):
+        try:
+            os.makedirs(self.directory)
+        except OSError as error:
+            if error.errno != errno.EEXIST:
+                raise
+
+        # Write to a temporary file first so concurrent readers never see a
+        # partially written cache file.
+        fd, temp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as cache_file:
+                pickle.dump(list(compiled_abis), cache_file, pickle.HIGHEST_PROTOCOL)
+            os.rename(temp_path, self.get_path(abi))
+        except Exception:
+            os.remove(temp_path)
+            raise
@@ -0,0 +1,143 @@
+import collections
+import sqlite3
+import threading
+
+from eth_contract import utils
+
+
+def is_cacheable_call(call_kwargs):
+    """
+    Whether the result of a call with `call_kwargs` is immutable: only calls
+    at a concrete block number (not `"latest"` or `"pending"`) with no other
+    parameters, such as `_from`, which could change the result.
+    """
+    return (
+        len(call_kwargs) == 1 and
+        type(call_kwargs.get('block')) in utils.int_types
+    )
+
+
+class CallCache(object):
+    """
+    Base class for read-through caches of constant function call results,
+    keyed by the contract address, the call data and the block number.
+    Subclasses implement `load(key)`, which raises `KeyError` for missing
+    entries, and `store(key, output)`, and may use `_lock`.
+    """
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get_key(self, address, data, block):
+        return (
+            utils.str_to_bytes(address).lower(),
+            utils.str_to_bytes(data).lower(),
+            block,
+        )
+
+    def get_or_call(self, address, data, call_kwargs, call):
+        """
+        Return the cached output of the call if it is cacheable, otherwise
+        make it with `call()` and cache its output if it is cacheable.
+        """
+        if not is_cacheable_call(call_kwargs):
+            return call()
+        key = self.get_key(address, data, call_kwargs['block'])
+        try:
+            output = self.load(key)
+        except KeyError:
+            with self._lock:
+                self.misses += 1
+            output = call()
+            self.store(key, output)
+            return output
+        with self._lock:
+            self.hits += 1
+        return output
+
+    def load(self, key):
+        raise NotImplementedError("Call caches must implement this method")
+
+    def store(self, key, output):
+        raise NotImplementedError("Call caches must implement this method")
+
+
+DEFAULT_CALL_CACHE_SIZE = 10000
+
+
+class LRUCallCache(CallCache):
+    """
+    In process call cache holding the `max_size` most recently used results.
+    """
+    def __init__(self, max_size=DEFAULT_CALL_CACHE_SIZE):
+        super(LRUCallCache, self).__init__()
+        self.max_size = max_size
+        self._outputs = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._outputs)
+
+    def load(self, key):
+        with self._lock:
+            output = self._outputs.pop(key)
+            self._outputs[key] = output
+        return output
+
+    def store(self, key, output):
+        with self._lock:
+            self._outputs.pop(key, None)
+            self._outputs[key] = output
+            while len(self._outputs) > self.max_size:
+                self._outputs.popitem(last=False)
+
+
+class SQLiteCallCache(CallCache):
+    """
+    Call cache stored in the sqlite database at `path`, which may be shared
+    by several processes.
+
+    Only the raw outputs returned by the client, hex strings or bytes, are
+    stored, as sqlite text or blobs, so reading the database never runs
+    code.  Outputs of other types are not cached.
+    """
+    def __init__(self, path):
+        super(SQLiteCallCache, self).__init__()
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS call_outputs ("
+                "address TEXT, data TEXT, block INTEGER, output, "
+                "PRIMARY KEY (address, data, block))"
+            )
+
+    def load(self, key):
+        address, data, block = key
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT output FROM call_outputs WHERE address = ? AND data = ? AND block = ?",
+                (address.decode('ascii'), data.decode('ascii'), block),
+            ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        output = row[0]
+        if isinstance(output, utils.text_types):
+            return output
+        # Blobs are returned as buffers on python 2.
+        return bytes(output)
+
+    def store(self, key, output):
+        if isinstance(output, bytes):
+            output = sqlite3.Binary(output)
+        elif not isinstance(output, utils.text_types):
+            return
+        address, data, block = key
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO call_outputs VALUES (?, ?, ?, ?)",
+                (address.decode('ascii'), data.decode('ascii'), block, output),
+            )
+
+    def close(self):
+        self._connection.close()
@@ -0,0 +1,151 @@
+"""
+Decoding of raw call data, such as the `input` of transactions, back into
+the contract function calls which produced it.
+"""
+import binascii
+import collections
+
+from eth_contract import utils
+from eth_contract.decoding import compile_decoder
+from eth_contract.logs import normalize_hex
+
+
+DecodedCall = collections.namedtuple(
+    'DecodedCall',
+    ('contract_name', 'function_name', 'args', 'function'),
+)
+
+abi_exceptions = utils.LazyModule('eth_abi.exceptions')
+
+
+def get_selector_key(data):
+    """
+    The lower case hex selector of hex encoded call data, or `None` if the
+    data is too short to have one.
+    """
+    data = utils.str_to_bytes(data)
+    if data[:2] == b'0x':
+        key = data[2:10]
+    else:
+        key = data[:8]
+    if len(key) != 8:
+        return None
+    return key.lower()
+
+
+class FunctionDecoder(object):
+    """
+    Precomputed decoding data for the call data of a single function.
+    """
+    __slots__ = ('contract_name', 'function', 'decoder')
+
+    def __init__(self, function, decoder, contract_name=None):
+        self.contract_name = contract_name
+        self.function = function
+        self.decoder = decoder
+
+    def decode(self, data):
+        """
+        Decode the arguments of hex encoded call data, returning `None` if it
+        is not a valid encoding of them.
+        """
+        data = utils.str_to_bytes(data)
+        if data[:2] == b'0x':
+            data = data[10:]
+        else:
+            data = data[8:]
+        try:
+            args = self.decoder(b'0x' + data)
+        except (abi_exceptions.DecodingError, ValueError, TypeError):
+            return None
+        return DecodedCall(self.contract_name, self.function.name, tuple(args), self.function)
+
+
+class CallDecoder(object):
+    """
+    Decodes raw call data for the functions of any number of contracts.
+
+    Functions, including each member of a `FunctionGroup`, are indexed by
+    their 4 byte selector so each call is matched with a single dictionary
+    lookup and unknown selectors are rejected without decoding anything.
+    Contracts registered with an address take precedence for calls to that
+    address, which disambiguates selectors shared by different functions.
+    """
+    def __init__(self, contracts=None):
+        self._by_selector = {}
+        self._by_address = {}
+        # Functions with the same input types share a decoder.
+        self._decoders = {}
+        for contract in contracts or []:
+            self.register(contract)
+
+    def register(self, contract, address=None):
+        """
+        Register the functions of `contract`, a contract class or instance.
+        Contract instances are registered for their own address.
+        """
+        if address is None and hasattr(contract, '_meta'):
+            address = contract._meta.address
+        for function in contract._config._functions:
+            for member in getattr(function, 'functions', [function]):
+                try:
+                    decoder = self._decoders[member.input_types]
+                except KeyError:
+                    decoder = self._decoders[member.input_types] = compile_decoder(
+                        member.input_types,
+                    )
+                function_decoder = FunctionDecoder(member, decoder, contract._config.name)
+                key = binascii.hexlify(member.encoded_abi_signature)
+                if address is not None:
+                    self._by_address[(normalize_hex(address), key)] = function_decoder
+                self._by_selector.setdefault(key, function_decoder)
+
+    def get_function_decoder(self, data, address=None):
+        key = get_selector_key(data)
+        if key is None:
+            return None
+        if address is not None and self._by_address:
+            function_decoder = self._by_address.get((normalize_hex(address), key))
+            if function_decoder is not None:
+                return function_decoder
+        return self._by_selector.get(key)
+
+    def decode_calldata(self, data, address=None):
+        """
+        Decode hex encoded call data, returning `None` if it matches no known
+        function.  `address` is the address the call was made to.
+        """
+        function_decoder = self.get_function_decoder(data, address)
+        if function_decoder is None:
+            return None
+        return function_decoder.decode(data)
+
+    def decode_calldata_many(self, data_list):
+        """
+        Decode a list of hex encoded call data, returning a list with `None`
+        for the call data which matches no known function.
+        """
+        by_selector = self._by_selector
+        decoded_calls = []
+        for data in data_list:
+            function_decoder = by_selector.get(get_selector_key(data))
+            if function_decoder is None:
+                decoded_calls.append(None)
+            else:
+                decoded_calls.append(function_decoder.decode(data))
+        return decoded_calls
+
+    def decode_transactions(self, transactions):
+        """
+        Lazily decode the `input` of an iterable of transactions, yielding a
+        `(transaction, decoded_call)` pair for each transaction which calls a
+        known function.
+        """
+        get_function_decoder = self.get_function_decoder
+        for transaction in transactions:
+            function_decoder = get_function_decoder(transaction['input'], transaction.get('to'))
+            if function_decoder is None:
+                continue
+            decoded_call = function_decoder.decode(transaction['input'])
+            if decoded_call is not None:
+                yield transaction, decoded_call
@@ -0,0 +1,88 @@
+import threading
+
+
+DEFAULT_MAX_CLIENTS = 8
+
+
+class ClientPool(object):
+    """
+    Thread safe blockchain client which spreads requests over a bounded pool
+    of clients created with `client_factory()`.
+
+    Each request checks a client out of the pool for its duration, so no
+    client is used by two threads at once and at most `max_clients` requests
+    are in flight; further requests wait for a client to be returned.  With
+    clients which keep their HTTP connection alive, the pool is a bounded
+    keep-alive connection pool.  Threads are given back the client they used
+    last whenever it is idle so they keep reusing the same session.
+
+    The pool exposes the methods of the clients it creates, so it can be
+    passed anywhere a blockchain client is expected.  It only supports
+    synchronous clients.
+    """
+    def __init__(self, client_factory, max_clients=DEFAULT_MAX_CLIENTS):
+        self.client_factory = client_factory
+        self.max_clients = max_clients
+        self.num_clients = 0
+        self._idle_clients = []
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_clients)
+        self._local = threading.local()
+
+    def acquire(self):
+        """
+        Check a client out of the pool, waiting for one if all of them are in
+        use.
+        """
+        self._semaphore.acquire()
+        try:
+            with self._lock:
+                client = getattr(self._local, 'client', None)
+                if client is not None and client in self._idle_clients:
+                    self._idle_clients.remove(client)
+                elif self._idle_clients:
+                    client = self._idle_clients.pop()
+                else:
+                    client = None
+                    self.num_clients += 1
+            if client is None:
+                try:
+                    client = self.client_factory()
+                except Exception:
+                    with self._lock:
+                        self.num_clients -= 1
+                    raise
+        except Exception:
+            self._semaphore.release()
+            raise
+        self._local.client = client
+        return client
+
+    def release(self, client):
+        with self._lock:
+            self._idle_clients.append(client)
+        self._semaphore.release()
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        client = self.acquire()
+        try:
+            attribute = getattr(client, name)
+        finally:
+            self.release(client)
+        if not callable(attribute):
+            return attribute
+
+        def method(*args, **kwargs):
+            client = self.acquire()
+            try:
+                return getattr(client, name)(*args, **kwargs)
+            finally:
+                self.release(client)
+        method.__name__ = name
+
+        # Cache the method so later lookups don't go through `__getattr__`.
+        self.__dict__[name] = method
+        return method
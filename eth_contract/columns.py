@@ -0,0 +1,184 @@
+"""
+Columnar decoding of many logs of a single event.
+
+The data and topics of all the logs are converted from hex in one step and
+each field is read as a column of 32 byte words at a fixed stride.  When
+numpy is installed the static fields are converted to numpy arrays with
+vectorized operations, otherwise each column is a list.
+"""
+import binascii
+import collections
+
+from eth_contract import utils
+from eth_contract.decoding import get_word_reader
+from eth_contract.utils import abi
+
+
+numpy = utils.LazyModule('numpy')
+
+_has_numpy = None
+
+
+def has_numpy():
+    global _has_numpy
+    if _has_numpy is None:
+        try:
+            numpy.ndarray
+        except ImportError:
+            _has_numpy = False
+        else:
+            _has_numpy = True
+    return _has_numpy
+
+
+def _join_hex(values):
+    return binascii.unhexlify(b''.join(
+        utils.strip_0x_prefix(utils.str_to_bytes(value)) for value in values
+    ))
+
+
+def _fixed_width_array(words, start, stop):
+    # A void dtype keeps every byte, `S` arrays would drop trailing zeros.
+    width = stop - start
+    return numpy.ascontiguousarray(words[:, start:stop]).view('V{0}'.format(width)).reshape(-1)
+
+
+def decode_word_array(buf, num_rows, stride, offset, _type, wide_ints_as_bytes=False):
+    """
+    Decode the static `_type` value at `offset` of each `stride` byte row of
+    `buf` into a numpy array.  Returns `None` for types without an array
+    representation.
+    """
+    try:
+        base, sub, arr_list = abi.process_type(_type)
+    except ValueError:
+        return None
+    if arr_list:
+        return None
+
+    rows = numpy.frombuffer(buf, dtype=numpy.uint8).reshape(num_rows, stride)
+    words = rows[:, offset:offset + 32]
+
+    if base in ('uint', 'int') and int(sub) <= 64:
+        if words[:, :24].any():
+            # Values which do not fit in 64 bits are decoded one at a time.
+            return None
+        values = numpy.ascontiguousarray(words[:, 24:]).view('>u8').reshape(-1)
+        values = values.astype(numpy.uint64)
+        if base == 'uint':
+            return values
+        bits = int(sub)
+        signed_values = values.astype(numpy.int64)
+        if bits < 64:
+            signed_values = numpy.where(
+                values >= 2 ** (bits - 1),
+                signed_values - 2 ** bits,
+                signed_values,
+            )
+        return signed_values
+    elif base in ('uint', 'int'):
+        if wide_ints_as_bytes:
+            return _fixed_width_array(words, 0, 32)
+        reader = get_word_reader(_type)
+        view = memoryview(buf)
+        values = numpy.empty(num_rows, dtype=object)
+        values[:] = [
+            reader(view[row_offset:row_offset + 32])
+            for row_offset in range(offset, num_rows * stride, stride)
+        ]
+        return values
+    elif base == 'bool':
+        return words[:, 31] != 0
+    elif base == 'address':
+        return _fixed_width_array(words, 12, 32)
+    elif base == 'bytes' and sub:
+        return _fixed_width_array(words, 0, int(sub))
+    return None
+
+
+def decode_word_list(buf, num_rows, stride, offset, reader):
+    view = memoryview(buf)
+    return [
+        reader(view[row_offset:row_offset + 32])
+        for row_offset in range(offset, num_rows * stride, stride)
+    ]
+
+
+def _to_column(values, as_arrays):
+    if not as_arrays:
+        return values
+    column = numpy.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def decode_log_columns(event, log_entries, indexed=False, as_arrays=None,
+                       wide_ints_as_bytes=False):
+    """
+    Decode the logs of `event` into an ordered dictionary of one column per
+    field.  See `Event.get_log_columns`.
+    """
+    if as_arrays is None:
+        as_arrays = has_numpy()
+    log_entries = list(log_entries)
+    num_rows = len(log_entries)
+    data_types = event._abi.output_types
+    stride = 32 * len(data_types)
+
+    columns = {}
+
+    data_hex = [utils.strip_0x_prefix(utils.str_to_bytes(log['data'])) for log in log_entries]
+    data_readers = [get_word_reader(_type) for _type in data_types]
+    is_static = (
+        all(reader is not None for reader in data_readers) and
+        all(len(data) == 2 * stride for data in data_hex)
+    )
+    if is_static:
+        buf = binascii.unhexlify(b''.join(data_hex))
+        for position, (output, reader) in enumerate(zip(event.outputs, data_readers)):
+            column = None
+            if as_arrays:
+                column = decode_word_array(
+                    buf, num_rows, stride, 32 * position, output['type'], wide_ints_as_bytes,
+                )
+            if column is None:
+                column = _to_column(
+                    decode_word_list(buf, num_rows, stride, 32 * position, reader),
+                    as_arrays,
+                )
+            columns[output['name']] = column
+    else:
+        rows = [event.cast_return_data(log['data'], raw=True) for log in log_entries]
+        for position, output in enumerate(event.outputs):
+            columns[output['name']] = _to_column([row[position] for row in rows], as_arrays)
+
+    if indexed:
+        indexed_inputs = [_input for _input in event.inputs if _input['indexed']]
+        for position, _input in enumerate(indexed_inputs):
+            # Indexed values are the last topics, after the event topic.
+            topics = [
+                log['topics'][len(log['topics']) - len(indexed_inputs) + position]
+                for log in log_entries
+            ]
+            reader = get_word_reader(_input['type'])
+            column = None
+            if reader is None:
+                column = _to_column(
+                    [abi.decode_single(_input['type'], topic) for topic in topics],
+                    as_arrays,
+                )
+            else:
+                buf = _join_hex(topics)
+                if as_arrays:
+                    column = decode_word_array(
+                        buf, num_rows, 32, 0, _input['type'], wide_ints_as_bytes,
+                    )
+                if column is None:
+                    column = _to_column(decode_word_list(buf, num_rows, 32, 0, reader), as_arrays)
+            columns[_input['name']] = column
+
+    return collections.OrderedDict(
+        (_input['name'], columns[_input['name']])
+        for _input in event.inputs
+        if _input['name'] in columns
+    )
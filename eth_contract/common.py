@@ -1,22 +1,294 @@
-from rlp.utils import (
-    int_to_big_endian,
-    big_endian_to_int,
-)
-from eth_abi import decode_abi
-from eth_abi.utils import (
-    zpad,
-)
+import weakref
+
+from eth_contract.decoding import compile_decoder
+from eth_contract.encoding import compile_static_encoder
 from eth_contract.utils import (
+    int_types,
+    rlp_utils,
     sha3,
     str_to_bytes,
 )
 
 
+class CompiledABI(object):
+    """
+    Immutable, precomputed ABI data for a single function or event.  This is
+    computed once when the `Function` or `Event` is created and is shared by
+    every contract instance which uses it.
+
+    `encoder` is a `StaticEncoder` when every input is a static type and
+    `None` otherwise.  `decoder` is a `StaticDecoder` when every output is a
+    static type and the generic `decode_abi` otherwise.
+    """
+    _fields = (
+        'name',
+        'input_types',
+        'output_types',
+        'signature',
+        'abi_signature',
+        'encoded_abi_signature',
+        'event_topic',
+        'encoder',
+        'decoder',
+    )
+    __slots__ = _fields + ('__weakref__',)
+
+    def __init__(self, name, input_types, output_types):
+        input_types = tuple(input_types)
+        output_types = tuple(output_types)
+        signature = str_to_bytes("{name}({arg_types})".format(
+            name=name,
+            arg_types=','.join(input_types),
+        ))
+        signature_hash = sha3(signature)
+        selector = signature_hash[:4]
+
+        values = {
+            'name': name,
+            'input_types': input_types,
+            'output_types': output_types,
+            'signature': signature,
+            'abi_signature': rlp_utils.big_endian_to_int(signature_hash[:4]),
+            'encoded_abi_signature': selector,
+            'event_topic': b'0x' + rlp_utils.encode_hex(signature_hash),
+            'encoder': compile_static_encoder(selector, input_types),
+            'decoder': compile_decoder(output_types),
+        }
+        for key, value in values.items():
+            object.__setattr__(self, key, value)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("CompiledABI objects are immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError("CompiledABI objects are immutable")
+
+    def __reduce__(self):
+        return (
+            _restore_compiled_abi,
+            (tuple(getattr(self, field) for field in self._fields),),
+        )
+
+    @property
+    def key(self):
+        return (self.name, self.input_types, self.output_types)
+
+
+def _restore_compiled_abi(values):
+    compiled_abi = CompiledABI.__new__(CompiledABI)
+    for field, value in zip(CompiledABI._fields, values):
+        object.__setattr__(compiled_abi, field, value)
+    return compiled_abi
+
+
+# Process wide registry of compiled ABI data so that identical functions and
+# events across contract classes are only compiled once.  Entries are dropped
+# once no function or event uses them.
+_compiled_abis = weakref.WeakValueDictionary()
+
+
+def get_compiled_abi(name, input_types, output_types):
+    key = (name, tuple(input_types), tuple(output_types))
+    compiled_abi = _compiled_abis.get(key)
+    if compiled_abi is None:
+        compiled_abi = _compiled_abis.setdefault(key, CompiledABI(*key))
+    return compiled_abi
+
+
+def register_compiled_abi(compiled_abi):
+    """
+    Add already compiled ABI data (e.g. loaded from an `ABICache`) to the
+    registry.
+    """
+    return _compiled_abis.setdefault(compiled_abi.key, compiled_abi)
+
+
+class ABIParam(object):
+    """
+    Compact, immutable description of a function or event parameter.  Like
+    the ABI dictionaries it replaces it supports `param['name']`,
+    `param['type']` and `param['indexed']`, which is `None` for function
+    parameters, and it compares equal to its `(name, type, indexed)` tuple.
+    """
+    __slots__ = ('name', 'type', 'indexed', '_hash', '__weakref__')
+
+    _fields = ('name', 'type', 'indexed')
+
+    def __init__(self, name, _type, indexed=None):
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'type', _type)
+        object.__setattr__(self, 'indexed', indexed)
+        object.__setattr__(self, '_hash', hash((name, _type, indexed)))
+
+    def __setattr__(self, key, value):
+        raise AttributeError("ABIParam objects are immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError("ABIParam objects are immutable")
+
+    def __reduce__(self):
+        return (ABIParam, tuple(self))
+
+    def __iter__(self):
+        return iter((self.name, self.type, self.indexed))
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __eq__(self, other):
+        if isinstance(other, (ABIParam, tuple)):
+            return (self.name, self.type, self.indexed) == tuple(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return self._hash
+
+    def __getitem__(self, key):
+        if isinstance(key, int_types + (slice,)):
+            return tuple(self)[key]
+        elif key in self._fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self):
+        return "ABIParam(name={0!r}, type={1!r}, indexed={2!r})".format(*self)
+
+    def to_dict(self):
+        param = {'name': self.name, 'type': self.type}
+        if self.indexed is not None:
+            param['indexed'] = self.indexed
+        return param
+
+
+class ABIParams(object):
+    """
+    Immutable sequence of the `ABIParam` of a function or event, which
+    compares equal to the tuple of its parameters.  Unlike a tuple it can be
+    weakly referenced, so the interned lists can be released.
+    """
+    __slots__ = ('_params', '_hash', '__weakref__')
+
+    def __init__(self, params):
+        params = tuple(params)
+        object.__setattr__(self, '_params', params)
+        object.__setattr__(self, '_hash', hash(params))
+
+    def __setattr__(self, key, value):
+        raise AttributeError("ABIParams objects are immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError("ABIParams objects are immutable")
+
+    def __reduce__(self):
+        return (ABIParams, (self._params,))
+
+    def __iter__(self):
+        return iter(self._params)
+
+    def __len__(self):
+        return len(self._params)
+
+    def __getitem__(self, key):
+        return self._params[key]
+
+    def __eq__(self, other):
+        if isinstance(other, ABIParams):
+            return self._params == other._params
+        elif isinstance(other, tuple):
+            return self._params == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return "ABIParams({0!r})".format(self._params)
+
+
+# Process wide registries so that identical parameters, parameter lists,
+# functions and events are only held in memory once, however many contract
+# classes use them.  Entries are dropped once nothing uses them.
+_abi_params = weakref.WeakValueDictionary()
+_abi_param_lists = weakref.WeakValueDictionary()
+_definitions = weakref.WeakValueDictionary()
+
+
+def _get_abi_param(key):
+    param = _abi_params.get(key)
+    if param is None:
+        param = _abi_params.setdefault(key, ABIParam(*key))
+    return param
+
+
+def get_abi_params(params):
+    """
+    Return the interned `ABIParams` for a list of ABI parameter dictionaries.
+    """
+    key = tuple(
+        (param['name'], param['type'], param.get('indexed'))
+        for param in params or ()
+    )
+    abi_params = _abi_param_lists.get(key)
+    if abi_params is None:
+        abi_params = _abi_param_lists.setdefault(
+            key,
+            ABIParams(_get_abi_param(param_key) for param_key in key),
+        )
+    return abi_params
+
+
+def get_definition(key, factory):
+    """
+    Return the function or event registered under `key`, creating it with
+    `factory()` the first time.
+    """
+    definition = _definitions.get(key)
+    if definition is None:
+        definition = _definitions.setdefault(key, factory())
+    return definition
+
+
 class ContractBound(object):
     _contract = None
+    _abi = None
+
+    def _bound_to(self, contract):
+        bound = self.__copy__()
+        bound._contract = contract
+        return bound
 
-    def _bind(self, contract):
-        self._contract = contract
+    def __get__(self, obj, type=None):
+        if obj is None:
+            return self
+        return self._bound_to(obj)
+
+    def _compile(self):
+        self._abi = get_compiled_abi(
+            self.name,
+            (i['type'] for i in self.inputs or []),
+            (o['type'] for o in self.outputs or []),
+        )
+
+    def __copy__(self):
+        # Copies share the compiled ABI data rather than recomputing it.
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._contract = None
+        return clone
 
     @property
     def contract(self):
@@ -32,42 +304,34 @@ class ContractBound(object):
         """
         Iterable of the types this function takes.
         """
-        if self.inputs:
-            return [i['type'] for i in self.inputs]
-        return []
+        return self._abi.input_types
 
     @property
     def signature(self):
-        signature = "{name}({arg_types})".format(
-            name=self.name,
-            arg_types=','.join(self.input_types),
-        )
-        return str_to_bytes(signature)
+        return self._abi.signature
 
     @property
     def abi_signature(self):
         """
         Compute the bytes4 signature for the object.
         """
-        return big_endian_to_int(sha3(str_to_bytes(self.signature))[:4])
+        return self._abi.abi_signature
 
     @property
     def encoded_abi_signature(self):
-        return zpad(int_to_big_endian(self.abi_signature), 4)
+        return self._abi.encoded_abi_signature
 
     @property
     def output_types(self):
         """
         Iterable of the types this function takes.
         """
-        if self.outputs:
-            return [i['type'] for i in self.outputs]
-        return []
+        return self._abi.output_types
 
     def cast_return_data(self, outputs, raw=False):
-        values = decode_abi(self.output_types, outputs)
+        values = self._abi.decoder(outputs)
 
-        if not raw and len(self.output_types) == 1:
+        if not raw and len(self._abi.output_types) == 1:
             return values[0]
 
         return values
@@ -1,29 +1,45 @@
-import copy
 import hashlib
 import collections
-import itertools
-
-from rlp.utils import (
-    encode_hex,
-)
 
 from eth_contract.functions import (
     Function,
     FunctionGroup,
 )
 from eth_contract.events import Event
+from eth_contract.batch import (
+    DEFAULT_BATCH_SIZE,
+    Batch,
+)
+from eth_contract.logs import (
+    LogDecoder,
+    normalize_hex,
+)
+from eth_contract.receipts import get_transaction_receipts
 from eth_contract.utils import (
+    rlp_utils,
     str_to_bytes,
 )
 
 
 class ContractBase(object):
-    def __init__(self, address, blockchain_client):
-        functions = {fn.name: fn for fn in (copy.copy(f) for f in self._config._functions)}
-        events = {ev.name: ev for ev in (copy.copy(e) for e in self._config._events)}
-        for obj in itertools.chain(functions.values(), events.values()):
-            obj._bind(self)
-        self._meta = ContractMeta(address, blockchain_client, functions, events)
+    function_class = Function
+    function_group_class = FunctionGroup
+    event_class = Event
+    batch_class = Batch
+
+    def __init__(self, address, blockchain_client, call_cache=None, gas_strategy=None,
+                 nonce_manager=None, receipt_watcher=None, instrument=None):
+        # Functions and events are bound lazily when they are accessed on the
+        # instance so that instantiation does not depend on the ABI size.
+        self._meta = ContractMeta(
+            address,
+            blockchain_client,
+            call_cache,
+            gas_strategy,
+            nonce_manager,
+            receipt_watcher,
+            instrument,
+        )
 
     def __str__(self):
         return "{name}({address})".format(name=self.__class__.__name__, address=self.address)
@@ -34,7 +50,7 @@ class ContractBase(object):
         if args:
             if cls._config.constructor is None:
                 raise ValueError("This contract does not appear to have a constructor")
-            data += encode_hex(cls._config.constructor.abi_args_signature(args))
+            data += rlp_utils.encode_hex(cls._config.constructor.abi_args_signature(args))
 
         return data
 
@@ -44,16 +60,73 @@ class ContractBase(object):
     def get_balance(self, block="latest"):
         return self._meta.blockchain_client.get_balance(self._meta.address, block=block)
 
+    def batch(self, **kwargs):
+        return self.batch_class(self, **kwargs)
+
+    def get_transaction_events(self, txn_hash):
+        """
+        Fetch the receipt of `txn_hash` once and decode every log this
+        contract emitted in it into a `DecodedLog`, in log order.  Returns
+        `None` if the transaction has not been mined.
+        """
+        txn_receipt = self._meta.blockchain_client.get_transaction_receipt(txn_hash)
+        return get_receipt_events(self, txn_receipt)
+
+    def get_transaction_events_many(self, txn_hashes, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        `get_transaction_events` for each of `txn_hashes`, fetching the
+        receipts with `eth_contract.receipts.get_transaction_receipts`.
+        """
+        txn_receipts = get_transaction_receipts(
+            self._meta.blockchain_client,
+            txn_hashes,
+            batch_size,
+        )
+        return [get_receipt_events(self, txn_receipt) for txn_receipt in txn_receipts]
+
+
+def get_receipt_events(contract, txn_receipt):
+    """
+    Decode the logs `contract` emitted in `txn_receipt` into a list of
+    `DecodedLog`, or return `None` if there is no receipt.
+    """
+    if txn_receipt is None:
+        return None
+    address = normalize_hex(contract._meta.address)
+    get_event_decoder = contract._config.get_log_decoder().get_event_decoder
+    decoded_logs = []
+    for log_entry in txn_receipt['logs']:
+        if normalize_hex(log_entry['address']) != address:
+            continue
+        decoder = get_event_decoder(log_entry)
+        if decoder is not None:
+            decoded_logs.append(decoder.decode(log_entry))
+    return decoded_logs
+
 
 class ContractMeta(object):
     """
     Instance level contract data.
     """
-    def __init__(self, address, blockchain_client, functions, events):
+    __slots__ = (
+        'address',
+        'blockchain_client',
+        'call_cache',
+        'gas_strategy',
+        'nonce_manager',
+        'receipt_watcher',
+        'instrument',
+    )
+
+    def __init__(self, address, blockchain_client, call_cache=None, gas_strategy=None,
+                 nonce_manager=None, receipt_watcher=None, instrument=None):
         self.address = address
         self.blockchain_client = blockchain_client
-        self.functions = functions
-        self.events = events
+        self.call_cache = call_cache
+        self.gas_strategy = gas_strategy
+        self.nonce_manager = nonce_manager
+        self.receipt_watcher = receipt_watcher
+        self.instrument = instrument
 
 
 class Config(object):
@@ -64,21 +137,95 @@ class Config(object):
                  contract_name=None):
         self.code = str_to_bytes(code)
         self.source = source
-        self.abi = abi
+        self._abi = abi
         self._functions = functions
         self._events = events
         self.constructor = constructor
         self.name = contract_name
+        self._log_decoder = None
+
+    @property
+    def abi(self):
+        """
+        The ABI definition, rebuilt from the contract's functions and events
+        if the contract class is compact.
+        """
+        if self._abi is not None:
+            return self._abi
+        abi = [
+            member.to_abi()
+            for function in self._functions
+            for member in getattr(function, 'functions', [function])
+        ]
+        abi.extend(event.to_abi() for event in self._events)
+        if self.constructor is not None:
+            abi.append(self.constructor.to_abi())
+        return abi
+
+    def get_log_decoder(self):
+        """
+        A `LogDecoder` for the contract's events, built on first use.
+        """
+        if self._log_decoder is None:
+            log_decoder = LogDecoder()
+            log_decoder.register_events(self._events, self.name)
+            self._log_decoder = log_decoder
+        return self._log_decoder
+
+    def get_compiled_abis(self):
+        """
+        The compiled ABI data of every function, event and the constructor.
+        """
+        for function in self._functions:
+            for member in getattr(function, 'functions', [function]):
+                yield member._abi
+        for event in self._events:
+            yield event._abi
+        if self.constructor is not None:
+            yield self.constructor._abi
+
+
+class ContractDocstring(object):
+    """
+    Generates the solidity like docstring of a contract class the first
+    time it is accessed, rather than for every class that is built.
+    """
+    template = """
+    contract {contract_name} {{
+    // Events
+    {events}
+
+    // Functions
+    {functions}
+    }}
+    """
+
+    def __init__(self):
+        self.docstring = None
+
+    def __get__(self, instance, owner):
+        if self.docstring is None:
+            config = owner._config
+            self.docstring = self.template.format(
+                contract_name=config.name,
+                functions='\n'.join(str(f) for f in config._functions),
+                events='\n'.join(str(e) for e in config._events),
+            )
+        return self.docstring
 
 
-def Contract(contract_meta, contract_name=None):
+def Contract(contract_meta, contract_name=None, base=ContractBase, abi_cache=None,
+             compact=False):
     _abi = contract_meta['info']['abiDefinition']
     code = contract_meta['code']
-    source = contract_meta['info']['source']
+    source = None if compact else contract_meta['info']['source']
 
     if contract_name is None:
         contract_name = "Unknown-{0}".format(hashlib.md5(code).hexdigest())
 
+    if abi_cache is not None:
+        cached_abis = abi_cache.load(_abi)
+
     functions = []
     events = []
     constructor = None
@@ -99,22 +246,13 @@ def Contract(contract_meta, contract_name=None):
         if signature_item['type'] == 'function':
             # make sure we're not overwriting a signature
 
-            func = Function(
-                name=signature_item['name'],
-                inputs=signature_item['inputs'],
-                outputs=signature_item['outputs'],
-                constant=signature_item['constant'],
-            )
+            func = base.function_class.from_abi(signature_item)
             _functions[signature_item['name']].append(func)
         elif signature_item['type'] == 'event':
             if signature_item['name'] in _dict:
                 # TODO: handle namespace conflicts
                 raise ValueError("About to overwrite a function signature for duplicate function name {0}".format(signature_item['name']))  # NOQA
-            event = Event(
-                name=signature_item['name'],
-                inputs=signature_item['inputs'],
-                anonymous=signature_item['anonymous'],
-            )
+            event = base.event_class.from_abi(signature_item)
             _dict[signature_item['name']] = event
             events.append(event)
         else:
@@ -126,27 +264,17 @@ def Contract(contract_meta, contract_name=None):
             _dict[fn_name] = fn_list[0]
             functions.append(fn_list[0])
         else:
-            fn_group = FunctionGroup(fn_list)
+            fn_group = base.function_group_class(fn_list)
             _dict[fn_name] = fn_group
             functions.append(fn_group)
 
-    docstring = """
-    contract {contract_name} {{
-    // Events
-    {events}
-
-    // Functions
-    {functions}
-    }}
-    """.format(
-        contract_name=contract_name,
-        functions='\n'.join(str(f) for f in functions),
-        events='\n'.join(str(e) for e in events),
-    )
-
-    _dict['__doc__'] = docstring
+    if not compact:
+        _dict['__doc__'] = ContractDocstring()
     _dict['_config'] = Config(
-        code, source, _abi, functions, events, constructor, contract_name,
+        code, source, None if compact else _abi, functions, events, constructor, contract_name,
     )
 
-    return type(str(contract_name), (ContractBase,), _dict)
+    if abi_cache is not None and cached_abis is None:
+        abi_cache.store(_abi, _dict['_config'].get_compiled_abis())
+
+    return type(str(contract_name), (base,), _dict)
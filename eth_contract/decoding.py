@@ -0,0 +1,122 @@
+"""
+Fast path ABI decoding for functions whose outputs are all static types.
+
+The raw output is converted to bytes at most once and each 32 byte word is
+read through a memoryview.  Outputs which are not the expected size fall
+back to the generic `eth_abi` decoder.
+"""
+import binascii
+import functools
+import sys
+
+from eth_contract import utils
+from eth_contract.utils import (
+    abi,
+    abi_utils,
+)
+
+
+if sys.version_info.major == 2:
+    def word_to_int(word):
+        return int(binascii.hexlify(word), 16)
+else:
+    def word_to_int(word):
+        return int.from_bytes(word, 'big')
+
+
+def _read_uint(word):
+    return word_to_int(word)
+
+
+def _read_int(bits, word):
+    value = word_to_int(word)
+    if value >= 2 ** (bits - 1):
+        return value - 2 ** bits
+    return value
+
+
+def _read_bool(word):
+    return bool(word_to_int(word))
+
+
+def _read_address(word):
+    return binascii.hexlify(word[12:])
+
+
+def _read_fixed_bytes(length, word):
+    return word[:length].tobytes()
+
+
+def get_word_reader(_type):
+    """
+    Return the function which reads a value of the static `_type` from a 32
+    byte word, or `None` if `_type` has no fast path.
+    """
+    try:
+        base, sub, arr_list = abi.process_type(_type)
+    except ValueError:
+        return None
+
+    if arr_list:
+        return None
+    elif base == 'uint':
+        return _read_uint
+    elif base == 'int':
+        return functools.partial(_read_int, int(sub))
+    elif base == 'bool':
+        return _read_bool
+    elif base == 'address':
+        return _read_address
+    elif base == 'bytes' and sub:
+        return functools.partial(_read_fixed_bytes, int(sub))
+    return None
+
+
+def _has_0x_prefix(value):
+    return value[:2] == b'0x' or value[:2] == '0x'
+
+
+class StaticDecoder(object):
+    """
+    Decodes the output of a function whose outputs are all static types.
+    """
+    __slots__ = ('output_types', 'readers', 'size')
+
+    def __init__(self, output_types, readers):
+        self.output_types = tuple(output_types)
+        self.readers = tuple(readers)
+        self.size = 32 * len(self.readers)
+
+    def _to_bytes(self, output):
+        if isinstance(output, utils.text_types) and _has_0x_prefix(output):
+            if len(output) != 2 + 2 * self.size:
+                return None
+            try:
+                return binascii.unhexlify(output[2:])
+            except (TypeError, ValueError):
+                return None
+        if not isinstance(output, bytes) or abi_utils.is_hex_encoded_value(output):
+            return None
+        return output
+
+    def __call__(self, output):
+        data = self._to_bytes(output)
+        if data is None or len(data) < self.size:
+            return abi.decode_abi(self.output_types, output)
+
+        view = memoryview(data)
+        return [
+            reader(view[offset:offset + 32])
+            for offset, reader in zip(range(0, self.size, 32), self.readers)
+        ]
+
+
+def compile_decoder(output_types):
+    """
+    Return a `StaticDecoder` for `output_types` if all of them have a fast
+    path, otherwise the generic decoder.
+    """
+    readers = [get_word_reader(_type) for _type in output_types]
+    if any(reader is None for reader in readers):
+        return functools.partial(abi.decode_abi, tuple(output_types))
+    return StaticDecoder(output_types, readers)
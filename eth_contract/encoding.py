@@ -0,0 +1,172 @@
+"""
+Fast path ABI encoding for functions whose inputs are all static types.
+
+Arguments are written directly into a preallocated buffer holding the 4 byte
+selector followed by one 32 byte word per argument.  Any argument which is
+not in one of the common, unambiguous forms makes the encoder return `None`
+so that the caller falls back to the generic `eth_abi` encoder, which keeps
+the exact same behaviour (and errors) for the uncommon cases.
+"""
+import binascii
+import functools
+
+from eth_contract import utils
+from eth_contract.utils import (
+    abi,
+    rlp_utils,
+)
+
+
+def _write_uint(upper_bound, buf, offset, arg):
+    if type(arg) not in utils.int_types or not 0 <= arg < upper_bound:
+        return False
+    if arg:
+        value = rlp_utils.int_to_big_endian(arg)
+        buf[offset + 32 - len(value):offset + 32] = value
+    return True
+
+
+def _write_int(bound, buf, offset, arg):
+    if type(arg) not in utils.int_types or not -bound <= arg < bound:
+        return False
+    if arg:
+        value = rlp_utils.int_to_big_endian(arg % (2 * bound))
+        buf[offset + 32 - len(value):offset + 32] = value
+    return True
+
+
+def _write_bool(buf, offset, arg):
+    if type(arg) is not bool:
+        return False
+    if arg:
+        buf[offset + 31] = 1
+    return True
+
+
+def _write_address(buf, offset, arg):
+    if not isinstance(arg, utils.text_types):
+        return False
+    arg = utils.str_to_bytes(arg)
+    if len(arg) == 42:
+        arg = utils.strip_0x_prefix(arg)
+    if len(arg) != 40:
+        return False
+    try:
+        buf[offset + 12:offset + 32] = binascii.unhexlify(arg)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _write_fixed_bytes(max_length, buf, offset, arg):
+    if not isinstance(arg, utils.text_types):
+        return False
+    arg = utils.str_to_bytes(arg)
+    if len(arg) > max_length:
+        return False
+    buf[offset:offset + len(arg)] = arg
+    return True
+
+
+def get_word_writer(_type):
+    """
+    Return the function which writes an argument of the static `_type` into
+    a 32 byte word, or `None` if `_type` has no fast path.
+    """
+    try:
+        base, sub, arr_list = abi.process_type(_type)
+    except ValueError:
+        return None
+
+    if arr_list:
+        return None
+    elif base == 'uint':
+        return functools.partial(_write_uint, 2 ** int(sub))
+    elif base == 'int':
+        return functools.partial(_write_int, 2 ** (int(sub) - 1))
+    elif base == 'bool':
+        return _write_bool
+    elif base == 'address':
+        return _write_address
+    elif base == 'bytes' and sub:
+        return functools.partial(_write_fixed_bytes, int(sub))
+    return None
+
+
+class StaticEncoder(object):
+    """
+    Encodes a call to a function whose inputs are all static types.
+    """
+    __slots__ = ('selector', 'writers')
+
+    def __init__(self, selector, writers):
+        self.selector = selector
+        self.writers = tuple(writers)
+
+    def encode(self, args):
+        """
+        Return a bytearray of the selector followed by the encoded `args`, or
+        `None` if the arguments need the generic encoder.
+        """
+        if len(args) != len(self.writers):
+            return None
+        buf = bytearray(4 + 32 * len(self.writers))
+        buf[:4] = self.selector
+        offset = 4
+        for writer, arg in zip(self.writers, args):
+            if not writer(buf, offset, arg):
+                return None
+            offset += 32
+        return buf
+
+    def encode_hex(self, args):
+        buf = self.encode(args)
+        if buf is None:
+            return None
+        return binascii.hexlify(buf)
+
+    def encode_hex_many(self, args_list):
+        """
+        Return the hex encoded call data for each tuple of arguments in
+        `args_list`, with `None` for those which need the generic encoder.
+        Every call is written into a single buffer which is hex encoded at
+        once.
+        """
+        size = 4 + 32 * len(self.writers)
+        buf = bytearray(size * len(args_list))
+        failed = []
+        offset = 0
+        for index, args in enumerate(args_list):
+            if len(args) != len(self.writers):
+                failed.append(index)
+                offset += size
+                continue
+            buf[offset:offset + 4] = self.selector
+            word_offset = offset + 4
+            for writer, arg in zip(self.writers, args):
+                if not writer(buf, word_offset, arg):
+                    failed.append(index)
+                    break
+                word_offset += 32
+            offset += size
+
+        hex_data = binascii.hexlify(buf)
+        hex_size = 2 * size
+        call_data = [
+            hex_data[hex_offset:hex_offset + hex_size]
+            for hex_offset in range(0, len(hex_data), hex_size)
+        ]
+        for index in failed:
+            call_data[index] = None
+        return call_data
+
+
+def compile_static_encoder(selector, input_types):
+    """
+    Return a `StaticEncoder` for `input_types`, or `None` if any of them is
+    not a static type with a fast path.
+    """
+    writers = [get_word_writer(_type) for _type in input_types]
+    if any(writer is None for writer in writers):
+        return None
+    return StaticEncoder(selector, writers)
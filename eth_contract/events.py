@@ -1,12 +1,18 @@
-from rlp.utils import (
-    encode_hex,
+from eth_contract.columns import decode_log_columns
+from eth_contract.common import (
+    ContractBound,
+    get_abi_params,
+    get_definition,
 )
-from eth_abi import (
-    decode_single,
+from eth_contract.instrument import RPC
+from eth_contract.logs import (
+    EventDecoder,
+    scan_logs,
+)
+from eth_contract.utils import (
+    abi,
+    rlp_utils,
 )
-
-from eth_contract import utils
-from eth_contract.common import ContractBound
 
 
 class Event(ContractBound):
@@ -23,20 +29,37 @@ class Event(ContractBound):
     """
     def __init__(self, name, inputs, anonymous):
         self.name = name
-        self.inputs = inputs
+        self.inputs = get_abi_params(inputs)
         self.anonymous = anonymous
+        self._compile()
 
-    def __call__(self, *args):
-        pass
+    @classmethod
+    def from_abi(cls, signature_item):
+        """
+        Return the event for an ABI event definition.  Identical definitions
+        share a single event across all contract classes.
+        """
+        name = signature_item['name']
+        inputs = get_abi_params(signature_item['inputs'])
+        anonymous = signature_item['anonymous']
+        return get_definition(
+            (cls, name, inputs, anonymous),
+            lambda: cls(name, inputs, anonymous),
+        )
 
-    def __copy__(self):
-        return self.__class__(self.name, self.inputs, self.anonymous)
+    def to_abi(self):
+        """
+        The ABI definition of this event.
+        """
+        return {
+            'type': 'event',
+            'name': self.name,
+            'anonymous': self.anonymous,
+            'inputs': [param.to_dict() for param in self.inputs],
+        }
 
-    def __get__(self, obj, type=None):
-        if obj is None:
-            return self
-        else:
-            return obj._meta.events[self.name]
+    def __call__(self, *args):
+        pass
 
     @property
     def outputs(self):
@@ -44,15 +67,50 @@ class Event(ContractBound):
 
     @property
     def event_topic(self):
-        return b'0x' + encode_hex(utils.sha3(self.signature))
+        return self._abi.event_topic
 
     def get_transaction_logs(self, txn_hash):
+        instrument = self.contract._meta.instrument
+        if instrument is not None:
+            start = instrument.timer()
         txn_receipt = self.contract._meta.blockchain_client.get_transaction_receipt(txn_hash)
         if txn_receipt is None:
-            return None
-        return [
-            log for log in txn_receipt['logs'] if self.event_topic in log['topics']
-        ]
+            logs = None
+        else:
+            logs = [
+                log for log in txn_receipt['logs'] if self.event_topic in log['topics']
+            ]
+        if instrument is not None:
+            instrument.mark(self, RPC, start, logs)
+        return logs
+
+    def scan(self, from_block, to_block, **kwargs):
+        """
+        Lazily yield a `DecodedLog` for each of this event's logs emitted by
+        the contract between `from_block` and `to_block` (inclusive), which
+        are block numbers, `'earliest'`, `'latest'` or `'pending'`.  Logs are
+        fetched with `get_logs` in adaptively sized block ranges; see
+        `eth_contract.logs.scan_logs` for the keyword arguments.
+        """
+        decoder, filter_params = self._get_scan_filter()
+        kwargs.update(filter_params)
+        log_entries = scan_logs(
+            self.contract._meta.blockchain_client,
+            from_block,
+            to_block,
+            **kwargs
+        )
+        for log_entry in log_entries:
+            yield decoder.decode(log_entry)
+
+    def _get_scan_filter(self):
+        if self.anonymous:
+            raise ValueError("Anonymous events cannot be scanned for by topic")
+        decoder = EventDecoder(self, self.contract._config.name)
+        return decoder, {
+            'address': self.contract._meta.address,
+            'topics': [rlp_utils.bytes_to_str(self.event_topic)],
+        }
 
     def get_log_data(self, log_entry, indexed=False):
         values = self.cast_return_data(log_entry['data'], raw=True)
@@ -62,8 +120,24 @@ class Event(ContractBound):
         if indexed:
             for idx, _input in enumerate(self.inputs):
                 if _input['indexed']:
-                    event_data[_input['name']] = decode_single(
+                    event_data[_input['name']] = abi.decode_single(
                         _input['type'],
                         log_entry['topics'][idx + 1],
                     )
         return event_data
+
+    def get_log_columns(self, log_entries, indexed=False, as_arrays=None,
+                        wide_ints_as_bytes=False):
+        """
+        Decode `log_entries` into an ordered dictionary mapping each field
+        name to a column holding that field's value for every log, in order.
+
+        With `as_arrays` (the default when numpy is installed) the columns
+        are numpy arrays: integers of up to 64 bits are `uint64` or `int64`,
+        wider integers are object arrays of python ints (or 32 byte `V32`
+        arrays with `wide_ints_as_bytes`), addresses are 20 byte `V20` arrays,
+        `bytesN` values are `VN` arrays and booleans are `bool` arrays.  Other
+        types, and all fields of events with dynamic data, are object arrays.
+        Otherwise the columns are lists of the values `get_log_data` returns.
+        """
+        return decode_log_columns(self, log_entries, indexed, as_arrays, wide_ints_as_bytes)
@@ -1,67 +1,192 @@
-from rlp.utils import (
-    encode_hex,
+import collections
+import copy
+import functools
+
+from eth_contract.batch import chunks
+from eth_contract.common import (
+    ContractBound,
+    get_abi_params,
+    get_definition,
+)
+from eth_contract.gas import (  # NOQA
+    DEFAULT_GAS_STRATEGY,
+    GAS_LIMIT_FRACTION,
+)
+from eth_contract.instrument import (
+    DECODE,
+    ENCODE,
+    RPC,
+    WAIT,
+)
+from eth_contract.receipts import ReceiptWatcher
+from eth_contract import utils
+from eth_contract.utils import (
+    abi,
+    rlp_utils,
 )
 
-from eth_abi import abi
 
-from eth_contract.common import ContractBound
-from eth_contract import utils
+_validators = {}
 
+# Number of calls encoded by each task when `get_call_data_many` is given a
+# process pool.
+DEFAULT_CHUNK_SIZE = 10000
 
-def validate_argument(_type, value):
+
+def get_validator(_type):
+    """
+    Return the compiled validator for `_type`, compiling it on first use.
+    """
+    try:
+        return _validators[_type]
+    except KeyError:
+        validator = _validators[_type] = compile_validator(_type)
+        return validator
+
+
+def compile_validator(_type):
+    """
+    Parse `_type` once and return a function which checks whether a python
+    value can be used as an argument of that type.  The returned function has
+    a `python_types` attribute with the python types it can ever accept, or
+    `None` if that cannot be determined from the type alone.
+    """
     base, sub, arr_list = abi.process_type(_type)
 
     if arr_list:
         arr_value, remainder = arr_list[-1], arr_list[:-1]
-        if arr_value and len(value) != arr_value[0]:
-            return False
         subtype = ''.join((base, sub, ''.join((str(v) for v in remainder))))
-        return all(validate_argument(subtype, v) for v in value)
-    elif base == 'int':
-        if not isinstance(value, utils.int_types):
-            return False
-        exp = int(sub)
-        lower_bound = -1 * 2 ** exp // 2
-        upper_bound = (2 ** exp) // 2 - 1
-        return lower_bound <= value <= upper_bound
-    elif base == 'uint':
-        if not isinstance(value, utils.int_types):
-            return False
+        validate_item = get_validator(subtype)
+
+        if arr_value:
+            array_length = arr_value[0]
+
+            def validator(value):
+                if len(value) != array_length:
+                    return False
+                return all(validate_item(v) for v in value)
+        else:
+            def validator(value):
+                return all(validate_item(v) for v in value)
+        python_types = None
+    elif base == 'int' or base == 'uint':
         exp = int(sub)
-        lower_bound = 0
-        upper_bound = (2 ** exp) - 1
-        return lower_bound <= value <= upper_bound
+        if base == 'int':
+            lower_bound = -1 * 2 ** exp // 2
+            upper_bound = (2 ** exp) // 2 - 1
+        else:
+            lower_bound = 0
+            upper_bound = (2 ** exp) - 1
+
+        def validator(value):
+            if not isinstance(value, utils.int_types):
+                return False
+            return lower_bound <= value <= upper_bound
+        python_types = utils.int_types
     elif base == 'address':
-        if not isinstance(value, utils.text_types):
-            return False
-        _value = value[2:] if value.startswith('0x') else value
-        if set(_value).difference('1234567890abcdef'):
-            return False
-        return len(_value) == 40
+        def validator(value):
+            if not isinstance(value, utils.text_types):
+                return False
+            _value = value[2:] if value.startswith('0x') else value
+            if set(_value).difference('1234567890abcdef'):
+                return False
+            return len(_value) == 40
+        python_types = utils.text_types
     elif base == 'bytes':
-        if not isinstance(value, utils.text_types):
-            return False
-        try:
+        if sub == '':
+            def validator(value):
+                return isinstance(value, utils.text_types)
+        else:
             max_length = int(sub)
-        except ValueError:
-            if sub == '':
-                return True
-            raise
-        return len(value) <= max_length
+
+            def validator(value):
+                if not isinstance(value, utils.text_types):
+                    return False
+                return len(value) <= max_length
+        python_types = utils.text_types
     elif base == 'string':
-        return isinstance(value, utils.text_types)
+        def validator(value):
+            return isinstance(value, utils.text_types)
+        python_types = utils.text_types
     else:
-        raise ValueError("Unsupported base: '{0}'".format(base))
+        def validator(value):
+            raise ValueError("Unsupported base: '{0}'".format(base))
+        python_types = None
+
+    validator.python_types = python_types
+    return validator
+
 
-GAS_LIMIT_FRACTION = 0.9
+def validate_argument(_type, value):
+    return get_validator(_type)(value)
+
+
+def _get_call_data_chunk(function, args_list):
+    return function.get_call_data_many(args_list)
+
+
+def send_many(contract, function_calls, max_wait=60, **kwargs):
+    """
+    Send a transaction for each `(function, args)` in `function_calls`, then
+    wait for all of them to be mined with the contract's `receipt_watcher`, or
+    a temporary `ReceiptWatcher` if it has none.
+    """
+    receipt_watcher = contract._meta.receipt_watcher
+    owns_receipt_watcher = receipt_watcher is None
+    if owns_receipt_watcher:
+        receipt_watcher = ReceiptWatcher(contract._meta.blockchain_client)
+    try:
+        futures = [
+            receipt_watcher.watch(function.sendTransaction(*args, **kwargs), max_wait)
+            for function, args in function_calls
+        ]
+        return [(future.txn_hash, future.result()) for future in futures]
+    finally:
+        if owns_receipt_watcher:
+            receipt_watcher.stop()
 
 
 class Function(ContractBound):
+    _validators = None
+
     def __init__(self, name, inputs=None, outputs=None, constant=False):
         self.name = name
-        self.inputs = inputs
-        self.outputs = outputs
+        self.inputs = get_abi_params(inputs)
+        self.outputs = get_abi_params(outputs)
         self.constant = constant
+        self._compile()
+
+    @classmethod
+    def from_abi(cls, signature_item):
+        """
+        Return the function for an ABI function definition.  Identical
+        definitions share a single function across all contract classes.
+        """
+        name = signature_item['name']
+        inputs = get_abi_params(signature_item['inputs'])
+        outputs = get_abi_params(signature_item['outputs'])
+        constant = signature_item['constant']
+        return get_definition(
+            (cls, name, inputs, outputs, constant),
+            lambda: cls(name, inputs, outputs, constant),
+        )
+
+    def to_abi(self):
+        """
+        The ABI definition of this function.
+        """
+        if self.name == 'constructor':
+            return {
+                'type': 'constructor',
+                'inputs': [param.to_dict() for param in self.inputs],
+            }
+        return {
+            'type': 'function',
+            'name': self.name,
+            'constant': self.constant,
+            'inputs': [param.to_dict() for param in self.inputs],
+            'outputs': [param.to_dict() for param in self.outputs],
+        }
 
     def __str__(self):
         signature = "{func_name}({arg_types})".format(
@@ -72,13 +197,49 @@ class Function(ContractBound):
         )
         return signature
 
-    def __copy__(self):
-        return self.__class__(self.name, self.inputs, self.outputs, self.constant)
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The compiled validators are closures, they are rebuilt when needed.
+        state.pop('_validators', None)
+        return state
+
+    @property
+    def validators(self):
+        """
+        The compiled argument validators for this function's inputs.
+        """
+        if self._validators is None:
+            self._validators = tuple(get_validator(_type) for _type in self.input_types)
+        return self._validators
+
+    def accepts_python_types(self, python_types):
+        """
+        Whether arguments of the given python types could be valid for this
+        function, without looking at their values.
+        """
+        if len(python_types) != len(self.input_types):
+            return False
+        return all(
+            validator.python_types is None or issubclass(python_type, validator.python_types)
+            for validator, python_type in zip(self.validators, python_types)
+        )
+
+    def validate_arguments(self, args):
+        if len(args) != len(self.input_types):
+            return False
+        return all(validator(arg) for validator, arg in zip(self.validators, args))
 
     def abi_args_signature(self, args):
         """
         Given the calling `args` for the function call, abi encode them.
         """
+        if self._abi.encoder is not None:
+            encoded = self._abi.encoder.encode(args)
+            if encoded is not None:
+                return bytes(encoded[4:])
+        return self._encode_args(args)
+
+    def _encode_args(self, args):
         if len(self.input_types) != len(args):
             raise ValueError("Expected {0} arguments, only got {1}".format(len(self.input_types), len(args)))  # NOQA
         scrubbed_args = tuple(utils.clean_args(*zip(self.input_types, args)))
@@ -86,17 +247,45 @@ class Function(ContractBound):
 
     def get_call_data(self, args):
         """
-        TODO: this needs tests.
+        Return the hex encoded selector and arguments for calling this
+        function with `args`.
         """
+        if self._abi.encoder is not None:
+            call_data = self._abi.encoder.encode_hex(args)
+            if call_data is not None:
+                return call_data
         prefix = self.encoded_abi_signature
-        suffix = self.abi_args_signature(args)
-        return encode_hex(prefix + suffix)
+        suffix = self._encode_args(args)
+        return rlp_utils.encode_hex(prefix + suffix)
 
-    def __get__(self, obj, type=None):
-        if obj is None:
-            return self
-        else:
-            return obj._meta.functions[self.name]
+    def get_call_data_many(self, args_list, pool=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Return a list of the call data for calling this function with each
+        tuple of arguments in `args_list`.
+
+        If a `pool` such as a `multiprocessing.Pool` is given and there are
+        more than `chunk_size` calls, they are encoded in chunks of
+        `chunk_size` by the pool's processes.
+        """
+        args_list = list(args_list)
+        if pool is not None and len(args_list) > chunk_size:
+            # Only the unbound function is sent to the pool's processes.
+            encode_chunk = functools.partial(_get_call_data_chunk, copy.copy(self))
+            return [
+                call_data
+                for chunk_call_data in pool.map(encode_chunk, list(chunks(args_list, chunk_size)))
+                for call_data in chunk_call_data
+            ]
+
+        if self._abi.encoder is None:
+            return [self.get_call_data(args) for args in args_list]
+        call_data = self._abi.encoder.encode_hex_many(args_list)
+        for index, data in enumerate(call_data):
+            if data is None:
+                call_data[index] = rlp_utils.encode_hex(
+                    self.encoded_abi_signature + self._encode_args(args_list[index])
+                )
+        return call_data
 
     def __call__(self, *args, **kwargs):
         if self.constant:
@@ -108,49 +297,114 @@ class Function(ContractBound):
             return self(*args, **kwargs)
         max_wait = kwargs.pop('max_wait', 60)
         txn_hash = self(*args, **kwargs)
-        txn_receipt = self.contract._meta.blockchain_client.wait_for_transaction(
-            txn_hash,
-            max_wait=max_wait
-        )
+        instrument = self.contract._meta.instrument
+        if instrument is not None:
+            start = instrument.timer()
+        receipt_watcher = self.contract._meta.receipt_watcher
+        if receipt_watcher is not None:
+            txn_receipt = receipt_watcher.watch(txn_hash, max_wait).result()
+        else:
+            txn_receipt = self.contract._meta.blockchain_client.wait_for_transaction(
+                txn_hash,
+                max_wait=max_wait
+            )
+        if instrument is not None:
+            instrument.mark(self, WAIT, start)
         return txn_hash, txn_receipt
 
+    def s_many(self, args_list, **kwargs):
+        """
+        Send a transaction for each tuple of arguments in `args_list` without
+        waiting for the previous ones, then wait for all of them to be mined.
+        Returns a list of `(txn_hash, txn_receipt)` in the same order.
+
+        Receipts are awaited with the contract's `receipt_watcher`, or a
+        temporary `ReceiptWatcher` if it has none.
+        """
+        if self.constant:
+            return [self(*args, **kwargs) for args in args_list]
+        return send_many(self.contract, [(self, args) for args in args_list], **kwargs)
+
     def sendTransaction(self, *args, **kwargs):
+        instrument = self.contract._meta.instrument
+        if instrument is not None:
+            start = instrument.timer()
         data = self.get_call_data(args)
+        if instrument is not None:
+            start = instrument.mark(self, ENCODE, start, data)
 
         if 'gas' not in kwargs:
-            # The gasLimit value on the geth chain seems to continuously
-            # decline after every block. We use a value of gas
-            # slightly less than the get_max_gas value so that when
-            # the transaction gets processed, the gas value we send
-            # is still less than the gasLimit value when our transaction
-            # eventually gets processed.
-            kwargs['gas'] = int(
-                GAS_LIMIT_FRACTION * self.contract._meta.blockchain_client.get_max_gas()
+            gas_strategy = self.contract._meta.gas_strategy or DEFAULT_GAS_STRATEGY
+            kwargs['gas'] = gas_strategy.get_gas(self, data, kwargs)
+
+        blockchain_client = self.contract._meta.blockchain_client
+        nonce_manager = self.contract._meta.nonce_manager
+        if nonce_manager is not None:
+            txn_hash = nonce_manager.send_transaction(
+                blockchain_client,
+                to=self.contract._meta.address,
+                data=data,
+                **kwargs
             )
-
-        return self.contract._meta.blockchain_client.send_transaction(
-            to=self.contract._meta.address,
-            data=data,
-            **kwargs
-        )
+        else:
+            txn_hash = blockchain_client.send_transaction(
+                to=self.contract._meta.address,
+                data=data,
+                **kwargs
+            )
+        if instrument is not None:
+            instrument.mark(self, RPC, start, txn_hash)
+        return txn_hash
 
     def call(self, *args, **kwargs):
         raw = kwargs.pop('raw', False)
+        instrument = self.contract._meta.instrument
+        if instrument is not None:
+            start = instrument.timer()
         data = self.get_call_data(args)
+        if instrument is not None:
+            start = instrument.mark(self, ENCODE, start, data)
 
-        output = self.contract._meta.blockchain_client.call(
+        call = functools.partial(
+            self.contract._meta.blockchain_client.call,
             to=self.contract._meta.address,
             data=data,
             **kwargs
         )
+        call_cache = self.contract._meta.call_cache
+        if call_cache is None:
+            output = call()
+        else:
+            output = call_cache.get_or_call(self.contract._meta.address, data, kwargs, call)
+        if instrument is not None:
+            start = instrument.mark(self, RPC, start, output)
         if raw:
             return output
-        return self.cast_return_data(output)
+        result = self.cast_return_data(output)
+        if instrument is not None:
+            instrument.mark(self, DECODE, start, output)
+        return result
+
+    def call_many(self, args_list, **kwargs):
+        """
+        Call this function once for each tuple of arguments in `args_list`
+        using a single `Batch`.  Returns the results in the same order.
+        """
+        raw = kwargs.pop('raw', False)
+        batch = self.contract.batch_class(self.contract, **kwargs)
+        for args in args_list:
+            batch.add_call(self, *args, raw=raw)
+        return batch.execute()
 
 
 class FunctionGroup(object):
+    _contract = None
+
     def __init__(self, functions):
         self.functions = functions
+        # Maps the python types of a call's arguments to the functions which
+        # could accept arguments of those types.
+        self._dispatch_cache = {}
 
     def __str__(self):
         return "\n".join((
@@ -161,8 +415,17 @@ class FunctionGroup(object):
     def name(self):
         return self.functions[0].name
 
-    def _bind(self, contract):
-        [f._bind(contract) for f in self.functions]
+    def _bound_to(self, contract):
+        # Bound groups share the functions and dispatch cache of the original.
+        bound = self.__class__.__new__(self.__class__)
+        bound.__dict__.update(self.__dict__)
+        bound._contract = contract
+        return bound
+
+    def __get__(self, obj, type=None):
+        if obj is None:
+            return self
+        return self._bound_to(obj)
 
     def __call__(self, *args, **kwargs):
         function = self.get_function_for_call_signature(args)
@@ -180,19 +443,39 @@ class FunctionGroup(object):
         function = self.get_function_for_call_signature(args)
         return function.s(*args, **kwargs)
 
-    def get_function_for_call_signature(self, args):
-        candidates = []
-        for function in self.functions:
-            if len(function.inputs) != len(args):
-                continue
-            argument_validity = tuple(
-                validate_argument(arg_meta['type'], arg)
-                for arg_meta, arg
-                in zip(function.inputs, args)
+    def s_many(self, args_list, **kwargs):
+        if self._contract is None:
+            raise AttributeError("Function not bound to a contract")
+        functions = [self.get_function_for_call_signature(args) for args in args_list]
+        if all(function.constant for function in functions):
+            return [function(*args, **kwargs) for function, args in zip(functions, args_list)]
+        return send_many(self._contract, list(zip(functions, args_list)), **kwargs)
+
+    def call_many(self, args_list, **kwargs):
+        if self._contract is None:
+            raise AttributeError("Function not bound to a contract")
+        raw = kwargs.pop('raw', False)
+        batch = self._contract.batch_class(self._contract, **kwargs)
+        for args in args_list:
+            batch.add_call(self, *args, raw=raw)
+        return batch.execute()
+
+    def _get_shape_candidates(self, python_types):
+        try:
+            return self._dispatch_cache[python_types]
+        except KeyError:
+            shape_candidates = self._dispatch_cache[python_types] = tuple(
+                function for function in self.functions
+                if function.accepts_python_types(python_types)
             )
-            if not all(argument_validity):
-                continue
-            candidates.append(function)
+            return shape_candidates
+
+    def _match_function(self, args):
+        shape_candidates = self._get_shape_candidates(tuple(type(arg) for arg in args))
+        candidates = [
+            function for function in shape_candidates
+            if function.validate_arguments(args)
+        ]
         if len(candidates) == 1:
             return candidates[0]
         elif len(candidates) == 0:
@@ -200,6 +483,12 @@ class FunctionGroup(object):
         else:
             raise TypeError("More than one function matched.")
 
+    def get_function_for_call_signature(self, args):
+        function = self._match_function(args)
+        if self._contract is not None:
+            return function._bound_to(self._contract)
+        return function
+
     def abi_args_signature(self, args):
         function = self.get_function_for_call_signature(args)
         return function.abi_args_signature(args)
@@ -208,6 +497,31 @@ class FunctionGroup(object):
         function = self.get_function_for_call_signature(args)
         return function.get_call_data(args)
 
+    def get_call_data_many(self, args_list, pool=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Return a list of the call data for each tuple of arguments in
+        `args_list`, see `Function.get_call_data_many`.  The candidate
+        overloads are looked up once per distinct combination of python
+        argument types, and every tuple of arguments is validated against
+        them like `get_call_data` does.
+        """
+        args_list = list(args_list)
+        function_indices = collections.OrderedDict()
+        for index, args in enumerate(args_list):
+            function = self._match_function(args)
+            function_indices.setdefault(function, []).append(index)
+
+        call_data = [None] * len(args_list)
+        for function, indices in function_indices.items():
+            function_call_data = function.get_call_data_many(
+                [args_list[index] for index in indices],
+                pool=pool,
+                chunk_size=chunk_size,
+            )
+            for index, data in zip(indices, function_call_data):
+                call_data[index] = data
+        return call_data
+
     @property
     def input_types(self):
         raise AttributeError("You must access this function on the correct sub-function")
@@ -0,0 +1,138 @@
+"""
+Strategies for choosing the gas of transactions sent without an explicit
+`gas` value.
+
+A strategy's `get_gas(function, data, txn_kwargs)` is called by
+`Function.sendTransaction` with the bound function, the hex encoded call data
+and the remaining transaction keyword arguments, and returns the gas to send.
+"""
+import collections
+import threading
+import time
+
+from eth_contract import utils
+
+
+# The gasLimit value on the geth chain seems to continuously decline after
+# every block.  We use a value of gas slightly less than the get_max_gas value
+# so that when the transaction gets processed, the gas value we send is still
+# less than the gasLimit value when our transaction eventually gets processed.
+GAS_LIMIT_FRACTION = 0.9
+
+# Roughly one block.
+DEFAULT_MAX_GAS_AGE = 15
+
+DEFAULT_ESTIMATE_MULTIPLIER = 1.2
+
+DEFAULT_MAX_ESTIMATES = 1000
+
+
+class GasStrategy(object):
+    """
+    Base class for gas strategies.
+    """
+    def get_gas(self, function, data, txn_kwargs):
+        raise NotImplementedError("Gas strategies must implement this method")
+
+
+class MaxGasStrategy(GasStrategy):
+    """
+    Sends `fraction` of the client's `get_max_gas()`.  The value is reused for
+    `max_age` seconds so that senders don't make an extra request for every
+    transaction.  With a `max_age` of 0 it is requested for every transaction.
+    """
+    def __init__(self, fraction=GAS_LIMIT_FRACTION, max_age=DEFAULT_MAX_GAS_AGE):
+        self.fraction = fraction
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._cached = None
+
+    def get_max_gas(self, blockchain_client):
+        if not self.max_age:
+            return blockchain_client.get_max_gas()
+
+        with self._lock:
+            if self._cached is not None:
+                client, max_gas, expires_at = self._cached
+                if client is blockchain_client and time.time() < expires_at:
+                    return max_gas
+
+            max_gas = blockchain_client.get_max_gas()
+            self._cached = (blockchain_client, max_gas, time.time() + self.max_age)
+            return max_gas
+
+    def get_gas(self, function, data, txn_kwargs):
+        max_gas = self.get_max_gas(function.contract._meta.blockchain_client)
+        return int(self.fraction * max_gas)
+
+
+class EstimateGasStrategy(GasStrategy):
+    """
+    Sends the client's `estimate_gas(to, data, **txn_kwargs)` times
+    `multiplier`, capped by `max_gas_strategy`.
+
+    Estimates are memoized by the shape of the call data, which is the
+    contract address, the function selector and the length of the call data,
+    and by the `value` and `_from` of the transaction, which can change the
+    code path taken.  Repeated calls of a function with similar arguments are
+    only estimated once.  The `max_size` most recently used estimates are
+    kept.  `multiplier` leaves room for arguments which use more gas than the
+    ones that were estimated.
+    """
+    def __init__(self, multiplier=DEFAULT_ESTIMATE_MULTIPLIER, max_gas_strategy=None,
+                 max_size=DEFAULT_MAX_ESTIMATES):
+        self.multiplier = multiplier
+        if max_gas_strategy is None:
+            max_gas_strategy = MaxGasStrategy()
+        self.max_gas_strategy = max_gas_strategy
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._estimates = collections.OrderedDict()
+
+    def get_key(self, function, data, txn_kwargs):
+        data = utils.strip_0x_prefix(utils.str_to_bytes(data))
+        address = utils.str_to_bytes(function.contract._meta.address).lower()
+        sender = txn_kwargs.get('_from')
+        if sender is not None:
+            sender = utils.str_to_bytes(sender).lower()
+        return (address, data[:8], len(data), txn_kwargs.get('value'), sender)
+
+    def load_estimate(self, key):
+        with self._lock:
+            estimate = self._estimates.pop(key)
+            self._estimates[key] = estimate
+        return estimate
+
+    def store_estimate(self, key, estimate):
+        with self._lock:
+            self._estimates.pop(key, None)
+            self._estimates[key] = estimate
+            while len(self._estimates) > self.max_size:
+                self._estimates.popitem(last=False)
+
+    def get_estimate(self, function, data, txn_kwargs):
+        key = self.get_key(function, data, txn_kwargs)
+        try:
+            return self.load_estimate(key)
+        except KeyError:
+            pass
+
+        blockchain_client = function.contract._meta.blockchain_client
+        estimate = blockchain_client.estimate_gas(
+            to=function.contract._meta.address,
+            data=data,
+            **txn_kwargs
+        )
+        self.store_estimate(key, estimate)
+        return estimate
+
+    def get_gas(self, function, data, txn_kwargs):
+        estimate = self.get_estimate(function, data, txn_kwargs)
+        return min(
+            int(self.multiplier * estimate),
+            self.max_gas_strategy.get_gas(function, data, txn_kwargs),
+        )
+
+
+# Preserves the behaviour of requesting the max gas for every transaction.
+DEFAULT_GAS_STRATEGY = MaxGasStrategy(max_age=0)
@@ -0,0 +1,153 @@
+import collections
+import math
+import threading
+import time
+
+
+ENCODE = 'encode'
+RPC = 'rpc'
+DECODE = 'decode'
+WAIT = 'wait'
+
+PHASES = (ENCODE, RPC, DECODE, WAIT)
+
+# Number of most recent timings kept per function and phase to compute the
+# latency percentiles from.
+DEFAULT_MAX_SAMPLES = 10000
+
+
+if hasattr(time, 'perf_counter'):
+    timer = time.perf_counter
+else:
+    timer = time.time
+
+
+def get_data_size(data):
+    """
+    The number of bytes of ABI data in a hex string, or in a list of logs.
+    """
+    if data is None:
+        return 0
+    elif isinstance(data, list):
+        return sum(get_data_size(log['data']) for log in data)
+    data_size = len(data)
+    if data[:2] in ('0x', b'0x'):
+        data_size -= 2
+    return data_size // 2
+
+
+class Instrument(object):
+    """
+    Receives the timing of each phase of the contract calls, transactions and
+    log lookups made by the contract instances created with it.
+
+    The phases are `ENCODE` (the call data), `RPC` (the request to the
+    node), `DECODE` (the returned data) and `WAIT` (for a transaction's
+    receipt in `s()`).  Subclasses implement `record`, which is called from
+    the thread making the request, so it should return quickly.
+    """
+    timer = staticmethod(timer)
+
+    def record(self, source, phase, duration, num_bytes):
+        """
+        Record that `phase` of a request made by `source`, a bound `Function`
+        or `Event`, took `duration` seconds and produced `num_bytes` bytes of
+        ABI data.
+        """
+        raise NotImplementedError("Subclasses must implement `record`")
+
+    def mark(self, source, phase, start, data=None):
+        """
+        Record the phase which began at `start` and return the current time
+        as the start of the next phase.
+        """
+        now = self.timer()
+        self.record(source, phase, now - start, get_data_size(data))
+        return now
+
+
+def get_source_name(source):
+    return "{0}.{1}".format(type(source.contract).__name__, source.name)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = max(int(math.ceil(fraction * len(sorted_values))) - 1, 0)
+    return sorted_values[index]
+
+
+class PhaseStats(object):
+    __slots__ = ('count', 'num_bytes', 'durations')
+
+    def __init__(self, max_samples):
+        self.count = 0
+        self.num_bytes = 0
+        self.durations = collections.deque(maxlen=max_samples)
+
+
+class TimingAggregator(Instrument):
+    """
+    Aggregates the timings of each phase per contract function or event,
+    named like `Token.transfer`, into counts, total bytes and p50/p99
+    latencies over the most recent `max_samples` timings.
+    """
+    def __init__(self, max_samples=DEFAULT_MAX_SAMPLES):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, source, phase, duration, num_bytes):
+        key = (get_source_name(source), phase)
+        with self._lock:
+            try:
+                stats = self._stats[key]
+            except KeyError:
+                stats = self._stats[key] = PhaseStats(self.max_samples)
+            stats.count += 1
+            stats.num_bytes += num_bytes
+            stats.durations.append(duration)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self):
+        """
+        Return an ordered dictionary mapping each name to a dictionary of its
+        phases' `count`, `bytes`, `p50` and `p99` latency in seconds.
+        """
+        with self._lock:
+            items = [
+                (name, phase, stats.count, stats.num_bytes, sorted(stats.durations))
+                for (name, phase), stats in self._stats.items()
+            ]
+        summary = collections.OrderedDict()
+        for name, phase, count, num_bytes, durations in sorted(
+                items, key=lambda item: (item[0], PHASES.index(item[1]))):
+            summary.setdefault(name, collections.OrderedDict())[phase] = {
+                'count': count,
+                'bytes': num_bytes,
+                'p50': percentile(durations, 0.5),
+                'p99': percentile(durations, 0.99),
+            }
+        return summary
+
+    def report(self):
+        """
+        The summary formatted as a table with latencies in milliseconds.
+        """
+        lines = ["{0:<40} {1:<7} {2:>8} {3:>10} {4:>10} {5:>10}".format(
+            'name', 'phase', 'count', 'bytes', 'p50 ms', 'p99 ms',
+        )]
+        for name, phases in self.summary().items():
+            for phase, stats in phases.items():
+                lines.append("{0:<40} {1:<7} {2:>8} {3:>10} {4:>10.3f} {5:>10.3f}".format(
+                    name,
+                    phase,
+                    stats['count'],
+                    stats['bytes'],
+                    stats['p50'] * 1000,
+                    stats['p99'] * 1000,
+                ))
+        return "\n".join(lines)
@@ -0,0 +1,260 @@
+import collections
+import functools
+
+from eth_contract import utils
+from eth_contract.utils import (
+    abi,
+    rlp_utils,
+)
+from eth_contract.decoding import get_word_reader
+
+
+DecodedLog = collections.namedtuple(
+    'DecodedLog',
+    ('contract_name', 'event_name', 'args', 'log'),
+)
+
+
+def normalize_hex(value):
+    return utils.str_to_bytes(value).lower()
+
+
+def _read_topic(reader, topic):
+    topic = utils.strip_0x_prefix(utils.str_to_bytes(topic))
+    return reader(memoryview(rlp_utils.decode_hex(topic)))
+
+
+class EventDecoder(object):
+    """
+    Precomputed decoding data for the logs of a single event.
+    """
+    __slots__ = (
+        'contract_name',
+        'event',
+        'topic',
+        'num_topics',
+        'data_names',
+        'indexed_readers',
+    )
+
+    def __init__(self, event, contract_name=None):
+        self.contract_name = contract_name
+        self.event = event
+        self.topic = normalize_hex(event.event_topic)
+        self.data_names = tuple(output['name'] for output in event.outputs)
+
+        indexed_readers = []
+        for _input in event.inputs:
+            if not _input['indexed']:
+                continue
+            reader = get_word_reader(_input['type'])
+            if reader is None:
+                reader = functools.partial(abi.decode_single, _input['type'])
+            else:
+                reader = functools.partial(_read_topic, reader)
+            indexed_readers.append((_input['name'], reader))
+        self.indexed_readers = tuple(indexed_readers)
+        self.num_topics = len(self.indexed_readers) + (0 if event.anonymous else 1)
+
+    def decode(self, log_entry):
+        values = self.event._abi.decoder(log_entry['data'])
+        args = dict(zip(self.data_names, values))
+        topics = log_entry['topics'][len(log_entry['topics']) - len(self.indexed_readers):]
+        for (name, reader), topic in zip(self.indexed_readers, topics):
+            args[name] = reader(topic)
+        return DecodedLog(self.contract_name, self.event.name, args, log_entry)
+
+
+class LogDecoder(object):
+    """
+    Decodes raw logs for the events of any number of contracts.
+
+    Events are indexed by their topic and number of topics so each log is
+    matched with a single dictionary lookup.  Contracts registered with an
+    address take precedence for logs emitted from that address, which
+    disambiguates events sharing a signature such as the ERC20 and ERC721
+    `Transfer` events.
+    """
+    def __init__(self, contracts=None):
+        self._by_topic = {}
+        self._by_address = {}
+        for contract in contracts or []:
+            self.register(contract)
+
+    def register(self, contract, address=None):
+        """
+        Register the events of `contract`, a contract class or instance.
+        Contract instances are registered for their own address.
+        """
+        if address is None and hasattr(contract, '_meta'):
+            address = contract._meta.address
+        self.register_events(contract._config._events, contract._config.name, address)
+
+    def register_events(self, events, contract_name=None, address=None):
+        for event in events:
+            if event.anonymous:
+                continue
+            decoder = EventDecoder(event, contract_name)
+            if address is not None:
+                key = (normalize_hex(address), decoder.topic, decoder.num_topics)
+                self._by_address[key] = decoder
+            self._by_topic.setdefault((decoder.topic, decoder.num_topics), decoder)
+
+    def get_event_decoder(self, log_entry):
+        topics = log_entry['topics']
+        if not topics:
+            return None
+        key = (normalize_hex(topics[0]), len(topics))
+        if self._by_address:
+            decoder = self._by_address.get((normalize_hex(log_entry['address']),) + key)
+            if decoder is not None:
+                return decoder
+        return self._by_topic.get(key)
+
+    def decode_log(self, log_entry):
+        """
+        Decode a single log, returning `None` if it matches no known event.
+        """
+        decoder = self.get_event_decoder(log_entry)
+        if decoder is None:
+            return None
+        return decoder.decode(log_entry)
+
+    def decode_logs(self, log_entries):
+        """
+        Lazily decode an iterable of logs, skipping those which match no known
+        event.
+        """
+        get_event_decoder = self.get_event_decoder
+        for log_entry in log_entries:
+            decoder = get_event_decoder(log_entry)
+            if decoder is not None:
+                yield decoder.decode(log_entry)
+
+
+DEFAULT_SCAN_CHUNK_SIZE = 1000
+MAX_SCAN_CHUNK_SIZE = 100000
+SCAN_TARGET_RESULTS = 1000
+
+# Fragments of the error messages nodes use when a log query covers too many
+# blocks or returns too many results.
+TOO_MANY_RESULTS_MESSAGES = (
+    'more than',
+    'too many',
+    'limit exceeded',
+    'response size',
+    'query timeout',
+    'block range',
+)
+
+
+def is_too_many_results_error(error):
+    message = str(error).lower()
+    return any(fragment in message for fragment in TOO_MANY_RESULTS_MESSAGES)
+
+
+HEAD_BLOCK_TAGS = ('latest', 'pending')
+
+
+def scan_needs_head(from_block, to_block):
+    return from_block in HEAD_BLOCK_TAGS or to_block in HEAD_BLOCK_TAGS
+
+
+def resolve_scan_block(block, head):
+    """
+    Return the block number for `block`, which is a block number,
+    `'earliest'`, or `'latest'` or `'pending'` (both resolved to `head`).
+    """
+    if block == 'earliest':
+        return 0
+    elif block in HEAD_BLOCK_TAGS:
+        return head
+    elif isinstance(block, bool) or not isinstance(block, utils.int_types):
+        raise TypeError(
+            "Scan bounds must be block numbers, 'earliest', 'latest' or 'pending': "
+            "got {0!r}".format(block)
+        )
+    return block
+
+
+class LogScan(object):
+    """
+    The block ranges requested by a log scan, halved after too many results
+    and doubled after sparse ranges.
+    """
+    def __init__(self, from_block, to_block, head=None,
+                 chunk_size=DEFAULT_SCAN_CHUNK_SIZE,
+                 max_chunk_size=MAX_SCAN_CHUNK_SIZE,
+                 target_results=SCAN_TARGET_RESULTS):
+        self.start = resolve_scan_block(from_block, head)
+        self.to_block = resolve_scan_block(to_block, head)
+        self.chunk_size = chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.target_results = target_results
+        self.end = None
+
+    def next_range(self):
+        """
+        Return the `(from_block, to_block)` of the next request, or `None`
+        once the scan is done.
+        """
+        if self.start > self.to_block:
+            return None
+        self.end = min(self.start + self.chunk_size - 1, self.to_block)
+        return self.start, self.end
+
+    def shrink(self, error):
+        """
+        Halve the range after `error` and return whether to retry it.
+        """
+        if self.chunk_size > 1 and is_too_many_results_error(error):
+            self.chunk_size = max(1, self.chunk_size // 2)
+            return True
+        return False
+
+    def advance(self, num_logs):
+        self.start = self.end + 1
+        if num_logs < self.target_results // 2:
+            self.chunk_size = min(self.chunk_size * 2, self.max_chunk_size)
+
+
+def scan_logs(blockchain_client, from_block, to_block,
+              chunk_size=DEFAULT_SCAN_CHUNK_SIZE,
+              max_chunk_size=MAX_SCAN_CHUNK_SIZE,
+              target_results=SCAN_TARGET_RESULTS,
+              **filter_params):
+    """
+    Lazily yield the logs between `from_block` and `to_block` (inclusive)
+    which match `filter_params`, using one `get_logs` request per chunk of
+    blocks.  `'latest'` and `'pending'` bounds are resolved once with the
+    client's `get_block_number()`.
+
+    The chunk is halved and retried when the node reports too many results,
+    and doubled (up to `max_chunk_size`) after chunks returning fewer than
+    half of `target_results` logs.  Only one chunk of logs is held in memory
+    at a time.
+    """
+    head = None
+    if scan_needs_head(from_block, to_block):
+        head = blockchain_client.get_block_number()
+    scan = LogScan(from_block, to_block, head, chunk_size, max_chunk_size, target_results)
+
+    while True:
+        block_range = scan.next_range()
+        if block_range is None:
+            break
+        try:
+            log_entries = blockchain_client.get_logs(
+                from_block=block_range[0],
+                to_block=block_range[1],
+                **filter_params
+            )
+        except Exception as error:
+            if scan.shrink(error):
+                continue
+            raise
+
+        for log_entry in log_entries:
+            yield log_entry
+
+        scan.advance(len(log_entries))
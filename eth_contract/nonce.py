@@ -0,0 +1,137 @@
+import heapq
+import threading
+
+from eth_contract import utils
+
+
+# Fragments of the error messages nodes use when a transaction's nonce is
+# out of step with the account's nonce on chain.
+NONCE_ERROR_MESSAGES = (
+    'nonce too low',
+    'nonce too high',
+    'invalid nonce',
+    'known transaction',
+    'already known',
+    'replacement transaction underpriced',
+)
+
+
+def is_nonce_error(error):
+    message = str(error).lower()
+    return any(fragment in message for fragment in NONCE_ERROR_MESSAGES)
+
+
+class NonceManager(object):
+    """
+    Assigns transaction nonces locally so that many transactions from one
+    account can be sent without waiting for the previous ones to be mined.
+
+    The first nonce of each account is read with the blockchain client's
+    `get_transaction_count(account, block="pending")` and every following
+    one is reserved locally.  The nonce of a transaction which fails to send
+    is reused by the next transaction from that account so that no gap is
+    left which would stall the later transactions.  When the node reports a
+    nonce error the account is synced from the node again.
+
+    A nonce manager can be shared by any number of contract instances using
+    the same chain, and by many threads.
+    """
+    def __init__(self, default_account=None):
+        self.default_account = default_account
+        self._lock = threading.Lock()
+        self._next_nonces = {}
+        self._released_nonces = {}
+
+    def get_account(self, txn_kwargs):
+        account = txn_kwargs.get('_from') or self.default_account
+        if account is None:
+            raise ValueError(
+                "Transactions sent with a nonce manager need a `_from` address or a "
+                "`default_account`"
+            )
+        return utils.str_to_bytes(account).lower()
+
+    def reserve(self, blockchain_client, account):
+        """
+        Reserve the next nonce for `account`, reusing released nonces first.
+        """
+        with self._lock:
+            if account not in self._next_nonces:
+                self._next_nonces[account] = blockchain_client.get_transaction_count(
+                    account,
+                    block="pending",
+                )
+            return self._reserve(account)
+
+    def reserve_known(self, account):
+        """
+        Reserve the next nonce for `account` without asking the node, or
+        return `None` if the account has not been synced with `sync`.
+        """
+        with self._lock:
+            if account not in self._next_nonces:
+                return None
+            return self._reserve(account)
+
+    def sync(self, account, transaction_count):
+        """
+        Set the next nonce of `account` to `transaction_count`, the node's
+        pending transaction count, unless it is already known locally.
+        """
+        with self._lock:
+            self._next_nonces.setdefault(account, transaction_count)
+
+    def _reserve(self, account):
+        released_nonces = self._released_nonces.get(account)
+        if released_nonces:
+            return heapq.heappop(released_nonces)
+        nonce = self._next_nonces[account]
+        self._next_nonces[account] = nonce + 1
+        return nonce
+
+    def release(self, account, nonce):
+        """
+        Release a reserved nonce whose transaction was not sent.
+        """
+        with self._lock:
+            if account not in self._next_nonces:
+                # The account has been reset since the nonce was reserved.
+                return
+            heapq.heappush(self._released_nonces.setdefault(account, []), nonce)
+
+    def reset(self, account=None):
+        """
+        Forget the local nonces of `account`, or of every account, so they
+        are read from the node again.
+        """
+        with self._lock:
+            if account is None:
+                self._next_nonces.clear()
+                self._released_nonces.clear()
+            else:
+                self._next_nonces.pop(account, None)
+                self._released_nonces.pop(account, None)
+
+    def send_transaction(self, blockchain_client, **txn_kwargs):
+        if 'nonce' in txn_kwargs:
+            return blockchain_client.send_transaction(**txn_kwargs)
+
+        account = self.get_account(txn_kwargs)
+        if '_from' not in txn_kwargs:
+            txn_kwargs['_from'] = self.default_account
+
+        nonce = self.reserve(blockchain_client, account)
+        try:
+            return blockchain_client.send_transaction(nonce=nonce, **txn_kwargs)
+        except Exception as error:
+            self.send_failed(account, nonce, error)
+            raise
+
+    def send_failed(self, account, nonce, error):
+        """
+        Recover the nonce of a transaction which failed to send with `error`.
+        """
+        if is_nonce_error(error):
+            self.reset(account)
+        else:
+            self.release(account, nonce)
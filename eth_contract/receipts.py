@@ -0,0 +1,262 @@
+import collections
+import threading
+import time
+
+from eth_contract import utils
+from eth_contract.batch import (
+    DEFAULT_BATCH_SIZE,
+    chunks,
+)
+
+
+DEFAULT_POLL_INTERVAL = 1
+
+# Blocks before the latest seen block which are also searched for a newly
+# watched transaction, in case it was mined just before it was watched.
+DEFAULT_LOOKBACK_BLOCKS = 2
+
+# Number of blocks whose transaction hashes are kept for the lookback.
+BLOCK_CACHE_SIZE = 64
+
+
+def normalize_hash(txn_hash):
+    return utils.str_to_bytes(txn_hash).lower()
+
+
+def get_transaction_receipts(blockchain_client, txn_hashes, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Return the receipts of `txn_hashes` in order, with `None` for the
+    transactions which have not been mined.
+
+    If the client implements `batch_get_transaction_receipt(txn_hashes)`,
+    each chunk of up to `batch_size` hashes is passed to it and it must
+    return the list of receipts in the same order.  Other clients make one
+    `get_transaction_receipt` request per transaction.
+    """
+    txn_hashes = list(txn_hashes)
+    if not hasattr(blockchain_client, 'batch_get_transaction_receipt'):
+        return [blockchain_client.get_transaction_receipt(txn_hash) for txn_hash in txn_hashes]
+    receipts = []
+    for chunk in chunks(txn_hashes, batch_size):
+        receipts.extend(blockchain_client.batch_get_transaction_receipt(chunk))
+    return receipts
+
+
+class ReceiptFuture(object):
+    """
+    The eventual receipt of a transaction being watched by a
+    `ReceiptWatcher`.
+    """
+    def __init__(self, txn_hash):
+        self.txn_hash = txn_hash
+        self._done = threading.Event()
+        self._receipt = None
+        self._error = None
+
+    def done(self):
+        return self._done.is_set()
+
+    def set_result(self, receipt):
+        self._receipt = receipt
+        self._done.set()
+
+    def set_exception(self, error):
+        self._error = error
+        self._done.set()
+
+    def result(self, timeout=None):
+        """
+        Wait for and return the receipt, raising the error the transaction
+        failed with instead if there is one.
+        """
+        if not self._done.wait(timeout):
+            raise ValueError("Timed out waiting for the receipt of {0}".format(self.txn_hash))
+        if self._error is not None:
+            raise self._error
+        return self._receipt
+
+
+class PendingTransaction(object):
+    __slots__ = ('future', 'since_block', 'deadline')
+
+    def __init__(self, future, since_block, deadline):
+        self.future = future
+        self.since_block = since_block
+        self.deadline = deadline
+
+
+class ReceiptWatcher(object):
+    """
+    Waits for the receipts of any number of transactions with a single poll
+    loop.
+
+    Each poll requests the latest block number and, while transactions are
+    pending, the transaction hashes of each new block.  Receipts are only
+    requested for the pending transactions found in those blocks, so the
+    cost of waiting grows with the number of blocks rather than with the
+    number of pending transactions.
+
+    The blockchain client must implement `get_block_number()`,
+    `get_block_by_number(number, full_transactions)` and
+    `get_transaction_receipt(txn_hash)`.  The receipts found in a poll are
+    fetched together with `get_transaction_receipts`, so clients with
+    `batch_get_transaction_receipt` need one request per `batch_size`
+    receipts.  The poll loop runs in a daemon thread which is started when
+    the first transaction is watched.
+    """
+    def __init__(self, blockchain_client, poll_interval=DEFAULT_POLL_INTERVAL,
+                 lookback_blocks=DEFAULT_LOOKBACK_BLOCKS, batch_size=DEFAULT_BATCH_SIZE):
+        self.blockchain_client = blockchain_client
+        self.poll_interval = poll_interval
+        self.lookback_blocks = lookback_blocks
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._block_transactions = collections.OrderedDict()
+        self._head = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def watch(self, txn_hash, max_wait=None):
+        """
+        Return a `ReceiptFuture` for the receipt of `txn_hash`.  The future
+        fails with a `ValueError` if the transaction is not mined within
+        `max_wait` seconds.
+        """
+        future = ReceiptFuture(txn_hash)
+        deadline = None if max_wait is None else time.time() + max_wait
+        head = None
+        if self._head is None:
+            head = self.blockchain_client.get_block_number()
+        with self._lock:
+            if self._head is None:
+                if head is None:
+                    # `stop()` cleared the head after it was checked.
+                    head = self.blockchain_client.get_block_number()
+                self._head = head
+            self._pending[normalize_hash(txn_hash)] = PendingTransaction(
+                future,
+                self.get_lookback_start(self._head),
+                deadline,
+            )
+        self.start()
+        return future
+
+    def get_lookback_start(self, head):
+        # Transactions are looked for in the blocks after this one.
+        return max(head - self.lookback_blocks - 1, -1)
+
+    @property
+    def num_pending(self):
+        return len(self._pending)
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+            # Read the latest block again when restarted.
+            self._head = None
+        self._stopped.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.poll()
+            except Exception:
+                # Errors talking to the node are retried on the next poll.
+                # Transactions still fail once their deadline passes.
+                self.expire()
+            self._stopped.wait(self.poll_interval)
+
+    def get_block_transactions(self, block_number):
+        """
+        The set of normalized transaction hashes in the block, or `None` if
+        the node does not have the block yet.
+        """
+        try:
+            return self._block_transactions[block_number]
+        except KeyError:
+            pass
+
+        block = self.blockchain_client.get_block_by_number(
+            block_number,
+            full_transactions=False,
+        )
+        if block is None:
+            return None
+        transactions = frozenset(normalize_hash(txn_hash) for txn_hash in block['transactions'])
+        self._block_transactions[block_number] = transactions
+        while len(self._block_transactions) > BLOCK_CACHE_SIZE:
+            self._block_transactions.popitem(last=False)
+        return transactions
+
+    def poll(self):
+        """
+        Resolve the pending transactions which have been mined since the last
+        poll.
+        """
+        head = self.blockchain_client.get_block_number()
+        with self._lock:
+            self._head = head
+            pending = list(self._pending.items())
+
+        if pending:
+            mined = []
+            first_block = min(p.since_block for _, p in pending) + 1
+            for block_number in range(first_block, head + 1):
+                transactions = self.get_block_transactions(block_number)
+                if transactions is None:
+                    break
+                for txn_hash, pending_transaction in pending:
+                    if pending_transaction.since_block != block_number - 1:
+                        # Not watched yet at this block, or already found.
+                        continue
+                    if txn_hash in transactions:
+                        mined.append((txn_hash, pending_transaction))
+                    else:
+                        pending_transaction.since_block = block_number
+            if mined:
+                self._resolve(mined)
+
+        self.expire()
+
+    def _resolve(self, mined):
+        receipts = get_transaction_receipts(
+            self.blockchain_client,
+            [pending_transaction.future.txn_hash for _, pending_transaction in mined],
+            self.batch_size,
+        )
+        for (txn_hash, pending_transaction), receipt in zip(mined, receipts):
+            if receipt is None:
+                # Not available yet, look for it again on the next poll.
+                continue
+            with self._lock:
+                self._pending.pop(txn_hash, None)
+            pending_transaction.future.set_result(receipt)
+
+    def expire(self):
+        now = time.time()
+        with self._lock:
+            expired = [
+                (txn_hash, pending_transaction)
+                for txn_hash, pending_transaction in self._pending.items()
+                if pending_transaction.deadline is not None and pending_transaction.deadline < now
+            ]
+            for txn_hash, _ in expired:
+                del self._pending[txn_hash]
+        for _, pending_transaction in expired:
+            pending_transaction.future.set_exception(ValueError(
+                "Transaction {0} was not mined within the allowed time".format(
+                    pending_transaction.future.txn_hash,
+                )
+            ))
@@ -0,0 +1,174 @@
+import collections
+import threading
+
+from eth_contract import utils
+from eth_contract.core import (
+    Contract,
+    ContractBase,
+)
+from eth_contract.utils import rlp_utils
+
+
+DEFAULT_MAX_CLASSES = 1000
+
+
+def get_code_hash(code):
+    """
+    The lower case hex keccak hash of hex encoded contract code.
+    """
+    code = utils.strip_0x_prefix(utils.str_to_bytes(code))
+    return rlp_utils.encode_hex(utils.sha3(rlp_utils.decode_hex(code)))
+
+
+def normalize_code_hash(code_hash):
+    return utils.strip_0x_prefix(utils.str_to_bytes(code_hash)).lower()
+
+
+class ContractRegistry(object):
+    """
+    Holds the metadata of any number of contracts and only builds the
+    contract class of a contract when it is first looked up.
+
+    Contracts are looked up by name, by the address of any of their
+    deployments, or by the hash of their code.  Both the `code` and, when
+    present, the `code_runtime` of the metadata are indexed, so contracts
+    can be found by the hash of the code returned by `eth_getCode`.  At most
+    `max_classes` contract classes are kept, the least recently used are
+    dropped and rebuilt if they are needed again.
+
+    `base`, `abi_cache` and `compact` are passed on to `Contract()`.
+    """
+    def __init__(self, max_classes=DEFAULT_MAX_CLASSES, base=ContractBase, abi_cache=None,
+                 compact=False):
+        self.max_classes = max_classes
+        self.base = base
+        self.abi_cache = abi_cache
+        self.compact = compact
+        self.hits = 0
+        self.misses = 0
+        self._contract_metas = {}
+        self._by_address = {}
+        self._by_code_hash = {}
+        # The addresses and code hashes registered for each name.
+        self._addresses = {}
+        self._code_hashes = {}
+        self._classes = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._contract_metas)
+
+    def __contains__(self, contract_name):
+        return contract_name in self._contract_metas
+
+    @property
+    def num_classes(self):
+        return len(self._classes)
+
+    def add(self, contract_meta, contract_name, addresses=()):
+        """
+        Register the metadata of a contract, and the `addresses` it is
+        deployed at.  Registering a name again replaces its metadata and
+        drops the addresses and code hashes registered for it.
+        """
+        code_hashes = [
+            get_code_hash(code)
+            for code in (contract_meta.get('code'), contract_meta.get('code_runtime'))
+            if code and utils.strip_0x_prefix(utils.str_to_bytes(code))
+        ]
+        with self._lock:
+            self._remove(contract_name)
+            self._contract_metas[contract_name] = contract_meta
+            self._addresses[contract_name] = set()
+            self._code_hashes[contract_name] = []
+            for code_hash in code_hashes:
+                if self._by_code_hash.setdefault(code_hash, contract_name) == contract_name:
+                    self._code_hashes[contract_name].append(code_hash)
+        for address in addresses:
+            self.add_address(address, contract_name)
+
+    def _remove(self, contract_name):
+        self._classes.pop(contract_name, None)
+        for address in self._addresses.pop(contract_name, ()):
+            if self._by_address.get(address) == contract_name:
+                del self._by_address[address]
+        for code_hash in self._code_hashes.pop(contract_name, ()):
+            if self._by_code_hash.get(code_hash) == contract_name:
+                del self._by_code_hash[code_hash]
+
+    def add_address(self, address, contract_name):
+        """
+        Register a deployment of the contract named `contract_name`.
+        """
+        address = utils.str_to_bytes(address).lower()
+        with self._lock:
+            if contract_name not in self._contract_metas:
+                raise KeyError(contract_name)
+            self._by_address[address] = contract_name
+            self._addresses[contract_name].add(address)
+
+    def __getitem__(self, contract_name):
+        """
+        The contract class of the contract named `contract_name`, built the
+        first time it is needed.
+        """
+        with self._lock:
+            try:
+                contract_class = self._classes.pop(contract_name)
+            except KeyError:
+                contract_meta = self._contract_metas[contract_name]
+            else:
+                self._classes[contract_name] = contract_class
+                self.hits += 1
+                return contract_class
+
+        contract_class = Contract(
+            contract_meta,
+            contract_name,
+            base=self.base,
+            abi_cache=self.abi_cache,
+            compact=self.compact,
+        )
+
+        with self._lock:
+            self.misses += 1
+            if self._contract_metas.get(contract_name) is contract_meta:
+                # Another thread may have built the class in the meantime.
+                contract_class = self._classes.setdefault(contract_name, contract_class)
+                while len(self._classes) > self.max_classes:
+                    self._classes.popitem(last=False)
+        return contract_class
+
+    def get(self, contract_name, default=None):
+        if contract_name not in self._contract_metas:
+            return default
+        return self[contract_name]
+
+    def get_by_address(self, address):
+        """
+        The contract class deployed at `address`, or `None` if no contract
+        has been registered for it.
+        """
+        contract_name = self._by_address.get(utils.str_to_bytes(address).lower())
+        return self.get(contract_name)
+
+    def get_by_code_hash(self, code_hash):
+        """
+        The contract class whose code hashes to `code_hash`, or `None` if no
+        contract has been registered with that code.
+        """
+        contract_name = self._by_code_hash.get(normalize_code_hash(code_hash))
+        return self.get(contract_name)
+
+    def get_by_code(self, code):
+        return self.get_by_code_hash(get_code_hash(code))
+
+    def at(self, address, blockchain_client, **kwargs):
+        """
+        Return a contract instance for the contract registered at `address`.
+        Keyword arguments are passed on to the contract class.
+        """
+        contract_class = self.get_by_address(address)
+        if contract_class is None:
+            raise KeyError(address)
+        return contract_class(address, blockchain_client, **kwargs)
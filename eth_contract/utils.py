@@ -1,5 +1,5 @@
+import importlib
 import sys
-from sha3 import sha3_256
 
 
 if sys.version_info.major == 2:
@@ -35,5 +35,32 @@ def clean_args(*args):
         yield arg
 
 
+class LazyModule(object):
+    """
+    Stand-in for the module `name` which only imports it when one of its
+    attributes is first accessed.  The attributes of the module are then
+    copied onto the stand-in so later lookups are plain attribute access.
+    """
+    def __init__(self, name):
+        self.__dict__['_lazy_module_name'] = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._lazy_module_name)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return "<LazyModule '{0}'>".format(self._lazy_module_name)
+
+
+# The hashing backend, `rlp` and `eth_abi` (which scans the installed
+# distributions through `pkg_resources` on import) are only loaded when they
+# are first used.
+sha3_backend = LazyModule('sha3')
+rlp_utils = LazyModule('rlp.utils')
+abi = LazyModule('eth_abi.abi')
+abi_utils = LazyModule('eth_abi.utils')
+
+
 def sha3(seed):
-    return sha3_256(seed).digest()
+    return sha3_backend.sha3_256(seed).digest()
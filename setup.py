@@ -1,13 +1,17 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import os
+import re
 
 from setuptools import setup
 
 
 DIR = os.path.dirname(os.path.abspath(__file__))
 
-version = '0.1.0'
+with open(os.path.join(DIR, 'eth_contract', '__init__.py')) as init_file:
+    version = re.search(
+        r"^__version__ = '([^']+)'$", init_file.read(), re.MULTILINE,
+    ).group(1)
 
 readme = open(os.path.join(DIR, 'README.md')).read()
 
@@ -0,0 +1,73 @@
+import os
+import weakref
+
+import pytest
+
+from eth_contract import Contract
+from eth_contract import common
+from eth_contract.cache import ABICache
+
+
+@pytest.fixture()
+def empty_registry(monkeypatch):
+    monkeypatch.setattr(common, '_compiled_abis', {})
+
+
+def test_contract_stores_compiled_abis(tmpdir, math_contract_meta, empty_registry):
+    abi_cache = ABICache(str(tmpdir.join('abi-cache')))
+    Contract(math_contract_meta, 'Math', abi_cache=abi_cache)
+
+    assert os.path.exists(abi_cache.get_path(math_contract_meta['info']['abiDefinition']))
+
+
+def test_contract_loads_compiled_abis(tmpdir, math_contract_meta, monkeypatch):
+    abi_cache = ABICache(str(tmpdir))
+    Math = Contract(math_contract_meta, 'Math', abi_cache=abi_cache)
+    expected_call_data = Math.add.get_call_data((3, 4))
+    expected_signature = Math.add.encoded_abi_signature
+
+    # Simulate a fresh process, with no interned definitions to reuse, which
+    # must not compile anything.
+    monkeypatch.setattr(common, '_compiled_abis', weakref.WeakValueDictionary())
+    monkeypatch.setattr(common, '_definitions', weakref.WeakValueDictionary())
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Compiled ABI data should have been loaded from the cache")
+    monkeypatch.setattr(common, 'sha3', fail)
+
+    loaded_abis = []
+    original_load = ABICache.load
+
+    def recording_load(self, abi):
+        compiled_abis = original_load(self, abi)
+        loaded_abis.extend(compiled_abis or ())
+        return compiled_abis
+    monkeypatch.setattr(ABICache, 'load', recording_load)
+
+    CachedMath = Contract(math_contract_meta, 'Math', abi_cache=abi_cache)
+    assert CachedMath.add._abi is not Math.add._abi
+    assert any(compiled_abi is CachedMath.add._abi for compiled_abi in loaded_abis)
+    assert CachedMath.add.get_call_data((3, 4)) == expected_call_data
+    assert CachedMath.add.encoded_abi_signature == expected_signature
+
+
+def test_changed_abi_is_a_cache_miss(tmpdir, math_contract_meta, empty_registry):
+    abi_cache = ABICache(str(tmpdir))
+    Contract(math_contract_meta, 'Math', abi_cache=abi_cache)
+    abi = math_contract_meta['info']['abiDefinition']
+    assert abi_cache.load(abi) is not None
+
+    abi[0]['name'] = 'return14'
+    assert abi_cache.load(abi) is None
+
+
+def test_corrupt_cache_file_is_a_cache_miss(tmpdir, math_contract_meta, empty_registry):
+    abi_cache = ABICache(str(tmpdir))
+    abi = math_contract_meta['info']['abiDefinition']
+    with open(abi_cache.get_path(abi), 'wb') as cache_file:
+        cache_file.write(b'not a pickle')
+
+    assert abi_cache.load(abi) is None
+    Math = Contract(math_contract_meta, 'Math', abi_cache=abi_cache)
+    assert abi_cache.load(abi) is not None
+    assert Math.multiply7._abi.input_types == ('int256',)
@@ -0,0 +1,237 @@
+import sys
+
+import pytest
+
+if sys.version_info < (3, 5):
+    pytest.skip("asyncio contracts require python 3.5+", allow_module_level=True)
+
+import asyncio  # NOQA
+
+from eth_contract.aio import AsyncContract  # NOQA
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+TXN_HASH = '0x6c1cb2754147be0a6772657e1798a0b1c2c0bb9131d7badea3ae3fed4c6f103e'
+
+
+def encode_uint(value):
+    return '0x' + '{0:064x}'.format(value)
+
+
+def resolved(value):
+    return asyncio.sleep(0, result=value)
+
+
+class StubAsyncClient(object):
+    def __init__(self, outputs):
+        self.outputs = outputs
+        self.transactions = []
+        self.max_gas_requests = 0
+
+    def call(self, to, data, **kwargs):
+        return resolved(encode_uint(self.outputs[data]))
+
+    def get_max_gas(self):
+        self.max_gas_requests += 1
+        return resolved(1000000)
+
+    def estimate_gas(self, to, data, **kwargs):
+        return resolved(50000)
+
+    def send_transaction(self, **kwargs):
+        self.transactions.append(kwargs)
+        return resolved(TXN_HASH)
+
+    def wait_for_transaction(self, txn_hash, max_wait=60):
+        return resolved({'transactionHash': txn_hash, 'logs': []})
+
+    def get_transaction_receipt(self, txn_hash):
+        return resolved({'transactionHash': txn_hash, 'logs': []})
+
+    def get_transaction_count(self, account, block):
+        return resolved(7)
+
+
+@pytest.fixture()
+def AsyncMath(math_contract_meta):
+    return AsyncContract(math_contract_meta, 'Math')
+
+
+@pytest.fixture()
+def async_math(AsyncMath):
+    client = StubAsyncClient({
+        AsyncMath.return13.get_call_data(()): 13,
+        AsyncMath.multiply7.get_call_data((3,)): 21,
+        AsyncMath.add.get_call_data((25, 35)): 60,
+    })
+    return AsyncMath(ADDRESS, client)
+
+
+def run(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+def collect(async_iterator):
+    values = []
+    while True:
+        try:
+            values.append(run(async_iterator.__anext__()))
+        except StopAsyncIteration:
+            return values
+
+
+def test_async_call(async_math):
+    assert run(async_math.return13.call()) == 13
+    assert run(async_math.multiply7.call(3)) == 21
+
+
+def test_async_calls_are_concurrent(async_math):
+    results = run(asyncio.gather(
+        async_math.add.call(25, 35),
+        async_math.multiply7.call(3),
+    ))
+    assert results == [60, 21]
+
+
+def test_async_send_transaction(async_math):
+    txn_hash = run(async_math.add.sendTransaction(35, 45, value=1000))
+    assert txn_hash == TXN_HASH
+    transaction = async_math._meta.blockchain_client.transactions[0]
+    assert transaction['gas'] == 900000
+    assert transaction['value'] == 1000
+
+
+def test_async_synchronous_transaction_sending(async_math):
+    txn_hash, txn_receipt = run(async_math.add.s(35, 45))
+    assert txn_hash == TXN_HASH
+    assert txn_receipt['transactionHash'] == TXN_HASH
+
+
+def test_async_s_many(async_math):
+    results = run(async_math.add.s_many([(35, 45), (1, 2)]))
+    assert [txn_hash for txn_hash, _ in results] == [TXN_HASH, TXN_HASH]
+    assert len(async_math._meta.blockchain_client.transactions) == 2
+
+
+def test_async_call_many(async_math):
+    assert run(async_math.multiply7.call_many([(3,), (3,)])) == [21, 21]
+
+
+def test_async_batch(async_math):
+    batch = async_math.batch()
+    batch.return13()
+    batch.multiply7(3)
+    assert run(batch.execute()) == [13, 21]
+
+
+def test_async_batch_requires_async_with(async_math):
+    with pytest.raises(TypeError):
+        with async_math.batch():
+            pass
+
+
+def test_async_instrument(AsyncMath, async_math):
+    from eth_contract.instrument import TimingAggregator
+
+    aggregator = TimingAggregator()
+    math = AsyncMath(ADDRESS, async_math._meta.blockchain_client, instrument=aggregator)
+    run(math.multiply7.call(3))
+    run(math.add.s(25, 35))
+
+    summary = aggregator.summary()
+    assert list(summary['Math.multiply7']) == ['encode', 'rpc', 'decode']
+    assert list(summary['Math.add']) == ['encode', 'rpc', 'wait']
+
+
+def test_async_get_transaction_events(async_math):
+    assert run(async_math.get_transaction_events(TXN_HASH)) == []
+    assert run(async_math.get_transaction_events_many([TXN_HASH] * 3)) == [[], [], []]
+
+
+def test_async_nonce_manager(AsyncMath, async_math):
+    from eth_contract.nonce import NonceManager
+
+    client = async_math._meta.blockchain_client
+    math = AsyncMath(ADDRESS, client, nonce_manager=NonceManager(ADDRESS))
+    run(asyncio.gather(*(math.add.sendTransaction(25, 35) for _ in range(5))))
+    assert sorted(txn['nonce'] for txn in client.transactions) == [7, 8, 9, 10, 11]
+    run(math.add.sendTransaction(25, 35))
+    assert client.transactions[-1]['nonce'] == 12
+
+
+def test_async_gas_strategies(AsyncMath, async_math):
+    from eth_contract.aio import (
+        AsyncEstimateGasStrategy,
+        AsyncMaxGasStrategy,
+    )
+
+    client = async_math._meta.blockchain_client
+    math = AsyncMath(ADDRESS, client, gas_strategy=AsyncMaxGasStrategy(max_age=15))
+    for _ in range(3):
+        run(math.add.sendTransaction(25, 35))
+    assert client.max_gas_requests == 1
+    assert client.transactions[-1]['gas'] == 900000
+
+    math = AsyncMath(ADDRESS, client, gas_strategy=AsyncEstimateGasStrategy(multiplier=1.5))
+    run(math.add.sendTransaction(25, 35))
+    assert client.transactions[-1]['gas'] == 75000
+
+
+def test_async_contracts_reject_synchronous_gas_strategies(AsyncMath):
+    from eth_contract.gas import MaxGasStrategy
+
+    with pytest.raises(TypeError):
+        AsyncMath(ADDRESS, None, gas_strategy=MaxGasStrategy())
+
+
+def test_async_contracts_reject_receipt_watchers(AsyncMath):
+    from eth_contract.receipts import ReceiptWatcher
+
+    with pytest.raises(TypeError):
+        AsyncMath(ADDRESS, None, receipt_watcher=ReceiptWatcher(None))
+
+
+def test_async_contracts_reject_call_caches(AsyncMath):
+    from eth_contract.call_cache import LRUCallCache
+
+    with pytest.raises(TypeError):
+        AsyncMath(ADDRESS, None, call_cache=LRUCallCache())
+
+
+def test_async_event_scan(logs_events_contract_meta):
+    log_entry = {
+        'data': '0x' + '746573742d76616c5f61'.ljust(64, '0') + encode_uint(12345)[2:],
+        'address': ADDRESS,
+        'topics': [
+            '0xe5091e521791fb0fb6be999dcb6d5031d9f0a8032185b13790f8d2f95e163b1f',
+            '0x' + '11' * 32,
+        ],
+    }
+
+    class StubLogsClient(object):
+        requests = []
+
+        def get_block_number(self):
+            return resolved(15)
+
+        def get_logs(self, from_block, to_block, address, topics):
+            self.requests.append((from_block, to_block))
+            return resolved([log_entry] if from_block == 0 else [])
+
+    client = StubLogsClient()
+    logs_events = AsyncContract(logs_events_contract_meta, 'LogsEvents')(ADDRESS, client)
+
+    scan = logs_events.SingleIndex.scan(0, 'latest', chunk_size=10)
+    assert client.requests == []
+    decoded = collect(scan)
+    assert [d.args['val_b'] for d in decoded] == [12345]
+    assert client.requests == [(0, 9), (10, 15)]
+
+
+def test_async_contract_accepts_abi_cache_and_compact(tmpdir, math_contract_meta):
+    from eth_contract.cache import ABICache
+
+    abi_cache = ABICache(str(tmpdir))
+    AsyncMath = AsyncContract(math_contract_meta, 'Math', abi_cache=abi_cache, compact=True)
+    assert AsyncMath._config.source is None
+    assert abi_cache.load(math_contract_meta['info']['abiDefinition']) is not None
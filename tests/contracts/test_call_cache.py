@@ -0,0 +1,131 @@
+import sqlite3
+import threading
+
+import pytest
+
+from eth_contract.call_cache import (
+    LRUCallCache,
+    SQLiteCallCache,
+)
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+
+
+def encode_uint(value):
+    return '0x' + '{0:064x}'.format(value)
+
+
+class StubClient(object):
+    def __init__(self):
+        self.requests = []
+
+    def call(self, to, data, **kwargs):
+        self.requests.append(dict(kwargs, to=to, data=data))
+        return encode_uint(21)
+
+
+@pytest.fixture(params=['lru', 'sqlite'])
+def call_cache(request, tmpdir):
+    if request.param == 'lru':
+        return LRUCallCache()
+    return SQLiteCallCache(str(tmpdir.join('calls.sqlite')))
+
+
+def test_calls_at_a_block_number_are_cached(Math, call_cache):
+    client = StubClient()
+    math = Math(ADDRESS, client, call_cache=call_cache)
+
+    assert math.multiply7.call(3, block=100) == 21
+    assert math.multiply7.call(3, block=100) == 21
+    assert len(client.requests) == 1
+    assert (call_cache.hits, call_cache.misses) == (1, 1)
+
+    assert math.multiply7.call(3, block=101) == 21
+    assert math.multiply7.call(4, block=100) == 21
+    assert len(client.requests) == 3
+    assert (call_cache.hits, call_cache.misses) == (1, 3)
+
+
+@pytest.mark.parametrize(
+    'call_kwargs',
+    (
+        {},
+        {'block': 'latest'},
+        {'block': 'pending'},
+        {'block': 100, '_from': ADDRESS},
+    ),
+)
+def test_uncacheable_calls_are_not_cached(Math, call_cache, call_kwargs):
+    client = StubClient()
+    math = Math(ADDRESS, client, call_cache=call_cache)
+
+    math.multiply7.call(3, **call_kwargs)
+    math.multiply7.call(3, **call_kwargs)
+    assert len(client.requests) == 2
+    assert (call_cache.hits, call_cache.misses) == (0, 0)
+
+
+def test_cache_is_shared_by_instances(Math, call_cache):
+    client = StubClient()
+    Math(ADDRESS, client, call_cache=call_cache).multiply7.call(3, block=100)
+    Math(ADDRESS.upper(), client, call_cache=call_cache).multiply7.call(3, block=100)
+    assert len(client.requests) == 1
+
+
+def test_raw_output_is_cached_with_its_type(Math, call_cache):
+    math = Math(ADDRESS, StubClient(), call_cache=call_cache)
+    output = math.multiply7.call(3, block=100, raw=True)
+    assert math.multiply7.call(3, block=100, raw=True) == output
+    assert type(math.multiply7.call(3, block=100, raw=True)) is type(output)
+
+
+def test_lru_call_cache_is_bounded():
+    call_cache = LRUCallCache(max_size=2)
+    call_cache.store((b'a', b'0x1', 1), 'one')
+    call_cache.store((b'a', b'0x2', 1), 'two')
+    call_cache.load((b'a', b'0x1', 1))
+    call_cache.store((b'a', b'0x3', 1), 'three')
+
+    assert len(call_cache) == 2
+    assert call_cache.load((b'a', b'0x1', 1)) == 'one'
+    with pytest.raises(KeyError):
+        call_cache.load((b'a', b'0x2', 1))
+
+
+def test_sqlite_call_cache_is_shared(tmpdir):
+    path = str(tmpdir.join('calls.sqlite'))
+    SQLiteCallCache(path).store((b'0xabc', b'0x1234', 100), '0x01')
+    assert SQLiteCallCache(path).load((b'0xabc', b'0x1234', 100)) == '0x01'
+
+
+def test_sqlite_call_cache_stores_raw_outputs(tmpdir):
+    path = str(tmpdir.join('calls.sqlite'))
+    call_cache = SQLiteCallCache(path)
+    call_cache.store((b'0xabc', b'0x1234', 100), b'0x01')
+    call_cache.store((b'0xabc', b'0x1234', 101), u'0x02')
+    call_cache.store((b'0xabc', b'0x1234', 102), object())
+
+    assert call_cache.load((b'0xabc', b'0x1234', 100)) == b'0x01'
+    assert call_cache.load((b'0xabc', b'0x1234', 101)) == u'0x02'
+    with pytest.raises(KeyError):
+        call_cache.load((b'0xabc', b'0x1234', 102))
+    rows = sqlite3.connect(path).execute(
+        "SELECT typeof(output) FROM call_outputs ORDER BY block"
+    ).fetchall()
+    assert [row[0] for row in rows] == ['blob', 'text']
+
+
+def test_call_cache_counts_are_thread_safe(Math, call_cache):
+    math = Math(ADDRESS, StubClient(), call_cache=call_cache)
+
+    def call():
+        for _ in range(50):
+            math.multiply7.call(3, block=100)
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert call_cache.hits + call_cache.misses == 200
@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+
+from eth_contract.client import ClientPool
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+
+
+class StubClient(object):
+    """
+    Fails if it is used by more than one thread at a time.
+    """
+    instances = None
+
+    def __init__(self):
+        self.in_use = False
+        self.threads = set()
+        self.instances.append(self)
+
+    def call(self, to, data, **kwargs):
+        assert not self.in_use, "Client used concurrently"
+        self.in_use = True
+        self.threads.add(threading.current_thread().name)
+        time.sleep(0.001)
+        self.in_use = False
+        return '0x' + '{0:064x}'.format(21)
+
+
+@pytest.fixture()
+def instances(monkeypatch):
+    instances = []
+    monkeypatch.setattr(StubClient, 'instances', instances)
+    return instances
+
+
+def run_threads(target, num_threads):
+    threads = [threading.Thread(target=target) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_clients_are_not_shared_between_threads(Math, instances):
+    client_pool = ClientPool(StubClient, max_clients=4)
+    math = Math(ADDRESS, client_pool)
+    results = []
+
+    def call_many():
+        for _ in range(20):
+            results.append(math.multiply7.call(3))
+
+    run_threads(call_many, 16)
+
+    assert results == [21] * 320
+    assert 1 <= len(instances) <= 4
+    assert client_pool.num_clients == len(instances)
+
+
+def test_thread_reuses_its_client(instances):
+    client_pool = ClientPool(StubClient, max_clients=4)
+    for _ in range(5):
+        client_pool.call(to=ADDRESS, data='0x')
+    assert len(instances) == 1
+
+
+def test_pool_limits_concurrent_requests(instances):
+    client_pool = ClientPool(StubClient, max_clients=2)
+    clients = [client_pool.acquire(), client_pool.acquire()]
+    acquired = []
+    thread = threading.Thread(target=lambda: acquired.append(client_pool.acquire()))
+    thread.start()
+    thread.join(0.05)
+    assert acquired == []
+
+    client_pool.release(clients[0])
+    thread.join()
+    assert acquired == [clients[0]]
+
+
+def test_missing_methods_raise_attribute_error(instances):
+    client_pool = ClientPool(StubClient)
+    assert not hasattr(client_pool, 'batch_call')
+    assert hasattr(client_pool, 'call')
+
+
+def test_failed_client_creation_is_not_counted():
+    def fail():
+        raise ValueError("Cannot connect")
+    client_pool = ClientPool(fail, max_clients=1)
+    with pytest.raises(ValueError):
+        client_pool.acquire()
+    with pytest.raises(ValueError):
+        client_pool.acquire()
+    assert client_pool.num_clients == 0
@@ -0,0 +1,119 @@
+import copy
+import gc
+import pickle
+import weakref
+
+import pytest
+
+from eth_contract import Contract
+from eth_contract import common
+from eth_contract.common import (
+    ABIParam,
+    get_abi_params,
+)
+from eth_contract.registry import ContractRegistry
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+
+
+def test_identical_definitions_are_shared(math_contract_meta):
+    MathA = Contract(math_contract_meta, 'MathA')
+    MathB = Contract(copy.deepcopy(math_contract_meta), 'MathB')
+
+    assert MathA.multiply7 is MathB.multiply7
+    assert MathA.add.inputs is MathB.add.inputs
+
+    math_a = MathA(ADDRESS, None)
+    math_b = MathB(ADDRESS, None)
+    assert math_a.multiply7.contract is math_a
+    assert math_b.multiply7.contract is math_b
+
+
+def test_different_definitions_are_not_shared(math_contract_meta):
+    other_meta = copy.deepcopy(math_contract_meta)
+    other_meta['info']['abiDefinition'][2]['constant'] = True
+    assert Contract(math_contract_meta, 'A').multiply7 is not Contract(other_meta, 'B').multiply7
+
+
+def test_unused_definitions_are_released(math_contract_meta):
+    contract_meta = copy.deepcopy(math_contract_meta)
+    for item in contract_meta['info']['abiDefinition']:
+        if 'name' in item:
+            item['name'] += 'Released'
+    Math = Contract(contract_meta, 'Math')
+    num_definitions = len(common._definitions)
+    num_compiled_abis = len(common._compiled_abis)
+
+    del Math
+    gc.collect()
+    assert len(common._definitions) < num_definitions
+    assert len(common._compiled_abis) < num_compiled_abis
+
+
+def test_unused_params_are_released():
+    params = get_abi_params([{'name': 'releasedValue', 'type': 'uint256'}])
+    param_ref = weakref.ref(params[0])
+    params_ref = weakref.ref(params)
+    assert get_abi_params([{'name': 'releasedValue', 'type': 'uint256'}]) is params
+
+    del params
+    gc.collect()
+    assert params_ref() is None
+    assert param_ref() is None
+
+
+def test_params_are_shared_after_registry_evictions(math_contract_meta):
+    registry = ContractRegistry(max_classes=1)
+    registry.add(math_contract_meta, 'MathA')
+    registry.add(copy.deepcopy(math_contract_meta), 'MathB')
+
+    MathA = registry['MathA']
+    MathB = registry['MathB']
+    assert 'MathA' not in registry._classes
+    assert MathA.add.inputs is MathB.add.inputs
+    assert get_abi_params([{'name': 'a', 'type': 'int256'}])[0] is MathA.add.inputs[0]
+
+
+def test_params_are_compact(Math):
+    param = Math.add.inputs[0]
+    assert isinstance(param, ABIParam)
+    assert param == ('a', 'int256', None)
+    assert param['name'] == param.name == 'a'
+    assert param['type'] == param.type == 'int256'
+    assert param['indexed'] is None
+    assert param.get('components') is None
+    with pytest.raises(KeyError):
+        param['components']
+    assert param.to_dict() == {'name': 'a', 'type': 'int256'}
+    assert pickle.loads(pickle.dumps(param)) == param
+
+
+def test_param_lists_are_interned():
+    params = get_abi_params([{'name': 'value', 'type': 'uint256', 'indexed': False}])
+    assert params == (ABIParam('value', 'uint256', False),)
+    assert get_abi_params([{'name': 'value', 'type': 'uint256', 'indexed': False}]) is params
+    assert get_abi_params(params) is params
+    assert get_abi_params(None) == ()
+    assert pickle.loads(pickle.dumps(params)) == params
+
+
+def test_compact_contract(math_contract_meta):
+    Math = Contract(math_contract_meta, 'Math', compact=True)
+    assert Math.__doc__ is None
+    assert Math._config.source is None
+    FullMath = Contract(math_contract_meta, 'FullMath')
+    assert Math.multiply7.get_call_data((3,)) == FullMath.multiply7.get_call_data((3,))
+
+    def key(item):
+        return item['name']
+
+    expected = sorted(math_contract_meta['info']['abiDefinition'], key=key)
+    assert sorted(Math._config.abi, key=key) == expected
+
+
+def test_full_contract_keeps_source_and_abi(math_contract_meta):
+    Math = Contract(math_contract_meta, 'Math')
+    assert 'multiply7' in Math.__doc__
+    assert Math._config.source == math_contract_meta['info']['source']
+    assert Math._config.abi is math_contract_meta['info']['abiDefinition']
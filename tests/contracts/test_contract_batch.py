@@ -0,0 +1,166 @@
+import copy
+
+import pytest
+
+from eth_contract.batch import (
+    encode_multicall_data,
+    decode_multicall_result,
+)
+
+
+ADDRESS_A = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+ADDRESS_B = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+MULTICALL_ADDRESS = '0x0000000000000000000000000000000000000001'
+
+
+def encode_uint(value):
+    return '0x' + '{0:064x}'.format(value)
+
+
+class StubClient(object):
+    """
+    Answers calls to the Math contract without a running chain.
+    """
+    results = {
+        b'16216f39': 13,
+        b'dcf537b10000000000000000000000000000000000000000000000000000000000000003': 21,
+        b'a5f3c23b00000000000000000000000000000000000000000000000000000000000000030000000000000000000000000000000000000000000000000000000000000004': 7,  # NOQA
+    }
+
+    def __init__(self):
+        self.requests = []
+
+    def call(self, to, data, **kwargs):
+        self.requests.append([dict(kwargs, to=to, data=data)])
+        return encode_uint(self.results[data])
+
+
+class StubBatchClient(StubClient):
+    def call(self, to, data, **kwargs):
+        raise AssertionError("Batched calls should not use `call`")
+
+    def batch_call(self, calls):
+        self.requests.append(calls)
+        return [encode_uint(self.results[call['data']]) for call in calls]
+
+
+def test_batch_without_batch_support(Math):
+    client = StubClient()
+    math = Math(ADDRESS_A, client)
+    with math.batch() as batch:
+        return13 = batch.return13()
+        multiply7 = batch.multiply7(3)
+
+    assert return13.result == 13
+    assert multiply7.result == 21
+    assert batch.results == [13, 21]
+    assert len(client.requests) == 2
+
+
+def test_batch_uses_single_round_trip(Math):
+    client = StubBatchClient()
+    math = Math(ADDRESS_A, client)
+    with math.batch(block=12) as batch:
+        batch.return13()
+        batch.multiply7(3)
+        batch.add(3, 4)
+
+    assert batch.results == [13, 21, 7]
+    assert len(client.requests) == 1
+    assert [call['to'] for call in client.requests[0]] == [ADDRESS_A] * 3
+    assert [call['block'] for call in client.requests[0]] == [12] * 3
+
+
+def test_batch_is_chunked(Math):
+    client = StubBatchClient()
+    math = Math(ADDRESS_A, client)
+    results = math.multiply7.call_many([(3,)] * 25, batch_size=10)
+
+    assert results == [21] * 25
+    assert [len(request) for request in client.requests] == [10, 10, 5]
+
+
+def test_call_many_ignores_abi_functions_named_batch(math_contract_meta):
+    from eth_contract import Contract
+
+    contract_meta = copy.deepcopy(math_contract_meta)
+    contract_meta['info']['abiDefinition'].append({
+        'type': 'function',
+        'name': 'batch',
+        'constant': False,
+        'inputs': [],
+        'outputs': [],
+    })
+    client = StubBatchClient()
+    math = Contract(contract_meta, 'Math')(ADDRESS_A, client)
+    assert math.multiply7.call_many([(3,)] * 2) == [21, 21]
+    assert [len(request) for request in client.requests] == [2]
+
+
+def test_batch_results_unavailable_before_execution(Math):
+    math = Math(ADDRESS_A, StubBatchClient())
+    batch = math.batch()
+    call = batch.return13()
+    with pytest.raises(AttributeError):
+        call.result
+    batch.execute()
+    assert call.result == 13
+
+
+def test_batch_not_executed_on_error(Math):
+    client = StubBatchClient()
+    math = Math(ADDRESS_A, client)
+    with pytest.raises(ValueError):
+        with math.batch() as batch:
+            batch.return13()
+            raise ValueError("boom")
+    assert client.requests == []
+
+
+MULTICALL_DATA = b'252dba4200000000000000000000000000000000000000000000000000000000000000200000000000000000000000000000000000000000000000000000000000000002000000000000000000000000000000000000000000000000000000000000004000000000000000000000000000000000000000000000000000000000000000c0000000000000000000000000c305c901078781c232a2a521c2af7980f8385ee90000000000000000000000000000000000000000000000000000000000000040000000000000000000000000000000000000000000000000000000000000000416216f3900000000000000000000000000000000000000000000000000000000000000000000000000000000d3cda913deb6f67967b99d67acdfa1712c29360100000000000000000000000000000000000000000000000000000000000000400000000000000000000000000000000000000000000000000000000000000024dcf537b1000000000000000000000000000000000000000000000000000000000000000300000000000000000000000000000000000000000000000000000000'  # NOQA
+MULTICALL_RESULT = '0x000000000000000000000000000000000000000000000000000000000000000c00000000000000000000000000000000000000000000000000000000000000400000000000000000000000000000000000000000000000000000000000000002000000000000000000000000000000000000000000000000000000000000004000000000000000000000000000000000000000000000000000000000000000800000000000000000000000000000000000000000000000000000000000000020000000000000000000000000000000000000000000000000000000000000000d00000000000000000000000000000000000000000000000000000000000000200000000000000000000000000000000000000000000000000000000000000015'  # NOQA
+
+
+def test_encode_multicall_data():
+    data = encode_multicall_data([
+        (ADDRESS_A, b'16216f39'),
+        (ADDRESS_B, b'dcf537b10000000000000000000000000000000000000000000000000000000000000003'),
+    ])
+    assert data == MULTICALL_DATA
+
+
+def test_decode_multicall_result():
+    block_number, return_data = decode_multicall_result(MULTICALL_RESULT)
+    assert block_number == 12
+    assert return_data == [
+        b'0x000000000000000000000000000000000000000000000000000000000000000d',
+        b'0x0000000000000000000000000000000000000000000000000000000000000015',
+    ]
+
+
+class StubMulticallClient(object):
+    def __init__(self):
+        self.requests = []
+
+    def call(self, to, data, **kwargs):
+        self.requests.append(dict(kwargs, to=to, data=data))
+        return MULTICALL_RESULT
+
+
+def test_batch_through_multicall(Math):
+    client = StubMulticallClient()
+    math_a = Math(ADDRESS_A, client)
+    math_b = Math(ADDRESS_B, client)
+    with math_a.batch(multicall_address=MULTICALL_ADDRESS) as batch:
+        batch.return13()
+        batch.add_call(math_b.multiply7, 3)
+
+    assert batch.results == [13, 21]
+    assert client.requests == [{'to': MULTICALL_ADDRESS, 'data': MULTICALL_DATA}]
+
+
+def test_multicall_rejects_per_call_kwargs(Math):
+    math = Math(ADDRESS_A, StubMulticallClient())
+    batch = math.batch(multicall_address=MULTICALL_ADDRESS)
+    with pytest.raises(ValueError):
+        batch.return13(block=12)
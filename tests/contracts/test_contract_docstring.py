@@ -0,0 +1,30 @@
+import inspect
+
+from eth_contract import Contract
+from eth_contract.functions import Function
+
+
+def test_docstring_is_generated_on_access(monkeypatch, math_contract_meta):
+    calls = []
+    original_str = Function.__str__
+
+    def counting_str(self):
+        calls.append(self.name)
+        return original_str(self)
+
+    monkeypatch.setattr(Function, '__str__', counting_str)
+    Math = Contract(math_contract_meta, 'Math')
+    assert calls == []
+
+    docstring = Math.__doc__
+    assert 'contract Math {' in docstring
+    assert 'multiply7(int256 a)' in docstring
+    assert len(calls) == len(Math._config._functions)
+    assert Math.__doc__ is docstring
+    assert len(calls) == len(Math._config._functions)
+
+
+def test_docstring_is_visible_to_help(math_contract_meta):
+    Math = Contract(math_contract_meta, 'Math')
+    assert 'contract Math {' in inspect.getdoc(Math)
+    assert Math(None, None).__doc__ is Math.__doc__
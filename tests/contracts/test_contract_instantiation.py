@@ -0,0 +1,58 @@
+from eth_contract import (
+    Contract,
+    Function,
+    FunctionGroup,
+)
+
+
+ADDRESS_A = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+ADDRESS_B = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+
+
+def test_instances_only_store_address_and_client(Math):
+    math = Math(ADDRESS_A, None)
+    assert math._meta.address == ADDRESS_A
+    assert math._meta.blockchain_client is None
+    assert not hasattr(math._meta, '__dict__')
+
+
+def test_functions_are_bound_on_access(Math):
+    math_a = Math(ADDRESS_A, None)
+    math_b = Math(ADDRESS_B, None)
+
+    assert isinstance(Math.add, Function)
+    assert Math.add._contract is None
+
+    assert math_a.add.contract is math_a
+    assert math_b.add.contract is math_b
+    assert math_a.add._abi is Math.add._abi
+
+
+def test_events_are_bound_on_access(LogsEvents):
+    logs_events = LogsEvents(ADDRESS_A, None)
+    assert logs_events.SingleIndex.contract is logs_events
+    assert LogsEvents.SingleIndex._contract is None
+
+
+def test_function_groups_are_bound_on_access(math_contract_meta):
+    math_contract_meta['info']['abiDefinition'].append({
+        'inputs': [
+            {'type': 'int256', 'name': 'a'},
+            {'type': 'int256', 'name': 'b'},
+            {'type': 'int256', 'name': 'c'},
+        ],
+        'constant': False,
+        'type': 'function',
+        'name': 'add',
+        'outputs': [
+            {'type': 'int256', 'name': 'result'}
+        ],
+    })
+    Math = Contract(math_contract_meta, 'Math')
+    math_a = Math(ADDRESS_A, None)
+    math_b = Math(ADDRESS_B, None)
+
+    assert isinstance(Math.add, FunctionGroup)
+    assert math_a.add.get_function_for_call_signature((1, 2)).contract is math_a
+    assert math_b.add.get_function_for_call_signature((1, 2, 3)).contract is math_b
+    assert Math.add.get_function_for_call_signature((1, 2))._contract is None
@@ -0,0 +1,115 @@
+import copy
+import threading
+
+import pytest
+
+from eth_contract.registry import (
+    ContractRegistry,
+    get_code_hash,
+)
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+OTHER_ADDRESS = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+
+
+@pytest.fixture()
+def registry(math_contract_meta):
+    registry = ContractRegistry(max_classes=2)
+    for idx in range(5):
+        contract_meta = copy.deepcopy(math_contract_meta)
+        contract_meta['code'] += '{0:02x}'.format(idx)
+        registry.add(contract_meta, 'Math{0}'.format(idx))
+    return registry
+
+
+def test_classes_are_built_on_first_lookup(registry):
+    assert len(registry) == 5
+    assert 'Math0' in registry
+    assert registry.num_classes == 0
+
+    Math0 = registry['Math0']
+    assert Math0.__name__ == 'Math0'
+    assert Math0.multiply7.get_call_data((3,))
+    assert registry['Math0'] is Math0
+    assert (registry.hits, registry.misses) == (1, 1)
+
+    with pytest.raises(KeyError):
+        registry['Unknown']
+    assert registry.get('Unknown') is None
+
+
+def test_least_recently_used_classes_are_dropped(registry):
+    Math0 = registry['Math0']
+    registry['Math1']
+    registry['Math0']
+    registry['Math2']
+    assert registry.num_classes == 2
+    assert registry['Math0'] is Math0
+    assert registry['Math1'] is not None
+    assert registry.misses == 4
+
+
+def test_lookup_by_address(registry):
+    registry.add_address(ADDRESS.upper().replace('0X', '0x'), 'Math3')
+    assert registry.get_by_address(ADDRESS) is registry['Math3']
+    assert registry.get_by_address(OTHER_ADDRESS) is None
+
+    math = registry.at(ADDRESS, None)
+    assert math._meta.address == ADDRESS
+    assert isinstance(math, registry['Math3'])
+    with pytest.raises(KeyError):
+        registry.at(OTHER_ADDRESS, None)
+    with pytest.raises(KeyError):
+        registry.add_address(OTHER_ADDRESS, 'Unknown')
+
+
+def test_lookup_by_code_hash(registry, math_contract_meta):
+    code = math_contract_meta['code'] + '04'
+    assert registry.get_by_code(code) is registry['Math4']
+    assert registry.get_by_code_hash(b'0x' + get_code_hash(code).upper()) is registry['Math4']
+    assert registry.get_by_code(math_contract_meta['code']) is None
+
+
+def test_lookup_by_runtime_code_hash(math_contract_meta):
+    registry = ContractRegistry()
+    contract_meta = dict(math_contract_meta, code_runtime='0x6060604052')
+    registry.add(contract_meta, 'Math', addresses=[ADDRESS])
+    assert registry.get_by_code('0x6060604052') is registry['Math']
+    assert registry.get_by_address(ADDRESS) is registry['Math']
+
+
+def test_adding_a_name_again_replaces_it(registry, math_contract_meta):
+    Math0 = registry['Math0']
+    registry.add(math_contract_meta, 'Math0')
+    assert registry['Math0'] is not Math0
+
+
+def test_adding_a_name_again_drops_its_addresses_and_code(registry, math_contract_meta):
+    old_code = math_contract_meta['code'] + '00'
+    registry.add_address(ADDRESS, 'Math0')
+    registry.add_address(OTHER_ADDRESS, 'Math1')
+    assert registry.get_by_code(old_code) is registry['Math0']
+
+    contract_meta = dict(math_contract_meta, code=math_contract_meta['code'] + 'ff')
+    registry.add(contract_meta, 'Math0', addresses=[OTHER_ADDRESS])
+    assert registry.get_by_code(old_code) is None
+    assert registry.get_by_address(ADDRESS) is None
+    assert registry.get_by_code(contract_meta['code']) is registry['Math0']
+    assert registry.get_by_address(OTHER_ADDRESS) is registry['Math0']
+
+    registry.add(math_contract_meta, 'Math1')
+    assert registry.get_by_address(OTHER_ADDRESS) is registry['Math0']
+
+
+def test_concurrent_lookups_share_a_class(registry):
+    classes = []
+    threads = [
+        threading.Thread(target=lambda: classes.append(registry['Math1']))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(contract_class is classes[0] for contract_class in classes)
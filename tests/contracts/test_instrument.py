@@ -0,0 +1,155 @@
+import pytest
+
+from eth_contract import Contract
+from eth_contract.instrument import (
+    Instrument,
+    TimingAggregator,
+    get_data_size,
+    percentile,
+)
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+
+TXN_HASH = '0x' + 'ab' * 32
+
+
+class StubClient(object):
+    def __init__(self):
+        self.receipt = {'logs': []}
+
+    def call(self, to, data, **kwargs):
+        return '0x' + '{0:064x}'.format(21)
+
+    def get_max_gas(self):
+        return 1000000
+
+    def send_transaction(self, **kwargs):
+        return TXN_HASH
+
+    def wait_for_transaction(self, txn_hash, max_wait):
+        return {'transactionHash': txn_hash}
+
+    def get_transaction_receipt(self, txn_hash):
+        return self.receipt
+
+
+class RecordingInstrument(Instrument):
+    def __init__(self):
+        self.records = []
+
+    def record(self, source, phase, duration, num_bytes):
+        assert duration >= 0
+        self.records.append((source.name, phase, num_bytes))
+
+
+@pytest.fixture()
+def Token():
+    return Contract({
+        'code': '0x',
+        'info': {
+            'source': '',
+            'abiDefinition': [
+                {
+                    'type': 'event',
+                    'name': 'Transfer',
+                    'anonymous': False,
+                    'inputs': [
+                        {'indexed': True, 'type': 'address', 'name': 'from'},
+                        {'indexed': True, 'type': 'address', 'name': 'to'},
+                        {'indexed': False, 'type': 'uint256', 'name': 'value'},
+                    ],
+                },
+            ],
+        },
+    }, 'Token')
+
+
+def test_call_records_encode_rpc_and_decode(Math):
+    instrument = RecordingInstrument()
+    math = Math(ADDRESS, StubClient(), instrument=instrument)
+    assert math.multiply7.call(3) == 21
+    assert instrument.records == [
+        ('multiply7', 'encode', 36),
+        ('multiply7', 'rpc', 32),
+        ('multiply7', 'decode', 32),
+    ]
+
+
+def test_raw_call_skips_decode(Math):
+    instrument = RecordingInstrument()
+    Math(ADDRESS, StubClient(), instrument=instrument).multiply7.call(3, raw=True)
+    assert [phase for _, phase, _ in instrument.records] == ['encode', 'rpc']
+
+
+def test_send_transaction_and_s_record_the_wait(Math):
+    instrument = RecordingInstrument()
+    math = Math(ADDRESS, StubClient(), instrument=instrument)
+    assert math.add(1, 2) == TXN_HASH
+    math.add.s(1, 2)
+    assert instrument.records == [
+        ('add', 'encode', 68),
+        ('add', 'rpc', 32),
+        ('add', 'encode', 68),
+        ('add', 'rpc', 32),
+        ('add', 'wait', 0),
+    ]
+
+
+def test_get_transaction_logs_records_the_rpc(Token):
+    instrument = RecordingInstrument()
+    client = StubClient()
+    token = Token(ADDRESS, client, instrument=instrument)
+    client.receipt = {'logs': [
+        {'topics': [token.Transfer.event_topic], 'data': '0x' + '00' * 32},
+        {'topics': [b'0x1234'], 'data': '0x' + '00' * 64},
+    ]}
+    assert len(token.Transfer.get_transaction_logs(TXN_HASH)) == 1
+    client.receipt = None
+    assert token.Transfer.get_transaction_logs(TXN_HASH) is None
+    assert instrument.records == [('Transfer', 'rpc', 32), ('Transfer', 'rpc', 0)]
+
+
+def test_timing_aggregator_summary(Math):
+    aggregator = TimingAggregator()
+    math = Math(ADDRESS, StubClient(), instrument=aggregator)
+    for value in range(10):
+        math.multiply7.call(value)
+    math.add(1, 2)
+
+    summary = aggregator.summary()
+    assert list(summary) == ['Math.add', 'Math.multiply7']
+    assert list(summary['Math.multiply7']) == ['encode', 'rpc', 'decode']
+    stats = summary['Math.multiply7']['rpc']
+    assert stats['count'] == 10
+    assert stats['bytes'] == 320
+    assert 0 <= stats['p50'] <= stats['p99']
+    assert summary['Math.add']['encode']['count'] == 1
+    assert 'Math.multiply7' in aggregator.report()
+
+    aggregator.reset()
+    assert aggregator.summary() == {}
+
+
+def test_timing_aggregator_keeps_recent_samples(Math):
+    aggregator = TimingAggregator(max_samples=3)
+    math = Math(ADDRESS, StubClient(), instrument=aggregator)
+    for value in range(5):
+        math.multiply7.call(value)
+    assert aggregator.summary()['Math.multiply7']['rpc']['count'] == 5
+    assert len(aggregator._stats[('Math.multiply7', 'rpc')].durations) == 3
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([7], 0.99) == 7
+    assert percentile([], 0.5) is None
+
+
+def test_get_data_size():
+    assert get_data_size('0x' + '00' * 32) == 32
+    assert get_data_size(b'0x1234') == 2
+    assert get_data_size(None) == 0
+    assert get_data_size([{'data': '0x1234'}, {'data': '0x'}]) == 2
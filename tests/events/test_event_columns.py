@@ -0,0 +1,139 @@
+import binascii
+
+import pytest
+
+from eth_contract.events import Event
+
+
+SENDER = 'c305c901078781c232a2a521c2af7980f8385ee9'
+RECEIVER = 'd3cda913deb6f67967b99d67acdfa1712c293601'
+TRANSFER_TOPIC = '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+
+
+@pytest.fixture()
+def Transfer():
+    return Event('Transfer', [
+        {'indexed': True, 'type': 'address', 'name': 'from'},
+        {'indexed': True, 'type': 'address', 'name': 'to'},
+        {'indexed': False, 'type': 'uint256', 'name': 'value'},
+        {'indexed': False, 'type': 'uint64', 'name': 'nonce'},
+        {'indexed': False, 'type': 'int8', 'name': 'delta'},
+        {'indexed': False, 'type': 'bool', 'name': 'flag'},
+    ], False)
+
+
+def make_transfer_log(value, nonce, delta, flag):
+    return {
+        'topics': [
+            TRANSFER_TOPIC,
+            '0x' + SENDER.rjust(64, '0'),
+            '0x' + RECEIVER.rjust(64, '0'),
+        ],
+        'data': '0x' + ''.join([
+            '{0:064x}'.format(value),
+            '{0:064x}'.format(nonce),
+            '{0:064x}'.format(delta % 2 ** 8),
+            '{0:064x}'.format(flag),
+        ]),
+    }
+
+
+transfer_logs = [
+    make_transfer_log(2 ** 255 + 1, 1, -5, True),
+    make_transfer_log(1000, 2 ** 64 - 1, 7, False),
+]
+
+
+def test_columns_match_get_log_data(Transfer):
+    columns = Transfer.get_log_columns(transfer_logs, indexed=True, as_arrays=False)
+
+    assert list(columns) == ['from', 'to', 'value', 'nonce', 'delta', 'flag']
+    for row, log_entry in enumerate(transfer_logs):
+        log_data = Transfer.get_log_data(log_entry)
+        for name, value in log_data.items():
+            assert columns[name][row] == value
+    assert columns['from'] == [SENDER.encode('ascii')] * 2
+    assert columns['value'] == [2 ** 255 + 1, 1000]
+    assert columns['delta'] == [-5, 7]
+
+
+def test_columns_without_indexed_fields(Transfer):
+    columns = Transfer.get_log_columns(transfer_logs, as_arrays=False)
+    assert list(columns) == ['value', 'nonce', 'delta', 'flag']
+
+
+def test_columns_of_dynamic_data():
+    event = Event('Data', [
+        {'indexed': False, 'type': 'bytes', 'name': 'data'},
+        {'indexed': False, 'type': 'uint256', 'name': 'value'},
+    ], False)
+    log_entry = {
+        'data': '0x' + ''.join([
+            '{0:064x}'.format(64),
+            '{0:064x}'.format(12345),
+            '{0:064x}'.format(3),
+            '616263'.ljust(64, '0'),
+        ]),
+        'topics': [],
+    }
+    columns = event.get_log_columns([log_entry, log_entry], as_arrays=False)
+    assert columns == {'data': [b'abc', b'abc'], 'value': [12345, 12345]}
+
+
+def test_array_columns(Transfer):
+    numpy = pytest.importorskip('numpy')
+    columns = Transfer.get_log_columns(transfer_logs, indexed=True, as_arrays=True)
+
+    assert columns['from'].dtype == numpy.dtype('V20')
+    assert columns['from'].tolist() == [bytes(bytearray.fromhex(SENDER))] * 2
+    assert columns['nonce'].dtype == numpy.uint64
+    assert columns['nonce'].tolist() == [1, 2 ** 64 - 1]
+    assert columns['delta'].dtype == numpy.int64
+    assert columns['delta'].tolist() == [-5, 7]
+    assert columns['flag'].tolist() == [True, False]
+    assert columns['value'].dtype == object
+    assert columns['value'].tolist() == [2 ** 255 + 1, 1000]
+
+
+def test_wide_ints_as_bytes(Transfer):
+    numpy = pytest.importorskip('numpy')
+    columns = Transfer.get_log_columns(transfer_logs, as_arrays=True, wide_ints_as_bytes=True)
+    assert columns['value'].dtype == numpy.dtype('V32')
+    assert columns['value'].tolist()[1] == b'\x00' * 30 + b'\x03\xe8'
+
+
+def test_array_columns_keep_trailing_zero_bytes():
+    pytest.importorskip('numpy')
+    event = Event('Stored', [
+        {'indexed': True, 'type': 'address', 'name': 'owner'},
+        {'indexed': False, 'type': 'uint256', 'name': 'value'},
+        {'indexed': False, 'type': 'bytes4', 'name': 'tag'},
+    ], False)
+    owner = 'c305c901078781c232a2a521c2af7980f8385e00'
+    log_entry = {
+        'topics': ['0x' + '00' * 32, '0x' + owner.rjust(64, '0')],
+        'data': '0x' + '{0:064x}'.format(10 ** 18) + '61620000'.ljust(64, '0'),
+    }
+
+    columns = event.get_log_columns([log_entry], indexed=True, as_arrays=True)
+    assert columns['owner'].tolist() == [bytes(bytearray.fromhex(owner))]
+    assert columns['tag'].tolist() == [b'ab\x00\x00']
+
+    columns = event.get_log_columns([log_entry], as_arrays=True, wide_ints_as_bytes=True)
+    value_bytes = columns['value'].tolist()[0]
+    assert len(value_bytes) == 32
+    assert int(binascii.hexlify(value_bytes), 16) == 10 ** 18
+
+
+def test_array_columns_of_values_wider_than_64_bits(Transfer):
+    pytest.importorskip('numpy')
+    log_entry = make_transfer_log(1, 1, 0, True)
+    log_entry['data'] = log_entry['data'][:-192] + 'f' * 64 + log_entry['data'][-128:]
+    columns = Transfer.get_log_columns([log_entry], as_arrays=True)
+    assert columns['nonce'].dtype == object
+    assert columns['nonce'].tolist() == [Transfer.get_log_data(log_entry)['nonce']]
+
+
+def test_empty_logs(Transfer):
+    columns = Transfer.get_log_columns([], indexed=True, as_arrays=False)
+    assert all(column == [] for column in columns.values())
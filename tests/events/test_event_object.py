@@ -6,3 +6,10 @@ def test_abi_signatures(LogsEvents):
     assert LogsEvents.DoubleIndex.abi_signature == 2525890609
     assert LogsEvents.DoubleIndex.encoded_abi_signature == b'\x96\x8e\x081'
     assert LogsEvents.DoubleIndex.event_topic == b'0x968e08311bcc13cd5d4feae6a3c87bedb195ab51905c8ec75a10580b5b5854c7'
+
+
+def test_event_topic_is_shared_between_instances(LogsEvents):
+    instance_a = LogsEvents('0xc305c901078781c232a2a521c2af7980f8385ee9', None)
+    instance_b = LogsEvents('0xd3cda913deb6f67967b99d67acdfa1712c293601', None)
+    assert instance_a.SingleIndex._abi is LogsEvents.SingleIndex._abi
+    assert instance_b.SingleIndex._abi is LogsEvents.SingleIndex._abi
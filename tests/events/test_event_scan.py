@@ -0,0 +1,110 @@
+import pytest
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+SINGLE_INDEX_TOPIC = '0xe5091e521791fb0fb6be999dcb6d5031d9f0a8032185b13790f8d2f95e163b1f'
+
+
+def make_log(block_number):
+    return {
+        'data': '0x' + '746573742d76616c5f61'.ljust(64, '0') + '{0:064x}'.format(block_number),
+        'address': ADDRESS,
+        'topics': [
+            SINGLE_INDEX_TOPIC,
+            '0x746573742d6b6579000000000000000000000000000000000000000000000000',
+        ],
+        'blockNumber': block_number,
+    }
+
+
+class StubLogsClient(object):
+    def __init__(self, log_entries, max_results, block_number=None):
+        self.log_entries = log_entries
+        self.max_results = max_results
+        self.block_number = block_number
+        self.requests = []
+
+    def get_block_number(self):
+        self.requests.append('get_block_number')
+        return self.block_number
+
+    def get_logs(self, from_block, to_block, address, topics):
+        self.requests.append((from_block, to_block))
+        matches = [
+            log_entry for log_entry in self.log_entries
+            if from_block <= log_entry['blockNumber'] <= to_block and
+            log_entry['address'] == address and
+            log_entry['topics'][0] == topics[0]
+        ]
+        if len(matches) > self.max_results:
+            raise ValueError("query returned more than {0} results".format(self.max_results))
+        return matches
+
+
+def test_event_scan_yields_decoded_logs(LogsEvents):
+    client = StubLogsClient([make_log(5), make_log(15), make_log(25)], max_results=10)
+    logs_events = LogsEvents(ADDRESS, client)
+
+    decoded = list(logs_events.SingleIndex.scan(0, 30, chunk_size=10))
+
+    assert [d.args['val_b'] for d in decoded] == [5, 15, 25]
+    assert decoded[0].event_name == 'SingleIndex'
+    assert decoded[0].contract_name == 'LogsEvents'
+
+
+def test_event_scan_grows_chunks_over_sparse_ranges(LogsEvents):
+    client = StubLogsClient([make_log(5)], max_results=10)
+    logs_events = LogsEvents(ADDRESS, client)
+
+    list(logs_events.SingleIndex.scan(0, 69, chunk_size=10))
+
+    assert client.requests == [(0, 9), (10, 29), (30, 69)]
+
+
+def test_event_scan_shrinks_chunks_on_too_many_results(LogsEvents):
+    client = StubLogsClient([make_log(block) for block in range(8)], max_results=2)
+    logs_events = LogsEvents(ADDRESS, client)
+
+    decoded = list(logs_events.SingleIndex.scan(0, 7, chunk_size=8, target_results=4))
+
+    assert [d.args['val_b'] for d in decoded] == list(range(8))
+    assert client.requests[:3] == [(0, 7), (0, 3), (0, 1)]
+
+
+def test_event_scan_is_lazy(LogsEvents):
+    client = StubLogsClient([make_log(block) for block in range(0, 100, 10)], max_results=10)
+    logs_events = LogsEvents(ADDRESS, client)
+
+    scan = logs_events.SingleIndex.scan(0, 99, chunk_size=10, target_results=100)
+    assert client.requests == []
+    next(scan)
+    assert client.requests == [(0, 9)]
+
+
+def test_event_scan_reraises_other_errors(LogsEvents):
+    class BrokenClient(object):
+        def get_logs(self, **kwargs):
+            raise ValueError("connection refused")
+
+    logs_events = LogsEvents(ADDRESS, BrokenClient())
+    with pytest.raises(ValueError):
+        list(logs_events.SingleIndex.scan(0, 10))
+
+
+def test_event_scan_to_latest_block(LogsEvents):
+    client = StubLogsClient([make_log(5), make_log(15)], max_results=10, block_number=25)
+    logs_events = LogsEvents(ADDRESS, client)
+
+    decoded = list(logs_events.SingleIndex.scan('earliest', 'latest', chunk_size=10))
+
+    assert [d.args['val_b'] for d in decoded] == [5, 15]
+    assert client.requests == ['get_block_number', (0, 9), (10, 25)]
+
+
+@pytest.mark.parametrize('to_block', ['0x10', 10.0, None, True])
+def test_event_scan_rejects_other_bounds(LogsEvents, to_block):
+    client = StubLogsClient([], max_results=10)
+    logs_events = LogsEvents(ADDRESS, client)
+    with pytest.raises(TypeError):
+        list(logs_events.SingleIndex.scan(0, to_block))
+    assert client.requests == []
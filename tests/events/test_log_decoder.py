@@ -0,0 +1,77 @@
+from eth_contract.logs import LogDecoder
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+OTHER_ADDRESS = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+
+
+def make_log(topics, address=ADDRESS):
+    return {
+        'data': b'0x746573742d76616c5f61000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000003039',  # NOQA
+        'address': address,
+        'topics': topics,
+        'logIndex': '0x0',
+        'blockNumber': '0x0',
+    }
+
+
+single_index_log = make_log([
+    '0xe5091e521791fb0fb6be999dcb6d5031d9f0a8032185b13790f8d2f95e163b1f',
+    '0x746573742d6b6579000000000000000000000000000000000000000000000000',
+])
+double_index_log = make_log([
+    '0x968e08311bcc13cd5d4feae6a3c87bedb195ab51905c8ec75a10580b5b5854c7',
+    '0x746573742d6b65792d6100000000000000000000000000000000000000000000',
+    '0x746573742d6b65792d6200000000000000000000000000000000000000000000',
+])
+unknown_log = make_log([
+    '0x0000000000000000000000000000000000000000000000000000000000000000',
+])
+
+
+def padded(value):
+    return value + b'\x00' * (32 - len(value))
+
+
+def test_decode_logs_by_topic(LogsEvents):
+    log_decoder = LogDecoder([LogsEvents])
+    decoded = list(log_decoder.decode_logs([single_index_log, unknown_log, double_index_log]))
+
+    assert [(d.contract_name, d.event_name) for d in decoded] == [
+        ('LogsEvents', 'SingleIndex'),
+        ('LogsEvents', 'DoubleIndex'),
+    ]
+    assert decoded[0].args == {
+        'key': padded(b'test-key'),
+        'val_a': padded(b'test-val_a'),
+        'val_b': 12345,
+    }
+    assert decoded[1].args == {
+        'key_a': padded(b'test-key-a'),
+        'key_b': padded(b'test-key-b'),
+        'val_a': padded(b'test-val_a'),
+        'val_b': 12345,
+    }
+    assert decoded[1].log is double_index_log
+
+
+def test_decode_log_unknown_event(LogsEvents):
+    assert LogDecoder([LogsEvents]).decode_log(unknown_log) is None
+
+
+def test_decode_log_matches_number_of_topics(LogsEvents):
+    log_decoder = LogDecoder([LogsEvents])
+    wrong_topic_count = make_log(single_index_log['topics'][:1])
+    assert log_decoder.decode_log(wrong_topic_count) is None
+
+
+def test_decode_log_prefers_address(LogsEvents, logs_events_contract_meta):
+    from eth_contract import Contract
+    Other = Contract(logs_events_contract_meta, 'Other')
+
+    log_decoder = LogDecoder([LogsEvents])
+    log_decoder.register(Other(OTHER_ADDRESS.upper().replace('0X', '0x'), None))
+
+    assert log_decoder.decode_log(single_index_log).contract_name == 'LogsEvents'
+    other_log = make_log(single_index_log['topics'], address=OTHER_ADDRESS)
+    assert log_decoder.decode_log(other_log).contract_name == 'Other'
@@ -0,0 +1,98 @@
+import copy
+
+from eth_contract import Contract
+from eth_contract.core import ContractBase
+from eth_contract.receipts import get_transaction_receipts
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+OTHER_ADDRESS = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+
+SINGLE_INDEX_TOPIC = '0xe5091e521791fb0fb6be999dcb6d5031d9f0a8032185b13790f8d2f95e163b1f'
+DOUBLE_INDEX_TOPIC = '0x968e08311bcc13cd5d4feae6a3c87bedb195ab51905c8ec75a10580b5b5854c7'
+
+
+def make_log(topics, address=ADDRESS):
+    return {
+        'data': b'0x746573742d76616c5f61000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000003039',  # NOQA
+        'address': address,
+        'topics': topics,
+    }
+
+
+single_index_log = make_log([SINGLE_INDEX_TOPIC, '0x' + '11' * 32])
+double_index_log = make_log([DOUBLE_INDEX_TOPIC, '0x' + '22' * 32, '0x' + '33' * 32])
+
+
+class StubClient(object):
+    def __init__(self, receipts):
+        self.receipts = receipts
+        self.requests = []
+
+    def get_transaction_receipt(self, txn_hash):
+        self.requests.append([txn_hash])
+        return self.receipts.get(txn_hash)
+
+
+class StubBatchClient(StubClient):
+    def batch_get_transaction_receipt(self, txn_hashes):
+        self.requests.append(txn_hashes)
+        return [self.receipts.get(txn_hash) for txn_hash in txn_hashes]
+
+
+def test_get_transaction_events(LogsEvents):
+    client = StubClient({'0x01': {'logs': [
+        single_index_log,
+        make_log(['0x' + '00' * 32]),
+        make_log(single_index_log['topics'], address=OTHER_ADDRESS),
+        double_index_log,
+    ]}})
+    logs_events = LogsEvents(ADDRESS.upper().replace('0X', '0x'), client)
+
+    decoded = logs_events.get_transaction_events('0x01')
+    assert client.requests == [['0x01']]
+    assert [(d.contract_name, d.event_name, d.log) for d in decoded] == [
+        ('LogsEvents', 'SingleIndex', single_index_log),
+        ('LogsEvents', 'DoubleIndex', double_index_log),
+    ]
+    assert decoded[0].args['key'] == b'\x11' * 32
+    assert decoded[0].args['val_b'] == 12345
+    assert decoded[1].args['key_b'] == b'\x33' * 32
+
+    assert logs_events.get_transaction_events('0x02') is None
+
+
+def test_get_transaction_events_many(LogsEvents):
+    receipts = {
+        '0x{0:02x}'.format(idx): {'logs': [single_index_log] * idx}
+        for idx in range(5)
+    }
+    client = StubBatchClient(receipts)
+    logs_events = LogsEvents(ADDRESS, client)
+
+    txn_hashes = sorted(receipts) + ['0xff']
+    decoded = logs_events.get_transaction_events_many(txn_hashes, batch_size=4)
+    assert client.requests == [txn_hashes[:4], txn_hashes[4:]]
+    assert [None if d is None else len(d) for d in decoded] == [0, 1, 2, 3, 4, None]
+
+
+def test_get_transaction_receipts_without_batch_support():
+    client = StubClient({'0x01': {'logs': []}})
+    assert get_transaction_receipts(client, iter(['0x01', '0x02'])) == [{'logs': []}, None]
+    assert client.requests == [['0x01'], ['0x02']]
+
+
+def test_get_transaction_events_hidden_by_the_abi(logs_events_contract_meta):
+    contract_meta = copy.deepcopy(logs_events_contract_meta)
+    contract_meta['info']['abiDefinition'].append({
+        'type': 'function',
+        'name': 'get_transaction_events',
+        'constant': True,
+        'inputs': [{'type': 'bytes32', 'name': 'txn_hash'}],
+        'outputs': [],
+    })
+    client = StubClient({'0x01': {'logs': [single_index_log]}})
+    logs_events = Contract(contract_meta, 'LogsEvents')(ADDRESS, client)
+
+    decoded = ContractBase.get_transaction_events(logs_events, '0x01')
+    assert [d.event_name for d in decoded] == ['SingleIndex']
@@ -0,0 +1,98 @@
+import multiprocessing
+
+import pytest
+
+from eth_contract.functions import (
+    Function,
+    FunctionGroup,
+)
+
+
+ADDRESS = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+
+
+def make_function(name, *types):
+    return Function(name, [
+        {'type': _type, 'name': 'arg{0}'.format(idx)} for idx, _type in enumerate(types)
+    ])
+
+
+def test_static_call_data_many():
+    function = make_function('transfer', 'address', 'uint256')
+    args_list = [(ADDRESS, value) for value in (0, 1, 10 ** 18, 2 ** 256 - 1)]
+    assert function.get_call_data_many(iter(args_list)) == [
+        function.get_call_data(args) for args in args_list
+    ]
+
+
+def test_call_data_many_falls_back_to_the_generic_encoder():
+    function = make_function('setValue', 'uint256', 'uint256')
+    args_list = [(1, 1), (True, 2), (3, 3)]
+    call_data = function.get_call_data_many(args_list)
+    assert function._abi.encoder.encode(args_list[1]) is None
+    assert call_data == [function.get_call_data(args) for args in args_list]
+
+
+def test_dynamic_call_data_many():
+    function = make_function('setName', 'string')
+    args_list = [('a',), ('b' * 100,)]
+    assert function.get_call_data_many(args_list) == [
+        function.get_call_data(args) for args in args_list
+    ]
+
+
+def test_call_data_many_with_no_arguments():
+    function = make_function('totalSupply')
+    assert function.get_call_data_many([(), ()]) == [function.get_call_data(())] * 2
+    assert function.get_call_data_many([]) == []
+
+
+def test_call_data_many_checks_argument_count():
+    function = make_function('transfer', 'address', 'uint256')
+    with pytest.raises(ValueError):
+        function.get_call_data_many([(ADDRESS, 1), (ADDRESS,)])
+
+
+def test_function_group_call_data_many():
+    group = FunctionGroup([
+        make_function('transfer', 'address', 'uint256'),
+        make_function('transfer', 'address', 'uint256', 'bytes'),
+        make_function('transfer', 'address', 'bytes32'),
+    ])
+    args_list = [
+        (ADDRESS, 1),
+        (ADDRESS, 2, b'data'),
+        (ADDRESS, b'key'),
+        (ADDRESS, 3),
+    ]
+    assert group.get_call_data_many(args_list) == [
+        group.get_call_data(args) for args in args_list
+    ]
+    with pytest.raises(TypeError):
+        group.get_call_data_many([(ADDRESS,)])
+
+
+def test_function_group_call_data_many_validates_every_call():
+    group = FunctionGroup([
+        make_function('transfer', 'address', 'uint256'),
+        make_function('transfer', 'address', 'uint256', 'bytes'),
+    ])
+    for invalid_args in [('0x' + 'AB' * 20, 1), (ADDRESS, 2 ** 256)]:
+        with pytest.raises(TypeError):
+            group.get_call_data(invalid_args)
+        with pytest.raises(TypeError):
+            group.get_call_data_many([(ADDRESS, 1), invalid_args, (ADDRESS, 2)])
+
+
+def test_call_data_many_in_a_process_pool():
+    function = make_function('transfer', 'address', 'uint256')
+    function.validate_arguments((ADDRESS, 1))
+    args_list = [(ADDRESS, value) for value in range(25)]
+
+    pool = multiprocessing.Pool(2)
+    try:
+        call_data = function.get_call_data_many(args_list, pool=pool, chunk_size=10)
+    finally:
+        pool.close()
+        pool.join()
+    assert call_data == [function.get_call_data(args) for args in args_list]
@@ -0,0 +1,121 @@
+import pytest
+
+from eth_contract import Contract
+from eth_contract.calldata import (
+    CallDecoder,
+    get_selector_key,
+)
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+OTHER_ADDRESS = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+
+
+def make_function(name, input_types):
+    return {
+        'type': 'function',
+        'name': name,
+        'constant': False,
+        'inputs': [
+            {'type': _type, 'name': 'arg{0}'.format(idx)} for idx, _type in enumerate(input_types)
+        ],
+        'outputs': [],
+    }
+
+
+@pytest.fixture()
+def Token():
+    return Contract({
+        'code': '0x',
+        'info': {
+            'source': '',
+            'abiDefinition': [
+                make_function('transfer', ['address', 'uint256']),
+                make_function('transfer', ['address', 'uint256', 'bytes']),
+                make_function('setName', ['string']),
+                make_function('pause', []),
+            ],
+        },
+    }, 'Token')
+
+
+def prefixed(data):
+    return b'0x' + data
+
+
+def test_get_selector_key():
+    assert get_selector_key('0xA9059CBB0000') == b'a9059cbb'
+    assert get_selector_key(b'a9059cbb') == b'a9059cbb'
+    assert get_selector_key('0x') is None
+    assert get_selector_key('0xa9059c') is None
+
+
+def test_decode_calldata(Math, Token):
+    call_decoder = CallDecoder([Math, Token])
+
+    decoded = call_decoder.decode_calldata(prefixed(Math.add.get_call_data((1, -2))))
+    assert decoded.contract_name == 'Math'
+    assert decoded.function_name == 'add'
+    assert decoded.args == (1, -2)
+    assert decoded.function is Math.add
+
+    data = Token.transfer.get_call_data((OTHER_ADDRESS, 10 ** 18))
+    decoded = call_decoder.decode_calldata(data)
+    assert decoded.args == (OTHER_ADDRESS[2:].encode('ascii'), 10 ** 18)
+    assert decoded.function.input_types == ('address', 'uint256')
+
+    decoded = call_decoder.decode_calldata(
+        Token.transfer.get_call_data((OTHER_ADDRESS, 1, b'data')).decode('ascii')
+    )
+    assert decoded.function.input_types == ('address', 'uint256', 'bytes')
+    assert decoded.args[2] == b'data'
+
+    assert call_decoder.decode_calldata(Token.setName.get_call_data(('name',))).args == (b'name',)
+    assert call_decoder.decode_calldata(Token.pause.get_call_data(())).args == ()
+
+
+def test_decode_calldata_rejects_unknown_and_malformed_data(Math):
+    call_decoder = CallDecoder([Math])
+    assert call_decoder.decode_calldata('0x') is None
+    assert call_decoder.decode_calldata('0x12345678' + '00' * 32) is None
+    assert call_decoder.decode_calldata(Math.add.get_call_data((1, 2))[:40]) is None
+
+
+def test_decode_calldata_prefers_address(math_contract_meta):
+    MathA = Contract(math_contract_meta, 'MathA')
+    MathB = Contract(math_contract_meta, 'MathB')
+    call_decoder = CallDecoder([MathA])
+    call_decoder.register(MathB(OTHER_ADDRESS.upper().replace('0X', '0x'), None))
+
+    data = MathA.multiply7.get_call_data((3,))
+    assert call_decoder.decode_calldata(data).contract_name == 'MathA'
+    assert call_decoder.decode_calldata(data, ADDRESS).contract_name == 'MathA'
+    assert call_decoder.decode_calldata(data, OTHER_ADDRESS).contract_name == 'MathB'
+
+
+def test_decode_calldata_many(Math):
+    call_decoder = CallDecoder([Math])
+    decoded = call_decoder.decode_calldata_many([
+        Math.multiply7.get_call_data((3,)),
+        '0x',
+        '0xffffffff',
+        Math.return13.get_call_data(()),
+    ])
+    assert [d and (d.function_name, d.args) for d in decoded] == [
+        ('multiply7', (3,)), None, None, ('return13', ()),
+    ]
+
+
+def test_decode_transactions(Math):
+    call_decoder = CallDecoder([Math])
+    transactions = [
+        {'to': ADDRESS, 'input': prefixed(Math.add.get_call_data((2, 3)))},
+        {'to': ADDRESS, 'input': '0x'},
+        {'to': None, 'input': '0x6060604052'},
+        {'to': ADDRESS, 'input': prefixed(Math.multiply7.get_call_data((5,)))},
+    ]
+    decoded = list(call_decoder.decode_transactions(transactions))
+    assert [(transaction, d.function_name, d.args) for transaction, d in decoded] == [
+        (transactions[0], 'add', (2, 3)),
+        (transactions[3], 'multiply7', (5,)),
+    ]
@@ -48,3 +48,31 @@ f_group_2 = FunctionGroup([f_2a, f_2b])
 def test_address_and_bytes_matching():
     assert f_group_2.get_function_for_call_signature((12345, 'arstarst', '0xd3cda913deb6f67967b99d67acdfa1712c293601')) == f_2a
     assert f_group_2.get_function_for_call_signature((12345, 'd3cda913deb6f67967b99d67acdfa1712c293601', '0xd3cda')) == f_2b
+
+
+def test_validators_are_compiled_once():
+    from eth_contract.functions import get_validator
+    assert get_validator('uint256[2][]') is get_validator('uint256[2][]')
+    assert f_1a.validators[0] is get_validator('int8')
+    assert f_1a.validators[0].python_types is not None
+    assert get_validator('uint256[2]').python_types is None
+
+
+f_3a = Function('transfer', [address_m, uint256_a])
+f_3b = Function('transfer', [address_m, uint256_a, bytes8_x])
+f_3c = Function('transfer', [address_m, bytes8_x])
+
+
+def test_dispatch_cache_by_python_types():
+    f_group_3 = FunctionGroup([f_3a, f_3b, f_3c])
+    address = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+
+    assert f_group_3.get_function_for_call_signature((address, 12345)) == f_3a
+    assert f_group_3.get_function_for_call_signature((address, 12345, 'data')) == f_3b
+    assert f_group_3.get_function_for_call_signature((address, 'data')) == f_3c
+    assert f_group_3.get_function_for_call_signature((address, 54321)) == f_3a
+
+    python_types = (type(address), int)
+    assert f_group_3._dispatch_cache[python_types] == (f_3a,)
+    with pytest.raises(TypeError):
+        f_group_3.get_function_for_call_signature((address, -1))
@@ -1,3 +1,5 @@
+import pytest
+
 from rlp.utils import encode_hex
 
 from eth_contract.functions import (
@@ -74,3 +76,29 @@ def test_contract_multiply7_function_signature():
     assert multiply7.abi_signature == 3707058097
     assert multiply7.encoded_abi_signature == b'\xdc\xf57\xb1'
     assert multiply7.get_call_data((3,)) == b'dcf537b10000000000000000000000000000000000000000000000000000000000000003'
+
+
+def test_compiled_abi_is_precomputed():
+    add = Function(
+        "add",
+        inputs=[{'type': 'int256', 'name': 'a'}, {'type': 'int256', 'name': 'b'}],
+        outputs=[{'type': 'int256', 'name': 'result'}],
+    )
+    assert add._abi.signature == b'add(int256,int256)'
+    assert add._abi.input_types == ('int256', 'int256')
+    assert add._abi.output_types == ('int256',)
+    assert add._abi.encoded_abi_signature == b'\xa5\xf3\xc2;'
+
+
+def test_compiled_abi_is_shared_between_copies():
+    import copy
+    func = Function("register", [{'type': 'bytes32', 'name': 'name'}])
+    func_copy = copy.copy(func)
+    assert func_copy is not func
+    assert func_copy._abi is func._abi
+
+
+def test_compiled_abi_is_immutable():
+    func = Function("doit", [])
+    with pytest.raises(AttributeError):
+        func._abi.encoded_abi_signature = b'\x00\x00\x00\x00'
@@ -0,0 +1,125 @@
+import pytest
+
+from eth_contract import gas
+from eth_contract.gas import (
+    EstimateGasStrategy,
+    MaxGasStrategy,
+)
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+
+
+class StubClient(object):
+    def __init__(self, max_gas=1000000, estimate=50000):
+        self.max_gas = max_gas
+        self.estimate = estimate
+        self.requests = []
+
+    def get_max_gas(self):
+        self.requests.append('get_max_gas')
+        return self.max_gas
+
+    def estimate_gas(self, to, data, **kwargs):
+        self.requests.append(('estimate_gas', data))
+        return self.estimate
+
+    def send_transaction(self, to, data, **kwargs):
+        self.requests.append(('send_transaction', kwargs['gas']))
+        return '0xabc'
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(gas.time, 'time', lambda: now[0])
+    return now
+
+
+def test_default_requests_max_gas_for_every_transaction(Math):
+    client = StubClient()
+    math = Math(ADDRESS, client)
+    math.multiply7(3)
+    math.multiply7(3)
+    assert client.requests == [
+        'get_max_gas', ('send_transaction', 900000),
+        'get_max_gas', ('send_transaction', 900000),
+    ]
+
+
+def test_explicit_gas_skips_the_strategy(Math):
+    client = StubClient()
+    Math(ADDRESS, client, gas_strategy=EstimateGasStrategy()).multiply7(3, gas=21000)
+    assert client.requests == [('send_transaction', 21000)]
+
+
+def test_max_gas_is_cached_for_max_age(Math, clock):
+    client = StubClient()
+    math = Math(ADDRESS, client, gas_strategy=MaxGasStrategy(max_age=15))
+    math.multiply7(3)
+    clock[0] += 10
+    client.max_gas = 2000000
+    math.multiply7(4)
+    assert client.requests.count('get_max_gas') == 1
+    assert client.requests[-1] == ('send_transaction', 900000)
+
+    clock[0] += 10
+    math.multiply7(5)
+    assert client.requests.count('get_max_gas') == 2
+    assert client.requests[-1] == ('send_transaction', 1800000)
+
+
+def test_max_gas_is_not_shared_between_clients(Math, clock):
+    gas_strategy = MaxGasStrategy()
+    client_a = StubClient(max_gas=1000000)
+    client_b = StubClient(max_gas=2000000)
+    Math(ADDRESS, client_a, gas_strategy=gas_strategy).multiply7(3)
+    Math(ADDRESS, client_b, gas_strategy=gas_strategy).multiply7(3)
+    assert client_b.requests == ['get_max_gas', ('send_transaction', 1800000)]
+
+
+def test_estimates_are_memoized_by_call_data_shape(Math, clock):
+    client = StubClient()
+    math = Math(ADDRESS, client, gas_strategy=EstimateGasStrategy(multiplier=1.5))
+    math.multiply7(3)
+    math.multiply7(4)
+    math.add(3, 4)
+
+    estimates = [request for request in client.requests if request[0] == 'estimate_gas']
+    assert len(estimates) == 2
+    assert client.requests.count('get_max_gas') == 1
+    assert client.requests[-1] == ('send_transaction', 75000)
+
+
+def test_estimates_depend_on_value_and_sender(Math, clock):
+    client = StubClient()
+    math = Math(ADDRESS, client, gas_strategy=EstimateGasStrategy())
+    math.multiply7(3)
+    math.multiply7(3, value=1)
+    math.multiply7(3, _from=ADDRESS)
+    math.multiply7(3, _from=ADDRESS.upper().replace('0X', '0x'))
+
+    estimates = [request for request in client.requests if request[0] == 'estimate_gas']
+    assert len(estimates) == 3
+
+
+def test_least_recently_used_estimates_are_dropped(Math, clock):
+    client = StubClient()
+    gas_strategy = EstimateGasStrategy(max_size=2)
+    math = Math(ADDRESS, client, gas_strategy=gas_strategy)
+    math.multiply7(3)
+    math.multiply7(3, value=1)
+    math.multiply7(3)
+    math.multiply7(3, value=2)
+    assert len(gas_strategy._estimates) == 2
+
+    math.multiply7(3)
+    math.multiply7(3, value=1)
+    estimates = [request for request in client.requests if request[0] == 'estimate_gas']
+    assert len(estimates) == 4
+
+
+def test_estimates_are_capped_by_max_gas(Math, clock):
+    client = StubClient(max_gas=100000, estimate=95000)
+    Math(ADDRESS, client, gas_strategy=EstimateGasStrategy()).multiply7(3)
+    assert client.requests[-1] == ('send_transaction', 90000)
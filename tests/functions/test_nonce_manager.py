@@ -0,0 +1,118 @@
+import threading
+
+import pytest
+
+from eth_contract.nonce import NonceManager
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+SENDER = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+
+
+class StubChain(object):
+    """
+    Accepts transactions with any nonce, failing the sends listed in
+    `failures`.
+    """
+    def __init__(self, transaction_count=0):
+        self.transaction_count = transaction_count
+        self.count_requests = 0
+        self.failures = {}
+        self.nonces = []
+        self._lock = threading.Lock()
+
+    def get_transaction_count(self, account, block):
+        assert block == "pending"
+        self.count_requests += 1
+        return self.transaction_count
+
+    def get_max_gas(self):
+        return 1000000
+
+    def send_transaction(self, nonce, **kwargs):
+        with self._lock:
+            if nonce in self.failures:
+                raise ValueError(self.failures.pop(nonce))
+            self.nonces.append(nonce)
+            return '0x{0:064x}'.format(nonce)
+
+
+def test_nonces_are_reserved_locally(Math):
+    chain = StubChain(transaction_count=5)
+    math = Math(ADDRESS, chain, nonce_manager=NonceManager())
+    for _ in range(3):
+        math.multiply7(3, _from=SENDER, gas=21000)
+
+    assert chain.nonces == [5, 6, 7]
+    assert chain.count_requests == 1
+
+
+def test_pipelined_sends_get_unique_nonces(Math):
+    chain = StubChain()
+    math = Math(ADDRESS, chain, nonce_manager=NonceManager(default_account=SENDER))
+
+    def send_many():
+        for _ in range(50):
+            math.multiply7(3)
+
+    threads = [threading.Thread(target=send_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(chain.nonces) == list(range(400))
+
+
+def test_failed_send_releases_its_nonce(Math):
+    chain = StubChain()
+    chain.failures[1] = "insufficient funds for gas * price + value"
+    math = Math(ADDRESS, chain, nonce_manager=NonceManager(default_account=SENDER))
+
+    math.multiply7(3)
+    with pytest.raises(ValueError):
+        math.multiply7(3)
+    math.multiply7(3)
+    math.multiply7(3)
+
+    assert chain.nonces == [0, 1, 2]
+
+
+def test_nonce_error_resyncs_from_the_node(Math):
+    chain = StubChain()
+    chain.failures[1] = "nonce too low"
+    math = Math(ADDRESS, chain, nonce_manager=NonceManager(default_account=SENDER))
+
+    math.multiply7(3)
+    chain.transaction_count = 3
+    with pytest.raises(ValueError):
+        math.multiply7(3)
+    math.multiply7(3)
+
+    assert chain.nonces == [0, 3]
+    assert chain.count_requests == 2
+
+
+def test_accounts_have_separate_nonces(Math):
+    chain = StubChain()
+    math = Math(ADDRESS, chain, nonce_manager=NonceManager())
+    math.multiply7(3, _from=SENDER)
+    math.multiply7(3, _from=ADDRESS)
+    math.multiply7(3, _from=SENDER.upper())
+
+    assert chain.nonces == [0, 0, 1]
+
+
+def test_explicit_nonce_is_not_managed(Math):
+    chain = StubChain()
+    math = Math(ADDRESS, chain, nonce_manager=NonceManager(default_account=SENDER))
+    math.multiply7(3, nonce=10)
+
+    assert chain.nonces == [10]
+    assert chain.count_requests == 0
+
+
+def test_sender_is_required(Math):
+    math = Math(ADDRESS, StubChain(), nonce_manager=NonceManager())
+    with pytest.raises(ValueError):
+        math.multiply7(3)
@@ -0,0 +1,185 @@
+import threading
+
+import pytest
+
+from eth_contract.receipts import ReceiptWatcher
+
+
+ADDRESS = '0xc305c901078781c232a2a521c2af7980f8385ee9'
+
+
+class StubChain(object):
+    """
+    Mines pending transactions into a new block whenever `mine()` is called,
+    or after every transaction when `automine` is set.
+    """
+    def __init__(self, automine=False):
+        self.automine = automine
+        self.blocks = [[]]
+        self.pending = []
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def get_max_gas(self):
+        return 1000000
+
+    def send_transaction(self, **kwargs):
+        with self._lock:
+            txn_hash = '0x{0:064x}'.format(len(self.requests))
+            self.requests.append('send_transaction')
+            self.pending.append(txn_hash)
+        if self.automine:
+            self.mine()
+        return txn_hash
+
+    def mine(self):
+        with self._lock:
+            self.blocks.append(self.pending)
+            self.pending = []
+
+    def get_block_number(self):
+        self.requests.append('get_block_number')
+        return len(self.blocks) - 1
+
+    def get_block_by_number(self, block_number, full_transactions):
+        assert block_number >= 0
+        self.requests.append('get_block_by_number')
+        if block_number >= len(self.blocks):
+            return None
+        return {'transactions': [txn_hash.upper() for txn_hash in self.blocks[block_number]]}
+
+    def get_transaction_receipt(self, txn_hash):
+        self.requests.append('get_transaction_receipt')
+        for block_number, transactions in enumerate(self.blocks):
+            if txn_hash in transactions:
+                return {'transactionHash': txn_hash, 'blockNumber': block_number}
+        return None
+
+    def wait_for_transaction(self, txn_hash, max_wait):
+        raise AssertionError("Receipts should be awaited with the receipt watcher")
+
+
+def test_s_many_waits_for_all_receipts(Math):
+    chain = StubChain(automine=True)
+    math = Math(ADDRESS, chain)
+    results = math.multiply7.s_many([(value,) for value in range(20)])
+
+    assert len(results) == 20
+    for block_number, (txn_hash, txn_receipt) in enumerate(results, 1):
+        assert txn_receipt == {'transactionHash': txn_hash, 'blockNumber': block_number}
+    assert chain.requests.count('get_transaction_receipt') == 20
+
+
+def test_watcher_requests_scale_with_blocks(Math):
+    chain = StubChain()
+    receipt_watcher = ReceiptWatcher(chain, poll_interval=0.01)
+    math = Math(ADDRESS, chain, receipt_watcher=receipt_watcher)
+
+    futures = [receipt_watcher.watch(math.multiply7(value)) for value in range(100)]
+    chain.mine()
+    results = [future.result(timeout=5) for future in futures]
+    receipt_watcher.stop()
+
+    assert all(receipt['blockNumber'] == 1 for receipt in results)
+    assert receipt_watcher.num_pending == 0
+    assert chain.requests.count('get_transaction_receipt') == 100
+    # One request per block, not per pending transaction.
+    assert chain.requests.count('get_block_by_number') < 10
+
+
+class StubBatchChain(StubChain):
+    def batch_get_transaction_receipt(self, txn_hashes):
+        self.requests.append('batch_get_transaction_receipt')
+        receipts = [self.get_transaction_receipt(txn_hash) for txn_hash in txn_hashes]
+        del self.requests[-len(txn_hashes):]
+        return receipts
+
+
+def test_watcher_batches_receipt_requests(Math):
+    chain = StubBatchChain()
+    receipt_watcher = ReceiptWatcher(chain, poll_interval=0.01, batch_size=40)
+    math = Math(ADDRESS, chain)
+
+    futures = [receipt_watcher.watch(math.multiply7(value)) for value in range(100)]
+    receipt_watcher.stop()
+    chain.mine()
+    receipt_watcher.poll()
+
+    assert all(future.result(timeout=5)['blockNumber'] == 1 for future in futures)
+    assert chain.requests.count('get_transaction_receipt') == 0
+    assert chain.requests.count('batch_get_transaction_receipt') == 3
+
+
+def test_stopped_watcher_reads_the_head_again(Math):
+    chain = StubChain(automine=True)
+    receipt_watcher = ReceiptWatcher(chain, poll_interval=0.01, lookback_blocks=0)
+    math = Math(ADDRESS, chain)
+    receipt_watcher.watch(math.multiply7(3)).result(timeout=5)
+    receipt_watcher.stop()
+    for _ in range(5):
+        chain.mine()
+
+    txn_hash = math.multiply7(4)
+    del chain.requests[:]
+    receipt_watcher.watch(txn_hash).result(timeout=5)
+    receipt_watcher.stop()
+    assert chain.requests.count('get_block_by_number') == 1
+
+
+def test_watch_while_the_watcher_is_stopped(Math):
+    chain = StubChain(automine=True)
+    receipt_watcher = ReceiptWatcher(chain, poll_interval=0.01, lookback_blocks=0)
+    math = Math(ADDRESS, chain)
+    receipt_watcher.watch(math.multiply7(3)).result(timeout=5)
+
+    class StoppingLock(object):
+        # Stops the watcher between `watch()` reading the head and taking
+        # the lock.
+        def __init__(self, lock):
+            self.lock = lock
+
+        def __enter__(self):
+            receipt_watcher._lock = self.lock
+            receipt_watcher.stop()
+            return self.lock.__enter__()
+
+        def __exit__(self, *exc_info):
+            return self.lock.__exit__(*exc_info)
+
+    receipt_watcher._lock = StoppingLock(receipt_watcher._lock)
+    txn_receipt = receipt_watcher.watch(math.multiply7(4)).result(timeout=5)
+    receipt_watcher.stop()
+    assert txn_receipt['blockNumber'] == 2
+
+
+def test_s_uses_receipt_watcher(Math):
+    chain = StubChain(automine=True)
+    receipt_watcher = ReceiptWatcher(chain, poll_interval=0.01)
+    math = Math(ADDRESS, chain, receipt_watcher=receipt_watcher)
+
+    txn_hash, txn_receipt = math.multiply7.s(3)
+    receipt_watcher.stop()
+    assert txn_receipt['transactionHash'] == txn_hash
+
+
+def test_transaction_mined_before_watching_is_found(Math):
+    chain = StubChain()
+    receipt_watcher = ReceiptWatcher(chain, poll_interval=0.01)
+    receipt_watcher.poll()
+    txn_hash = Math(ADDRESS, chain).multiply7(3)
+    chain.mine()
+    chain.mine()
+    receipt_watcher.poll()
+
+    txn_receipt = receipt_watcher.watch(txn_hash).result(timeout=5)
+    receipt_watcher.stop()
+    assert txn_receipt['blockNumber'] == 1
+
+
+def test_unmined_transaction_times_out():
+    receipt_watcher = ReceiptWatcher(StubChain(), poll_interval=0.01)
+    future = receipt_watcher.watch('0x1234', max_wait=0.05)
+    with pytest.raises(ValueError):
+        future.result(timeout=5)
+    receipt_watcher.stop()
+    assert receipt_watcher.num_pending == 0
@@ -0,0 +1,70 @@
+import pytest
+
+from rlp.utils import decode_hex
+from eth_abi import decode_abi
+
+from eth_contract.decoding import (
+    StaticDecoder,
+    compile_decoder,
+)
+
+
+UINT_13 = '000000000000000000000000000000000000000000000000000000000000000d'
+INT_MINUS_1 = 'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+ADDRESS = '000000000000000000000000d3cda913deb6f67967b99d67acdfa1712c293601'
+TRUE = '0000000000000000000000000000000000000000000000000000000000000001'
+BYTES32 = '746573742d6b6579000000000000000000000000000000000000000000000000'
+
+
+@pytest.mark.parametrize(
+    "output_types,words",
+    (
+        (('uint256',), (UINT_13,)),
+        (('uint8',), (UINT_13,)),
+        (('int256',), (INT_MINUS_1,)),
+        (('int256',), (UINT_13,)),
+        (('int8',), (INT_MINUS_1,)),
+        (('address',), (ADDRESS,)),
+        (('bool',), (TRUE,)),
+        (('bool',), ('0' * 64,)),
+        (('bytes32',), (BYTES32,)),
+        (('bytes8',), (BYTES32,)),
+        (('uint256', 'address', 'bool'), (UINT_13, ADDRESS, TRUE)),
+    )
+)
+def test_static_decoder_matches_generic_decoder(output_types, words):
+    decoder = compile_decoder(output_types)
+    assert isinstance(decoder, StaticDecoder)
+
+    hex_output = '0x' + ''.join(words)
+    assert decoder(hex_output) == decode_abi(output_types, hex_output)
+    assert decoder(hex_output.encode('ascii')) == decode_abi(output_types, hex_output)
+
+    raw_output = decode_hex(''.join(words))
+    if len(words) == 1:
+        # 32 raw bytes are never mistaken for hex.
+        assert decoder(raw_output) == decode_abi(output_types, raw_output)
+
+
+@pytest.mark.parametrize(
+    "output_types",
+    (
+        ('bytes',),
+        ('string',),
+        ('uint256[]',),
+        ('uint256[2]',),
+        ('uint256', 'bytes'),
+    )
+)
+def test_dynamic_outputs_use_generic_decoder(output_types):
+    assert not isinstance(compile_decoder(output_types), StaticDecoder)
+
+
+def test_static_decoder_falls_back_for_unexpected_sizes():
+    decoder = compile_decoder(('uint256',))
+    two_words = '0x' + UINT_13 + TRUE
+    assert decoder(two_words) == decode_abi(('uint256',), two_words)
+
+
+def test_static_decoder_without_outputs():
+    assert compile_decoder(())('0x') == []
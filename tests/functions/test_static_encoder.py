@@ -0,0 +1,89 @@
+import pytest
+
+from rlp.utils import encode_hex
+from eth_abi import abi
+
+from eth_contract import utils
+from eth_contract.functions import Function
+
+
+def generic_call_data(function, args):
+    scrubbed_args = tuple(utils.clean_args(*zip(function.input_types, args)))
+    return encode_hex(
+        function.encoded_abi_signature + abi.encode_abi(function.input_types, scrubbed_args)
+    )
+
+
+def make_function(*types):
+    return Function('doit', [
+        {'type': _type, 'name': 'arg{0}'.format(idx)} for idx, _type in enumerate(types)
+    ])
+
+
+@pytest.mark.parametrize(
+    "_type,value",
+    (
+        ("uint256", 0),
+        ("uint256", 1),
+        ("uint256", 2 ** 256 - 1),
+        ("uint8", 255),
+        ("int256", 0),
+        ("int256", -1),
+        ("int256", 2 ** 255 - 1),
+        ("int256", -2 ** 255),
+        ("int8", -128),
+        ("bool", True),
+        ("bool", False),
+        ("address", "0xd3cda913deb6f67967b99d67acdfa1712c293601"),
+        ("address", "d3cda913deb6f67967b99d67acdfa1712c293601"),
+        ("address", b"0xd3cda913deb6f67967b99d67acdfa1712c293601"),
+        ("bytes32", ""),
+        ("bytes32", "test-key"),
+        ("bytes32", "1" * 32),
+        ("bytes8", b"12345678"),
+    )
+)
+def test_static_encoder_matches_generic_encoder(_type, value):
+    function = make_function(_type, 'uint256')
+    assert function._abi.encoder is not None
+    assert function._abi.encoder.encode_hex((value, 12345)) is not None
+    assert function.get_call_data((value, 12345)) == generic_call_data(function, (value, 12345))
+
+
+@pytest.mark.parametrize(
+    "_type,value",
+    (
+        ("uint256", "12345"),
+        ("uint256", True),
+        ("uint8", 256),
+        ("uint256", -1),
+        ("int8", 128),
+        ("bool", 1),
+        ("address", 12345),
+        ("address", "0xd3cda913deb6f67967b99d67acdfa1712c2936"),
+        ("bytes8", "123456789"),
+    )
+)
+def test_static_encoder_defers_to_generic_encoder(_type, value):
+    function = make_function(_type)
+    assert function._abi.encoder.encode((value,)) is None
+
+
+@pytest.mark.parametrize(
+    "types",
+    (
+        ("bytes",),
+        ("string",),
+        ("uint256[]",),
+        ("uint256[2]",),
+        ("address", "bytes"),
+    )
+)
+def test_dynamic_types_have_no_static_encoder(types):
+    assert make_function(*types)._abi.encoder is None
+
+
+def test_static_encoder_checks_argument_count():
+    function = make_function('uint256', 'uint256')
+    with pytest.raises(ValueError):
+        function.get_call_data((1,))
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+
+from eth_contract.utils import LazyModule
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFERRED_MODULES = ('eth_abi', 'rlp', 'sha3', 'pkg_resources')
+
+
+def run_python(*args):
+    output = subprocess.check_output(
+        (sys.executable,) + args,
+        cwd=ROOT_DIR,
+        stderr=subprocess.STDOUT,
+    )
+    return output.decode('utf-8')
+
+
+def test_import_does_not_load_deferred_modules():
+    output = run_python('-c', (
+        "import sys, eth_contract\n"
+        "print(','.join(m for m in {0!r} if m in sys.modules))"
+    ).format(DEFERRED_MODULES))
+    assert output.strip() == ''
+
+
+def test_importing_every_module_does_not_load_deferred_modules():
+    output = run_python('-c', (
+        "import importlib, pkgutil, sys, eth_contract\n"
+        "names = [name for _, name, _ in pkgutil.iter_modules(eth_contract.__path__)\n"
+        "         if name != 'aio' or sys.version_info >= (3, 5)]\n"
+        "for name in names:\n"
+        "    importlib.import_module('eth_contract.' + name)\n"
+        "print(len(names))\n"
+        "print(','.join(m for m in {0!r} if m in sys.modules))"
+    ).format(DEFERRED_MODULES))
+    num_modules, loaded = output.splitlines()
+    assert int(num_modules) > 10
+    assert loaded == ''
+
+
+def test_deferred_modules_are_loaded_on_first_use():
+    output = run_python('-c', (
+        "import sys\n"
+        "from eth_contract import utils\n"
+        "utils.sha3(b'')\n"
+        "print('sha3' in sys.modules)"
+    ))
+    assert output.strip() == 'True'
+
+
+def test_lazy_module():
+    lazy_json = LazyModule('json')
+    assert 'loads' not in lazy_json.__dict__
+    assert lazy_json.loads('[1]') == [1]
+    assert 'loads' in lazy_json.__dict__
+    assert repr(lazy_json) == "<LazyModule 'json'>"